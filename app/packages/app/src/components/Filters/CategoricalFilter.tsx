@@ -24,7 +24,7 @@ import { PopoutSectionTitle, TabOption } from "../utils";
 import { LIST_LIMIT } from "./StringFieldFilter.state";
 import { ItemAction } from "../Actions/ItemAction";
 import socket from "../../shared/connection";
-import { packageMessage } from "../../utils/socket";
+import { packageMessage, parseMessage } from "../../utils/socket";
 import { useTheme } from "../../utils/hooks";
 import { Value } from "./types";
 import { subCountValueAtom } from "./atoms";
@@ -340,7 +340,7 @@ const useSearch = () => {
 
       const clear = setTimeout(() => setSearchResults(null), 200);
       const wrap = (handler) => ({ data }) => {
-        data = JSON.parse(data);
+        data = parseMessage(data);
         data.uuid === id && handler(data);
       };
       const sorting = await snapshot.getPromise(atoms.sortFilterResults(modal));
@@ -27,7 +27,12 @@ import { activeFields } from "./Filters/utils";
 import { labelFilters } from "./Filters/LabelFieldFilters.state";
 import * as atoms from "../recoil/atoms";
 import * as selectors from "../recoil/selectors";
-import { getSampleSrc, lookerType, useClearModal } from "../recoil/utils";
+import {
+  getSampleSrc,
+  getThumbnailSrc,
+  lookerType,
+  useClearModal,
+} from "../recoil/utils";
 import { getMimeType } from "../utils/generic";
 import { filterView } from "../utils/view";
 import { packageMessage } from "../utils/socket";
@@ -53,6 +58,7 @@ const createLookerCache = () => {
 
 export let samples = new Map<string, atoms.SampleData>();
 export let sampleIndices = new Map<number, string>();
+let pageCursors = new Map<number, string>();
 let nextIndex = 0;
 let lookers = createLookerCache();
 
@@ -285,7 +291,10 @@ export default React.memo(() => {
     return new constructor(
       sample,
       {
-        src: getSampleSrc(sample.filepath, sample._id),
+        src:
+          constructor === ImageLooker
+            ? getThumbnailSrc(sample.filepath, sample._id)
+            : getSampleSrc(sample.filepath, sample._id),
         thumbnail: true,
         dimensions,
         sampleId: sample._id,
@@ -350,6 +359,7 @@ export default React.memo(() => {
     samples = new Map();
     lookers.reset();
     sampleIndices = new Map();
+    pageCursors = new Map();
     nextIndex = 0;
     flashlight.current.reset();
   }, [
@@ -388,9 +398,12 @@ export default React.memo(() => {
           lookers.has(id) && lookers.get(id).resize(dimensions);
         },
         get: async (page) => {
-          const { results, more } = await fetch(
-            `${url}page=${page}`
+          const cursor = pageCursors.get(page);
+          const { results, more, cursor: nextCursor } = await fetch(
+            `${url}page=${page}` +
+              (cursor ? `&cursor=${encodeURIComponent(cursor)}` : "")
           ).then((response) => response.json());
+          more && nextCursor && pageCursors.set(more, nextCursor);
           const itemData = results.map((result) => {
             const data: atoms.SampleData = {
               sample: result.sample,
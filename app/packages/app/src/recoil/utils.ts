@@ -12,6 +12,16 @@ export const getSampleSrc = (filepath: string, id: string) => {
   return `${http}/filepath/${encodeURI(filepath)}?id=${id}`;
 };
 
+export const THUMBNAIL_SIZE = 512;
+
+export const getThumbnailSrc = (
+  filepath: string,
+  id: string,
+  size: number = THUMBNAIL_SIZE
+) => {
+  return `${http}/thumbnail/${encodeURI(filepath)}?id=${id}&size=${size}`;
+};
+
 export const lookerType = selector<(mimetype: string) => LookerTypes>({
   key: "lookerType",
   get: ({ get }) => {
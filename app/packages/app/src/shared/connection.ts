@@ -120,6 +120,16 @@ export const appContext = isElectron()
   ? "notebook"
   : "browser";
 
-export default isColab
-  ? new HTTPSSocket(`${http}/polling?sessionId=${sessionId}`)
-  : new ReconnectingWebSocket(ws);
+const createSocket = () => {
+  if (isColab) {
+    return new HTTPSSocket(`${http}/polling?sessionId=${sessionId}`);
+  }
+
+  // negotiate binary (BSON) messages so that sample payloads, e.g. masks, are
+  // received as raw bytes
+  const socket = new ReconnectingWebSocket(`${ws}?binary=true`);
+  socket.binaryType = "arraybuffer";
+  return socket;
+};
+
+export default createSocket();
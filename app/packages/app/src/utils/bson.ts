@@ -0,0 +1,115 @@
+/**
+ * Copyright 2017-2021, Voxel51, Inc.
+ */
+
+/**
+ * A minimal BSON decoder for the binary messages sent by the server.
+ *
+ * Values are decoded to match the JSON messages sent to non-binary clients:
+ * ObjectIds become hex strings and datetimes become `{ $date }` objects.
+ * Binary values, e.g. segmentation masks, are returned as `Uint8Array`s that
+ * share the message's buffer, so no copies or base64 decoding are required.
+ */
+
+const decoder = new TextDecoder("utf-8");
+
+const readCString = (bytes: Uint8Array, start: number): [string, number] => {
+  let end = start;
+  while (bytes[end] !== 0) {
+    end++;
+  }
+  return [decoder.decode(bytes.subarray(start, end)), end + 1];
+};
+
+const toHex = (bytes: Uint8Array): string => {
+  let hex = "";
+  for (let i = 0; i < bytes.length; i++) {
+    hex += bytes[i].toString(16).padStart(2, "0");
+  }
+  return hex;
+};
+
+const readDocument = (
+  bytes: Uint8Array,
+  view: DataView,
+  start: number,
+  isArray: boolean
+): object => {
+  const size = view.getInt32(start, true);
+  const end = start + size - 1;
+  const result = isArray ? [] : {};
+  let index = start + 4;
+
+  while (index < end) {
+    const type = bytes[index];
+    let key: string;
+    [key, index] = readCString(bytes, index + 1);
+
+    let value;
+    switch (type) {
+      case 0x01:
+        value = view.getFloat64(index, true);
+        index += 8;
+        break;
+      case 0x02: {
+        const length = view.getInt32(index, true);
+        value = decoder.decode(
+          bytes.subarray(index + 4, index + 4 + length - 1)
+        );
+        index += 4 + length;
+        break;
+      }
+      case 0x03:
+      case 0x04:
+        value = readDocument(bytes, view, index, type === 0x04);
+        index += view.getInt32(index, true);
+        break;
+      case 0x05: {
+        const length = view.getInt32(index, true);
+        value = bytes.subarray(index + 5, index + 5 + length);
+        index += 5 + length;
+        break;
+      }
+      case 0x07:
+        value = toHex(bytes.subarray(index, index + 12));
+        index += 12;
+        break;
+      case 0x08:
+        value = bytes[index] === 1;
+        index += 1;
+        break;
+      case 0x09:
+        value = { $date: Number(view.getBigInt64(index, true)) };
+        index += 8;
+        break;
+      case 0x0a:
+        value = null;
+        break;
+      case 0x10:
+        value = view.getInt32(index, true);
+        index += 4;
+        break;
+      case 0x11:
+      case 0x12:
+        value = Number(view.getBigInt64(index, true));
+        index += 8;
+        break;
+      default:
+        throw new Error(`Unsupported BSON type: ${type}`);
+    }
+
+    if (isArray) {
+      (result as any[]).push(value);
+    } else {
+      result[key] = value;
+    }
+  }
+
+  return result;
+};
+
+export const decode = (buffer: ArrayBuffer): object => {
+  const bytes = new Uint8Array(buffer);
+  const view = new DataView(buffer);
+  return readDocument(bytes, view, 0, false);
+};
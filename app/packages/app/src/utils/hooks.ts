@@ -9,7 +9,7 @@ import * as atoms from "../recoil/atoms";
 import * as selectors from "../recoil/selectors";
 import { ColorTheme } from "../shared/colors";
 import socket, { appContext, handleId, isColab } from "../shared/connection";
-import { packageMessage } from "./socket";
+import { packageMessage, parseMessage } from "./socket";
 import gaConfig from "../constants/ga";
 
 export const useEventHandler = (target, eventType, handler) => {
@@ -34,7 +34,7 @@ export const useEventHandler = (target, eventType, handler) => {
 export const useMessageHandler = (type, handler) => {
   const wrapper = useCallback(
     ({ data }) => {
-      data = JSON.parse(data);
+      data = parseMessage(data);
       data.type === type && handler(data);
     },
     [type, handler]
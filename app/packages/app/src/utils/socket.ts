@@ -1,8 +1,16 @@
 import socket from "../shared/connection";
+import { decode } from "./bson";
+
+/**
+ * Parses a message received from the server, which is either a JSON string or,
+ * for binary clients, a BSON encoded `ArrayBuffer`
+ */
+export const parseMessage = (data: string | ArrayBuffer) =>
+  typeof data === "string" ? JSON.parse(data) : decode(data);
 
 export const attachDisposableHandler = (type, handler) => {
   const wrapper = ({ data }) => {
-    data = JSON.parse(data);
+    data = parseMessage(data);
     if (data.type === type) {
       handler(data);
       socket.removeEventListener("message", wrapper);
@@ -19,7 +27,7 @@ export const packageMessage = (type, data) => {
 };
 
 const requestWrapper = (type, handler) => ({ data }) => {
-  data = JSON.parse(data);
+  data = parseMessage(data);
   data.type === type && handler(data);
 };
 
@@ -153,8 +153,9 @@ function parse(array: Uint8Array): NumpyResult {
 }
 
 /**
- * Deserializes and parses a saved numpy array
+ * Deserializes and parses a saved numpy array, provided either as a base64
+ * string or as raw bytes
  */
-function deserialize(str: string): NumpyResult {
-  return parse(pako.inflate(atob(str)));
+function deserialize(data: string | Uint8Array): NumpyResult {
+  return parse(pako.inflate(typeof data === "string" ? atob(data) : data));
 }
@@ -6,23 +6,26 @@ import { CHUNK_SIZE, LABELS, LABEL_LISTS } from "./constants";
 import { deserialize } from "./numpy";
 import { FrameChunk } from "./state";
 
+const isSerialized = (mask) =>
+  typeof mask === "string" || mask instanceof Uint8Array;
+
 const DESERIALIZE = {
   Detection: (label, buffers) => {
-    if (typeof label.mask === "string") {
+    if (isSerialized(label.mask)) {
       label.mask = deserialize(label.mask);
       buffers.push(label.mask.buffer);
     }
   },
   Detections: (labels, buffers) => {
     labels.detections.forEach((label) => {
-      if (typeof label.mask === "string") {
+      if (isSerialized(label.mask)) {
         label.mask = deserialize(label.mask);
         buffers.push(label.mask.buffer);
       }
     });
   },
   Segmentation: (label, buffers) => {
-    if (typeof label.mask === "string") {
+    if (isSerialized(label.mask)) {
       label.mask = deserialize(label.mask);
       buffers.push(label.mask.buffer);
     }
@@ -62,6 +62,10 @@ DEFAULT_APP_COLOR_POOL = {
     "#cc33cc",
     "#777799",
 }
+DEFAULT_APP_THUMBNAIL_CACHE_DIR = os.path.join(
+    FIFTYONE_CONFIG_DIR, "var", "thumbnails"
+)
+DEFAULT_APP_THUMBNAIL_CACHE_SIZE = 1024 ** 3  # bytes
 
 # MongoDB setup
 try:
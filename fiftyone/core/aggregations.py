@@ -70,6 +70,16 @@ class Aggregation(object):
         """
         return False
 
+    @property
+    def _is_streaming(self):
+        """Whether the aggregation has big results that should be streamed
+        from the database rather than loaded into memory.
+
+        When this property is ``True``, :meth:`parse_result` is passed the
+        database cursor directly and may return a generator.
+        """
+        return False
+
     @property
     def _is_big_batchable(self):
         """Whether the aggregation has big results and its pipeline is defined
@@ -140,6 +150,30 @@ class Aggregation(object):
 
         return False
 
+    def _to_frames_mongo(self, sample_collection, **kwargs):
+        """Returns the MongoDB aggregation pipeline for this aggregation that
+        operates directly on the unwound frame documents of the collection, if
+        possible.
+
+        Only aggregations whose results do not depend on the order of the
+        frames can be computed in this way.
+
+        Args:
+            sample_collection: the
+                :class:`fiftyone.core.collections.SampleCollection` to which
+                the aggregation is being applied
+            **kwargs: optional keyword arguments for :meth:`to_mongo`
+
+        Returns:
+            a MongoDB aggregation pipeline (list of dicts), or None if the
+            aggregation cannot be computed directly on frame documents
+        """
+        if not self._needs_frames(sample_collection):
+            return None
+
+        pipeline = self.to_mongo(sample_collection, **kwargs)
+        return _to_frames_pipeline(pipeline)
+
 
 class AggregationError(Exception):
     """An error raised during the execution of an :class:`Aggregation`."""
@@ -644,8 +678,24 @@ class Distinct(Aggregation):
             `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
             to apply to ``field_or_expr`` (which must be a field) before
             aggregating
+        stream (False): whether to return a generator that streams the
+            distinct values from the database rather than a list. This is
+            useful when there are too many distinct values to fit in a single
+            result document
     """
 
+    def __init__(self, field_or_expr, expr=None, stream=False):
+        super().__init__(field_or_expr, expr=expr)
+        self._stream = stream
+
+    @property
+    def _has_big_result(self):
+        return self._stream
+
+    @property
+    def _is_streaming(self):
+        return self._stream
+
     def default_result(self):
         """Returns the default result for this aggregation.
 
@@ -658,14 +708,19 @@ class Distinct(Aggregation):
         """Parses the output of :meth:`to_mongo`.
 
         Args:
-            d: the result dict
+            d: the result dict, or, when ``stream`` is True, an iterable of
+                result dicts
 
         Returns:
-            a sorted list of distinct values
+            a sorted list of distinct values, or, when ``stream`` is True, a
+            generator that emits them
         """
+        if self._stream:
+            return (di["_id"] for di in d)
+
         return d["values"]
 
-    def to_mongo(self, sample_collection):
+    def to_mongo(self, sample_collection, big_field="values"):
         path, pipeline, _, id_to_str = _parse_field_and_expr(
             sample_collection, self._field_name, expr=self._expr
         )
@@ -675,13 +730,22 @@ class Distinct(Aggregation):
         else:
             value = "$" + path
 
-        pipeline += [
-            {"$match": {"$expr": {"$gt": ["$" + path, None]}}},
-            {"$group": {"_id": None, "values": {"$addToSet": value}}},
-            {"$unwind": "$values"},
-            {"$sort": {"values": 1}},
-            {"$group": {"_id": None, "values": {"$push": "$values"}}},
-        ]
+        pipeline.append({"$match": {"$expr": {"$gt": ["$" + path, None]}}})
+
+        if self._stream:
+            # Emit one document per distinct value so that the results are not
+            # subject to the maximum document size
+            pipeline += [
+                {"$group": {"_id": value}},
+                {"$sort": {"_id": 1}},
+            ]
+        else:
+            pipeline += [
+                {"$group": {"_id": None, "values": {"$addToSet": value}}},
+                {"$unwind": "$values"},
+                {"$sort": {"values": 1}},
+                {"$group": {"_id": None, "values": {"$push": "$values"}}},
+            ]
 
         return pipeline
 
@@ -1359,6 +1423,8 @@ class Values(Aggregation):
             fields
         unwind (False): whether to automatically unwind all recognized list
             fields
+        stream (False): whether to return a generator that streams the values
+            from the database rather than a list
     """
 
     def __init__(
@@ -1367,14 +1433,19 @@ class Values(Aggregation):
         expr=None,
         missing_value=None,
         unwind=False,
+        stream=False,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
     ):
         super().__init__(field_or_expr, expr=expr)
 
+        if stream:
+            _big_result = True
+
         self._missing_value = missing_value
         self._unwind = unwind
+        self._stream = stream
         self._allow_missing = _allow_missing
         self._big_result = _big_result
         self._big_field = None
@@ -1386,10 +1457,20 @@ class Values(Aggregation):
     def _has_big_result(self):
         return self._big_result
 
+    @property
+    def _is_streaming(self):
+        return self._stream
+
+    def _to_frames_mongo(self, sample_collection, **kwargs):
+        # Values are returned in frame order, so we must always go through the
+        # sample collection
+        return None
+
     @property
     def _is_big_batchable(self):
         return (
             self._big_result
+            and not self._stream
             and not self._unwind
             and self._expr is None
             and self._field_name is not None
@@ -1408,11 +1489,16 @@ class Values(Aggregation):
         """Parses the output of :meth:`to_mongo`.
 
         Args:
-            d: the result dict
+            d: the result dict, or, when the aggregation has big results, the
+                iterable of result dicts
 
         Returns:
-            the list of field values
+            the list of field values, or, when ``stream`` is True, a generator
+            that emits them
         """
+        if self._stream:
+            return self._stream_values(d)
+
         if self._big_result:
             values = [di[self._big_field] for di in d]
         else:
@@ -1427,6 +1513,18 @@ class Values(Aggregation):
 
         return values
 
+    def _stream_values(self, d):
+        big_field = self._big_field
+
+        if self._raw or self._parse_fcn is None:
+            for di in d:
+                yield di[big_field]
+        else:
+            parse_fcn = self._parse_fcn
+            level = self._num_list_fields
+            for di in d:
+                yield _transform_values(di[big_field], parse_fcn, level=level)
+
     def to_mongo(self, sample_collection, big_field="values"):
         path, pipeline, list_fields, id_to_str = _parse_field_and_expr(
             sample_collection,
@@ -1613,6 +1711,29 @@ def _parse_field_and_expr(
     return path, pipeline, other_list_fields, id_to_str
 
 
+def _to_frames_pipeline(pipeline):
+    # Pipelines generated by `_parse_field_and_expr()` for frame fields begin
+    # by unwinding the frames of each sample. The remainder of such pipelines
+    # can be applied directly to frame documents
+    if len(pipeline) < 3:
+        return None
+
+    project, unwind, replace_root = pipeline[:3]
+
+    if unwind != {"$unwind": "$frames"} or replace_root != {
+        "$replaceRoot": {"newRoot": "$frames"}
+    }:
+        return None
+
+    paths = list(project.get("$project", {}).keys())
+    if len(paths) != 1 or not paths[0].startswith("frames."):
+        return None
+
+    path = paths[0][len("frames.") :]
+
+    return [{"$project": {path: True}}] + pipeline[3:]
+
+
 def _extract_prefix_from_expr(expr):
     prefixes = []
     _find_prefixes(expr, prefixes)
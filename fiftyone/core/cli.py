@@ -28,6 +28,7 @@ import fiftyone.core.dataset as fod
 import fiftyone.core.session as fos
 import fiftyone.core.utils as fou
 import fiftyone.migrations as fom
+import fiftyone.server.thumbnails as fost
 import fiftyone.utils.data as foud
 import fiftyone.utils.image as foui
 import fiftyone.utils.quickstart as fouq
@@ -893,6 +894,7 @@ class AppCommand(Command):
         _register_command(subparsers, "launch", AppLaunchCommand)
         _register_command(subparsers, "view", AppViewCommand)
         _register_command(subparsers, "connect", AppConnectCommand)
+        _register_command(subparsers, "thumbnails", AppThumbnailsCommand)
 
     @staticmethod
     def execute(parser, args):
@@ -1363,6 +1365,69 @@ class AppConnectCommand(Command):
         _wait()
 
 
+class AppThumbnailsCommand(Command):
+    """Tools for working with the App's thumbnail cache.
+
+    Examples::
+
+        # Pre-generate the thumbnails that the App's grid uses for a dataset
+        fiftyone app thumbnails <dataset-name>
+
+        # Pre-generate thumbnails of the specified sizes
+        fiftyone app thumbnails <dataset-name> --sizes 256 512
+
+        # Delete all cached thumbnails
+        fiftyone app thumbnails --clear
+    """
+
+    @staticmethod
+    def setup(parser):
+        parser.add_argument(
+            "name",
+            metavar="DATASET_NAME",
+            nargs="?",
+            help="the name of the dataset",
+        )
+        parser.add_argument(
+            "-s",
+            "--sizes",
+            metavar="SIZES",
+            nargs="+",
+            type=int,
+            default=None,
+            help="the thumbnail sizes to generate, in pixels",
+        )
+        parser.add_argument(
+            "-n",
+            "--num-workers",
+            metavar="NUM_WORKERS",
+            default=None,
+            type=int,
+            help="the number of worker threads to use",
+        )
+        parser.add_argument(
+            "-c",
+            "--clear",
+            action="store_true",
+            help="delete all cached thumbnails",
+        )
+
+    @staticmethod
+    def execute(parser, args):
+        if args.clear:
+            fost.get_thumbnail_cache().clear()
+            print(
+                "Thumbnail cache '%s' cleared"
+                % fo.app_config.thumbnail_cache_dir
+            )
+
+        if args.name:
+            dataset = fod.load_dataset(args.name)
+            fost.warm_thumbnail_cache(
+                dataset, sizes=args.sizes, num_workers=args.num_workers
+            )
+
+
 class ZooCommand(Command):
     """Tools for working with the FiftyOne Zoo."""
 
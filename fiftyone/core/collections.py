@@ -6,17 +6,21 @@ Interface for sample collections.
 |
 """
 from collections import defaultdict
+import contextlib
 import fnmatch
 import itertools
 import logging
 import os
 import random
 import string
+import time
 import warnings
 
 from bson import ObjectId
 from deprecated import deprecated
+import numpy as np
 from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -24,6 +28,7 @@ import eta.core.utils as etau
 import fiftyone.core.aggregations as foa
 import fiftyone.core.annotation as foan
 import fiftyone.core.brain as fob
+import fiftyone.core.embeddings as foem
 import fiftyone.core.expressions as foe
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.evaluation as foev
@@ -38,6 +43,7 @@ import fiftyone.core.sample as fosa
 import fiftyone.core.stages as fos
 import fiftyone.core.utils as fou
 
+fosum = fou.lazy_import("fiftyone.core.summary")
 fov = fou.lazy_import("fiftyone.core.view")
 foua = fou.lazy_import("fiftyone.utils.annotations")
 foud = fou.lazy_import("fiftyone.utils.data")
@@ -46,6 +52,14 @@ foue = fou.lazy_import("fiftyone.utils.eval")
 
 logger = logging.getLogger(__name__)
 
+# The number of values above which `set_values()` writes values via a
+# temporary collection rather than individual update operations
+_SET_VALUES_MERGE_THRESHOLD = 100000
+
+# MongoDB error codes raised when an aggregation result exceeds the maximum
+# BSON document size (16MB)
+_RESULT_TOO_LARGE_CODES = {10334, 16389, 4031700}
+
 
 def _make_registrar():
     registry = {}
@@ -340,12 +354,25 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement view()")
 
-    def iter_samples(self, progress=False):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        batch_latency=None,
+    ):
         """Returns an iterator over the samples in the collection.
 
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
+            autosave (False): whether to automatically save changes to samples
+                emitted by this iterator. The changes are saved in batches via
+                bulk database writes; see :meth:`save_context`
+            batch_size (None): the maximum number of samples to save per batch
+                when ``autosave`` is True
+            batch_latency (None): the maximum number of seconds between batch
+                saves when ``autosave`` is True
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` or
@@ -353,6 +380,65 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement iter_samples()")
 
+    def save_context(self, batch_size=None, batch_latency=None):
+        """Returns a context that can be used to save samples from this
+        collection in batches via bulk database writes.
+
+        This is useful when modifying many samples in a loop, as it avoids
+        performing a separate database write for each sample.
+
+        Examples::
+
+            import random as r
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            with dataset.save_context() as context:
+                for sample in dataset:
+                    sample["random"] = r.random()
+                    context.save(sample)
+
+            # Equivalently
+            for sample in dataset.iter_samples(autosave=True):
+                sample["random"] = r.random()
+
+        Args:
+            batch_size (None): the maximum number of samples to save per batch
+            batch_latency (None): the maximum number of seconds between batch
+                saves. If neither ``batch_size`` nor ``batch_latency`` is
+                provided, a latency of 0.2 seconds is used
+
+        Returns:
+            a :class:`SaveContext`
+        """
+        return SaveContext(
+            self, batch_size=batch_size, batch_latency=batch_latency
+        )
+
+    def _iter_samples_with_context(
+        self, samples, progress, autosave, batch_size, batch_latency
+    ):
+        with contextlib.ExitStack() as exit_context:
+            if progress:
+                pb = fou.ProgressBar(total=len(self))
+                exit_context.enter_context(pb)
+                samples = pb(samples)
+
+            if autosave:
+                save_context = self.save_context(
+                    batch_size=batch_size, batch_latency=batch_latency
+                )
+                exit_context.enter_context(save_context)
+
+            for sample in samples:
+                yield sample
+
+                if autosave:
+                    save_context.save(sample)
+
     def _get_default_sample_fields(
         self, include_private=False, use_db_fields=False
     ):
@@ -884,22 +970,49 @@ class SampleCollection(object):
 
             print(dataset.count_label_tags())
 
+            #
+            # Set values by sample ID
+            #
+
+            values = {_id: len(_id) for _id in dataset.values("id")}
+            dataset.set_values("id_length", values)
+
+            print(dataset.bounds("id_length"))
+
         Args:
             field_name: a field or ``embedded.field.name``
             values: an iterable of values, one for each sample in the
-                collection. When setting frame fields, each element should be
-                an iterable of values, one for each frame of the sample. If
-                ``field_name`` contains array fields, the corresponding entries
-                of ``values`` must be arrays of the same lengths
+                collection, or a dict mapping sample IDs to values. When
+                setting frame fields, each element should be an iterable of
+                values, one for each frame of the sample. If ``field_name``
+                contains array fields, the corresponding entries of ``values``
+                must be arrays of the same lengths. Numpy arrays are also
+                supported. When a dict is provided, any IDs that are not in
+                the collection are ignored
             skip_none (False): whether to treat None data in ``values`` as
                 missing data that should not be set
             expand_schema (True): whether to dynamically add new sample/frame
                 fields encountered to the dataset schema. If False, an error is
                 raised if the root ``field_name`` does not exist
         """
+        if isinstance(values, dict):
+            sample_ids = list(values.keys())
+            values = [_to_python_value(v) for v in values.values()]
+        else:
+            sample_ids = None
+            if isinstance(values, np.ndarray):
+                # The rows of multidimensional arrays are kept as arrays so
+                # that they are stored in vector fields
+                if values.ndim == 1:
+                    values = values.tolist()
+                else:
+                    values = list(values)
+
         if expand_schema:
             self._expand_schema_from_values(field_name, values)
 
+        _field_name = field_name
+
         (
             field_name,
             is_frame_field,
@@ -910,6 +1023,30 @@ class SampleCollection(object):
             field_name, omit_terminal_lists=True, allow_missing=_allow_missing
         )
 
+        if sample_ids is not None and (
+            is_frame_field or list_fields or isinstance(self, fov.DatasetView)
+        ):
+            # Values must be aligned with the contents of the collection
+            view = self.select(sample_ids, ordered=True)
+            view_ids = set(view.values("id"))
+            values = [
+                value
+                for _id, value in zip(sample_ids, values)
+                if _id in view_ids
+            ]
+
+            return view.set_values(
+                _field_name,
+                values,
+                skip_none=skip_none,
+                expand_schema=False,
+                _allow_missing=_allow_missing,
+            )
+
+        if sample_ids is not None:
+            # Sample IDs were provided, so they needn't be retrieved
+            sample_ids = [ObjectId(_id) for _id in sample_ids]
+
         to_mongo = None
         if id_to_str:
             to_mongo = lambda _id: ObjectId(_id)
@@ -979,6 +1116,7 @@ class SampleCollection(object):
                 list_fields,
                 to_mongo=to_mongo,
                 skip_none=skip_none,
+                sample_ids=sample_ids,
             )
 
     def _expand_schema_from_values(self, field_name, values):
@@ -1045,14 +1183,21 @@ class SampleCollection(object):
             self._dataset._add_implied_sample_field(field_name, value)
 
     def _set_sample_values(
-        self, field_name, values, list_fields, to_mongo=None, skip_none=False
+        self,
+        field_name,
+        values,
+        list_fields,
+        to_mongo=None,
+        skip_none=False,
+        sample_ids=None,
     ):
         if len(list_fields) > 1:
             raise ValueError(
                 "At most one array field can be unwound when setting values"
             )
 
-        sample_ids = self.values("_id")
+        if sample_ids is None:
+            sample_ids = self.values("_id")
 
         if list_fields:
             list_field = list_fields[0]
@@ -1123,15 +1268,21 @@ class SampleCollection(object):
         skip_none=False,
         frames=False,
     ):
-        ops = []
-        for _id, value in zip(ids, values):
-            if value is None and skip_none:
-                continue
+        if to_mongo is not None:
+            values = (to_mongo(v) if v is not None else v for v in values)
+
+        if skip_none:
+            ids, values = _filter_none_values(ids, values)
 
-            if to_mongo is not None:
-                value = to_mongo(value)
+        if len(ids) >= _SET_VALUES_MERGE_THRESHOLD:
+            # Large updates are performed server-side
+            self._dataset._merge_values(field_name, ids, values, frames=frames)
+            return
 
-            ops.append(UpdateOne({"_id": _id}, {"$set": {field_name: value}}))
+        ops = (
+            UpdateOne({"_id": _id}, {"$set": {field_name: value}})
+            for _id, value in zip(ids, values)
+        )
 
         self._dataset._bulk_write(ops, frames=frames)
 
@@ -1230,8 +1381,8 @@ class SampleCollection(object):
 
         Args:
             overwrite (False): whether to overwrite existing metadata
-            num_workers (None): the number of processes to use. By default,
-                ``multiprocessing.cpu_count()`` is used
+            num_workers (None): the number of worker threads to use. By
+                default, ``multiprocessing.cpu_count()`` is used
             skip_failures (True): whether to gracefully continue without
                 raising an error if metadata cannot be computed for a sample
         """
@@ -1251,6 +1402,8 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        frame_stride=None,
+        max_fps=None,
         **trainer_kwargs,
     ):
         """Applies the :class:`FiftyOne model <fiftyone.core.models.Model>` or
@@ -1281,13 +1434,24 @@ class SampleCollection(object):
                 has logits, ``model.has_logits == True``
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images. For Torch-based models, this is the number of workers
+                for the :class:`torch:torch.utils.data.DataLoader`; for other
+                models, images are decoded by this many worker threads. When
+                applying image models to the frames of video collections, this
+                is the number of videos to read concurrently. Not applicable
+                to video models
             skip_failures (True): whether to gracefully continue without
                 raising an error if predictions cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
                 instances
+            frame_stride (None): an optional stride at which to sample frames
+                when applying image models to the frames of video collections.
+                For example, ``frame_stride=5`` processes frames 1, 6, 11, ...
+            max_fps (None): an optional maximum frame rate at which to sample
+                frames when applying image models to the frames of video
+                collections. Videos whose frame rate exceeds this value are
+                subsampled accordingly
             **trainer_kwargs: optional keyword arguments used to initialize the
                 :mod:`Trainer <flash:flash.core.trainer>` when using Flash
                 models. These can be used to, for example, configure the number
@@ -1302,6 +1466,8 @@ class SampleCollection(object):
             batch_size=batch_size,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            frame_stride=frame_stride,
+            max_fps=max_fps,
             **trainer_kwargs,
         )
 
@@ -1312,6 +1478,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        embeddings_store=None,
         **trainer_kwargs,
     ):
         """Computes embeddings for the samples in the collection using the
@@ -1334,7 +1501,12 @@ class SampleCollection(object):
         :meth:`fiftyone.core.models.Model.has_embeddings` must return ``True``.
 
         If an ``embeddings_field`` is provided, the embeddings are saved to the
-        samples; otherwise, the embeddings are returned in-memory.
+        samples. If an ``embeddings_store`` is provided, the embeddings are
+        appended to an on-disk
+        :class:`fiftyone.core.embeddings.EmbeddingsStore` with that name,
+        from which they can be loaded via :meth:`load_embeddings` without
+        reading them into memory. Otherwise, the embeddings are returned
+        in-memory.
 
         Args:
             model: a :class:`fiftyone.core.models.Model` or
@@ -1344,13 +1516,19 @@ class SampleCollection(object):
                 "frames." prefix is optional
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images. For Torch-based models, this is the number of workers
+                for the :class:`torch:torch.utils.data.DataLoader`; for other
+                models, images are decoded by this many worker threads. Only
+                applicable when using image models on image collections
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
                 instances
+            embeddings_store (None): the name of an embeddings store to which
+                to append the embeddings. Only applicable when computing one
+                embedding per sample with a
+                :class:`fiftyone.core.models.Model`
             **trainer_kwargs: optional keyword arguments used to initialize the
                 :mod:`Trainer <flash:flash.core.trainer>` when using Flash
                 models. These can be used to, for example, configure the number
@@ -1359,7 +1537,8 @@ class SampleCollection(object):
         Returns:
             one of the following:
 
-            -   ``None``, if an ``embeddings_field`` is provided
+            -   ``None``, if an ``embeddings_field`` or ``embeddings_store`` is
+                provided
             -   a ``num_samples x num_dim`` array of embeddings, when computing
                 embeddings for image/video collections with image/video models,
                 respectively, and no ``embeddings_field`` is provided. If
@@ -1382,6 +1561,7 @@ class SampleCollection(object):
             batch_size=batch_size,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            embeddings_store=embeddings_store,
             **trainer_kwargs,
         )
 
@@ -1443,9 +1623,12 @@ class SampleCollection(object):
 
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images and extracting their patches. For Torch-based models,
+                this is the number of workers for the
+                :class:`torch:torch.utils.data.DataLoader`; for other models,
+                this many worker threads are used. Only applicable to image
+                collections
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a sample
 
@@ -1893,6 +2076,79 @@ class SampleCollection(object):
         """Deletes all brain method runs from this collection."""
         fob.BrainMethod.delete_runs(self)
 
+    def list_embeddings_stores(self):
+        """Returns a list of the names of the embeddings stores of this
+        collection's dataset.
+
+        See :class:`fiftyone.core.embeddings.EmbeddingsStore` for details.
+
+        Returns:
+            a list of embeddings store names
+        """
+        return sorted(self._dataset._doc.embeddings_stores.keys())
+
+    def has_embeddings_store(self, name):
+        """Whether this collection's dataset has an embeddings store with the
+        given name.
+
+        Args:
+            name: the name of an embeddings store
+
+        Returns:
+            True/False
+        """
+        return name in self._dataset._doc.embeddings_stores
+
+    def get_embeddings_store(self, name):
+        """Returns the embeddings store with the given name.
+
+        Args:
+            name: the name of an embeddings store
+
+        Returns:
+            a :class:`fiftyone.core.embeddings.EmbeddingsStore`
+        """
+        if not self.has_embeddings_store(name):
+            raise ValueError(
+                "Dataset '%s' has no embeddings store '%s'"
+                % (self._dataset.name, name)
+            )
+
+        return foem.EmbeddingsStore(self._dataset, name)
+
+    def load_embeddings(self, name):
+        """Loads the embeddings for the samples in this collection from the
+        embeddings store with the given name.
+
+        The embeddings are read via memory maps. If the embeddings of this
+        collection are stored contiguously and in the same order as the
+        samples in this collection, which is the case when they were computed
+        via :meth:`compute_embeddings` on this collection, a zero-copy
+        ``numpy.memmap`` is returned. Otherwise, the embeddings are gathered
+        into an in-memory array.
+
+        Args:
+            name: the name of an embeddings store
+
+        Returns:
+            a ``num_samples x num_dims`` array
+
+        Raises:
+            ValueError: if any samples in this collection have no embeddings
+                in the store
+        """
+        store = self.get_embeddings_store(name)
+        return store.get_embeddings(self.values("id"))
+
+    def delete_embeddings_store(self, name):
+        """Deletes the embeddings store with the given name from this
+        collection's dataset.
+
+        Args:
+            name: the name of an embeddings store
+        """
+        self.get_embeddings_store(name).delete()
+
     def _get_similarity_keys(self, **kwargs):
         from fiftyone.brain import SimilarityConfig
 
@@ -4733,7 +4989,7 @@ class SampleCollection(object):
         return self._make_and_aggregate(make, field_or_expr)
 
     @aggregation
-    def distinct(self, field_or_expr, expr=None):
+    def distinct(self, field_or_expr, expr=None, stream=False):
         """Computes the distinct values of a field in the collection.
 
         ``None``-valued fields are ignored.
@@ -4817,11 +5073,16 @@ class SampleCollection(object):
                 `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
                 to apply to ``field_or_expr`` (which must be a field) before
                 aggregating
+            stream (False): whether to return a generator that streams the
+                distinct values from the database rather than a list
 
         Returns:
-            a sorted list of distinct values
+            a sorted list of distinct values, or a generator that emits them
+            if ``stream`` is True
         """
-        make = lambda field_or_expr: foa.Distinct(field_or_expr, expr=expr)
+        make = lambda field_or_expr: foa.Distinct(
+            field_or_expr, expr=expr, stream=stream
+        )
         return self._make_and_aggregate(make, field_or_expr)
 
     @aggregation
@@ -5184,6 +5445,7 @@ class SampleCollection(object):
         expr=None,
         missing_value=None,
         unwind=False,
+        stream=False,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -5289,15 +5551,20 @@ class SampleCollection(object):
                 ``None``-valued fields
             unwind (False): whether to automatically unwind all recognized list
                 fields
+            stream (False): whether to return a generator that streams the
+                values from the database rather than a list. This is useful
+                when processing the values of very large collections
 
         Returns:
-            the list of values
+            the list of values, or a generator that emits them if ``stream``
+            is True
         """
         make = lambda field_or_expr: foa.Values(
             field_or_expr,
             expr=expr,
             missing_value=missing_value,
             unwind=unwind,
+            stream=stream,
             _allow_missing=_allow_missing,
             _big_result=_big_result,
             _raw=_raw,
@@ -6245,19 +6512,32 @@ class SampleCollection(object):
             pipelines.append(pipeline)
 
         # Build big pipelines
+        stream_aggs = {}
         for idx, aggregation in big_aggs.items():
             pipeline = self._build_big_pipeline(aggregation)
-            idx_map[idx] = len(pipelines)
-            pipelines.append(pipeline)
+            if aggregation._is_streaming:
+                stream_aggs[idx] = pipeline
+            else:
+                idx_map[idx] = len(pipelines)
+                pipelines.append(pipeline)
 
         # Build facet-able pipelines
-        facet_pipelines = self._build_faceted_pipelines(facet_aggs)
-        for idx, pipeline in facet_pipelines.items():
-            idx_map[idx] = len(pipelines)
-            pipelines.append(pipeline)
+        facets = self._build_facets(facet_aggs)
 
         # Run all aggregations
-        _results = foo.aggregate(self._dataset._sample_collection, pipelines)
+        conn = foo.get_db_conn()
+        while True:
+            _pipelines = pipelines + [f[2:] for f in facets]
+            try:
+                _results = _run_aggregations(conn, _pipelines)
+                break
+            except OperationFailure as e:
+                facets = self._split_facets(facets, e)
+
+        # Streaming aggregations return cursors rather than lists
+        for idx, (coll_name, pipeline) in stream_aggs.items():
+            cursor = foo.aggregate(conn[coll_name], pipeline)
+            results[idx] = big_aggs[idx].parse_result(cursor)
 
         # Parse batch results
         if batch_aggs:
@@ -6268,13 +6548,15 @@ class SampleCollection(object):
 
         # Parse big results
         for idx, aggregation in big_aggs.items():
+            if idx in stream_aggs:
+                continue
+
             result = list(_results[idx_map[idx]])
             results[idx] = self._parse_big_result(aggregation, result)
 
         # Parse facet-able results
-        for idx, aggregation in facet_aggs.items():
-            result = list(_results[idx_map[idx]])
-            results[idx] = self._parse_faceted_result(aggregation, result)
+        for facet, _result in zip(facets, _results[len(pipelines) :]):
+            self._parse_facet(facet, list(_result), results)
 
         return results[0] if scalar_result else results
 
@@ -6294,25 +6576,24 @@ class SampleCollection(object):
         # Placeholder to store results
         results = [None] * len(aggregations)
 
-        idx_map = {}
-        pipelines = []
-
         if facet_aggs:
             # Build facet-able pipelines
-            facet_pipelines = self._build_faceted_pipelines(facet_aggs)
-            for idx, pipeline in facet_pipelines.items():
-                idx_map[idx] = len(pipelines)
-                pipelines.append(pipeline)
+            facets = self._build_facets(facet_aggs)
 
             # Run all aggregations
-            coll_name = self._dataset._sample_collection_name
-            collection = foo.get_async_db_conn()[coll_name]
-            _results = await foo.aggregate(collection, pipelines)
+            conn = foo.get_async_db_conn()
+            while True:
+                try:
+                    _results = await _async_run_aggregations(
+                        conn, [f[2:] for f in facets]
+                    )
+                    break
+                except OperationFailure as e:
+                    facets = self._split_facets(facets, e)
 
             # Parse facet-able results
-            for idx, aggregation in facet_aggs.items():
-                result = list(_results[idx_map[idx]])
-                results[idx] = self._parse_faceted_result(aggregation, result)
+            for facet, _result in zip(facets, _results):
+                self._parse_facet(facet, list(_result), results)
 
         return results[0] if scalar_result else results
 
@@ -6354,25 +6635,97 @@ class SampleCollection(object):
                     "$project stage; found %s" % _pipeline
                 )
 
-        return self._pipeline(
+        pipeline = self._pipeline(
             pipeline=[{"$project": project}], attach_frames=attach_frames
         )
 
+        return self._dataset._sample_collection_name, pipeline
+
     def _build_big_pipeline(self, aggregation):
-        return self._pipeline(
+        frames_pipeline = aggregation._to_frames_mongo(
+            self, big_field="values"
+        )
+        if frames_pipeline is not None:
+            return self._unwound_frames_pipeline(frames_pipeline)
+
+        pipeline = self._pipeline(
             pipeline=aggregation.to_mongo(self, big_field="values"),
             attach_frames=aggregation._needs_frames(self),
         )
 
-    def _build_faceted_pipelines(self, aggs_map):
-        pipelines = {}
+        return self._dataset._sample_collection_name, pipeline
+
+    def _build_facets(self, aggs_map):
+        # Aggregations are grouped by whether they operate on samples, on
+        # samples with their frames attached, or directly on frames, so that
+        # each group can be computed in a single pass
+        groups = {}
         for idx, aggregation in aggs_map.items():
-            pipelines[idx] = self._pipeline(
-                pipeline=aggregation.to_mongo(self),
-                attach_frames=aggregation._needs_frames(self),
+            if not aggregation._needs_frames(self):
+                mode = "samples"
+            elif aggregation._to_frames_mongo(self) is not None:
+                mode = "frames"
+            else:
+                mode = "attach_frames"
+
+            groups.setdefault(mode, {})[idx] = aggregation
+
+        return [
+            self._build_facet(_aggs_map, mode)
+            for mode, _aggs_map in groups.items()
+        ]
+
+    def _build_facet(self, aggs_map, mode):
+        if mode == "frames":
+            facet = {
+                str(idx): aggregation._to_frames_mongo(self)
+                for idx, aggregation in aggs_map.items()
+            }
+            coll_name, pipeline = self._unwound_frames_pipeline(
+                [{"$facet": facet}]
+            )
+        else:
+            facet = {
+                str(idx): aggregation.to_mongo(self)
+                for idx, aggregation in aggs_map.items()
+            }
+            coll_name = self._dataset._sample_collection_name
+            pipeline = self._pipeline(
+                pipeline=[{"$facet": facet}],
+                attach_frames=mode == "attach_frames",
             )
 
-        return pipelines
+        return aggs_map, mode, coll_name, pipeline
+
+    def _split_facets(self, facets, error):
+        # If a merged $facet result exceeded the maximum BSON document size,
+        # split the offending groups in half and try again
+        if error.code not in _RESULT_TOO_LARGE_CODES:
+            raise error
+
+        _facets = []
+        for facet in facets:
+            aggs_map, mode = facet[:2]
+            if len(aggs_map) < 2:
+                _facets.append(facet)
+                continue
+
+            items = list(aggs_map.items())
+            mid = len(items) // 2
+            for _items in (items[:mid], items[mid:]):
+                _facets.append(self._build_facet(dict(_items), mode))
+
+        if len(_facets) == len(facets):
+            raise error
+
+        return _facets
+
+    def _parse_facet(self, facet, result, results):
+        aggs_map = facet[0]
+        d = result[0] if result else {}
+        for idx, aggregation in aggs_map.items():
+            _result = d.get(str(idx), [])
+            results[idx] = self._parse_faceted_result(aggregation, _result)
 
     def _parse_big_result(self, aggregation, result):
         if result:
@@ -6410,6 +6763,27 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement _pipeline()")
 
+    def _unwound_frames_pipeline(self, pipeline):
+        """Returns a MongoDB aggregation pipeline that applies the given
+        pipeline to the unwound frame documents of the collection.
+
+        The order in which the frames are processed is not guaranteed.
+
+        Args:
+            pipeline: a MongoDB aggregation pipeline (list of dicts) to apply
+                to the frame documents
+
+        Returns:
+            a tuple of
+
+            -   the name of the database collection on which to run the
+                pipeline
+            -   the aggregation pipeline
+        """
+        raise NotImplementedError(
+            "Subclass must implement _unwound_frames_pipeline()"
+        )
+
     def _aggregate(
         self,
         pipeline=None,
@@ -6769,6 +7143,164 @@ class SampleCollection(object):
         )
 
 
+class SaveContext(object):
+    """Context that saves samples from a collection in batches via bulk
+    database writes.
+
+    Samples registered via :meth:`save` have their pending changes recorded
+    and written to the database in unordered batches whenever the configured
+    ``batch_size`` or ``batch_latency`` is reached, and when the context
+    exits.
+
+    .. note::
+
+        Frame-level changes to video samples are saved immediately when
+        :meth:`save` is called; only the sample-level updates are batched.
+        Samples in patches and frames views are also saved immediately, since
+        their changes must be synced to their source collections.
+
+    Args:
+        sample_collection: a :class:`SampleCollection`
+        batch_size (None): the maximum number of samples to save per batch
+        batch_latency (None): the maximum number of seconds between batch
+            saves. If neither ``batch_size`` nor ``batch_latency`` is
+            provided, a latency of 0.2 seconds is used
+    """
+
+    def __init__(self, sample_collection, batch_size=None, batch_latency=None):
+        if batch_size is None and batch_latency is None:
+            batch_latency = 0.2
+
+        self.sample_collection = sample_collection
+        self.batch_size = batch_size
+        self.batch_latency = batch_latency
+
+        self._dataset = sample_collection._dataset
+        self._save_immediately = (
+            sample_collection._is_patches or sample_collection._is_frames
+        )
+        self._ops = []
+        self._sample_ids = set()
+        self._reload_samples = []
+        self._last_time = time.time()
+
+    def __enter__(self):
+        self._last_time = time.time()
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    def save(self, sample):
+        """Registers the sample for saving in the next batch.
+
+        Args:
+            sample: a :class:`fiftyone.core.sample.Sample` or
+                :class:`fiftyone.core.sample.SampleView`
+        """
+        if sample._dataset is not self._dataset:
+            raise ValueError(
+                "The provided sample does not belong to this collection's "
+                "dataset"
+            )
+
+        if self._save_immediately:
+            sample.save()
+            return
+
+        if sample._id in self._sample_ids:
+            # Unordered batches cannot contain multiple updates to the same
+            # sample, so we must flush first
+            self.flush()
+
+        ops = sample._save(deferred=True)
+
+        if ops:
+            self._ops.extend(ops)
+            self._sample_ids.add(sample._id)
+            if isinstance(sample, fosa.SampleView):
+                self._reload_samples.append(sample)
+
+        if (
+            self.batch_size is not None
+            and len(self._sample_ids) >= self.batch_size
+        ) or (
+            self.batch_latency is not None
+            and time.time() - self._last_time >= self.batch_latency
+        ):
+            self.flush()
+
+    def flush(self):
+        """Writes any pending changes to the database."""
+        if self._ops:
+            foo.bulk_write(
+                self._ops, self._dataset._sample_collection, ordered=False
+            )
+            self._dataset._mark_modified(
+                paths=fosum.get_update_paths(self._ops)
+            )
+
+        for sample in self._reload_samples:
+            sample._reload_parents()
+
+        self._ops = []
+        self._sample_ids = set()
+        self._reload_samples = []
+        self._last_time = time.time()
+
+
+def _run_aggregations(conn, pipelines):
+    # Runs the given `(collection name, pipeline)` tuples, batched by
+    # collection
+    results = [None] * len(pipelines)
+    for coll_name, inds in _group_pipelines(pipelines).items():
+        _pipelines = [pipelines[idx][1] for idx in inds]
+        _results = foo.aggregate(conn[coll_name], _pipelines)
+        for idx, result in zip(inds, _results):
+            results[idx] = result
+
+    return results
+
+
+async def _async_run_aggregations(conn, pipelines):
+    results = [None] * len(pipelines)
+    for coll_name, inds in _group_pipelines(pipelines).items():
+        _pipelines = [pipelines[idx][1] for idx in inds]
+        _results = await foo.aggregate(conn[coll_name], _pipelines)
+        for idx, result in zip(inds, _results):
+            results[idx] = result
+
+    return results
+
+
+def _group_pipelines(pipelines):
+    inds_map = defaultdict(list)
+    for idx, (coll_name, _) in enumerate(pipelines):
+        inds_map[coll_name].append(idx)
+
+    return inds_map
+
+
+def _to_python_value(value):
+    # Arrays are left intact so that they are stored in vector fields, just as
+    # they are when values are provided as a list
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def _filter_none_values(ids, values):
+    _ids = []
+    _values = []
+    for _id, value in zip(ids, values):
+        if value is not None:
+            _ids.append(_id)
+            _values.append(value)
+
+    return _ids, _values
+
+
 def _parse_label_field(
     sample_collection,
     label_field,
@@ -147,6 +147,12 @@ class FiftyOneConfig(EnvConfig):
         self.do_not_track = self.parse_bool(
             d, "do_not_track", env_var="FIFTYONE_DO_NOT_TRACK", default=False,
         )
+        self.max_aggregation_workers = self.parse_int(
+            d,
+            "max_aggregation_workers",
+            env_var="FIFTYONE_MAX_AGGREGATION_WORKERS",
+            default=None,
+        )
         self.requirement_error_level = self.parse_int(
             d,
             "requirement_error_level",
@@ -256,12 +262,30 @@ class AppConfig(EnvConfig):
             env_var="FIFTYONE_APP_SHOW_TOOLTIP",
             default=True,
         )
+        self.thumbnail_cache_dir = self.parse_string(
+            d,
+            "thumbnail_cache_dir",
+            env_var="FIFTYONE_APP_THUMBNAIL_CACHE_DIR",
+            default=foc.DEFAULT_APP_THUMBNAIL_CACHE_DIR,
+        )
+        self.thumbnail_cache_size = self.parse_int(
+            d,
+            "thumbnail_cache_size",
+            env_var="FIFTYONE_APP_THUMBNAIL_CACHE_SIZE",
+            default=foc.DEFAULT_APP_THUMBNAIL_CACHE_SIZE,
+        )
         self.use_frame_number = self.parse_bool(
             d,
             "use_frame_number",
             env_var="FIFTYONE_APP_USE_FRAME_NUMBER",
             default=False,
         )
+        self.write_media_metadata = self.parse_bool(
+            d,
+            "write_media_metadata",
+            env_var="FIFTYONE_APP_WRITE_MEDIA_METADATA",
+            default=False,
+        )
 
         self._validate()
 
@@ -272,6 +296,12 @@ class AppConfig(EnvConfig):
                 % self.default_grid_zoom
             )
 
+        if self.thumbnail_cache_size < 0:
+            raise AppConfigError(
+                "`thumbnail_cache_size` must be nonnegative; found %d"
+                % self.thumbnail_cache_size
+            )
+
 
 class AppConfigError(etac.EnvConfigError):
     """Exception raised when an invalid :class:`AppConfig` instance is
@@ -31,6 +31,7 @@ import fiftyone.core.annotation as foan
 import fiftyone.core.brain as fob
 import fiftyone.constants as focn
 import fiftyone.core.collections as foc
+import fiftyone.core.embeddings as foem
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.frame as fofr
@@ -41,6 +42,7 @@ import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
 import fiftyone.core.stages as fost
 from fiftyone.core.singletons import DatasetSingleton
+import fiftyone.core.summary as fosum
 import fiftyone.core.view as fov
 import fiftyone.core.utils as fou
 
@@ -241,10 +243,21 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._brain_cache = {}
         self._evaluation_cache = {}
 
+        self._data_version = 0
         self._deleted = False
 
     def __len__(self):
-        return self.count()
+        """Returns the number of samples in the dataset.
+
+        The length is read from the metadata of the dataset's collection
+        rather than by counting its samples, so it may be inaccurate after an
+        unclean shutdown of the database. Use :meth:`count` to always compute
+        an exact count.
+
+        Returns:
+            the number of samples
+        """
+        return self._sample_collection.estimated_document_count()
 
     def __getitem__(self, id_filepath_slice):
         if isinstance(id_filepath_slice, numbers.Integral):
@@ -312,6 +325,28 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
     def _is_frames(self):
         return self._sample_collection_name.startswith("frames.")
 
+    def _mark_modified(self, paths=None):
+        # Invalidates any cached state, e.g. view lengths, that depends on the
+        # contents of the dataset's samples or frames. If the modified field
+        # paths are known, only the summary stats that depend on them are
+        # invalidated
+        self._data_version += 1
+
+        if self.has_summary_stats:
+            self._summary_stats.invalidate(paths=paths)
+
+    @property
+    def _schema_version(self):
+        # A hashable key that changes whenever the schema of the dataset's
+        # samples or frames changes
+        return (
+            self.media_type,
+            self._sample_doc_cls,
+            self._sample_doc_cls._schema_version,
+            self._frame_doc_cls,
+            self._frame_doc_cls._schema_version,
+        )
+
     @property
     def media_type(self):
         """The media type of the dataset."""
@@ -619,6 +654,53 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         return stats
 
+    @property
+    def has_summary_stats(self):
+        """Whether this dataset maintains summary stats.
+
+        See :meth:`create_summary_stats` for details.
+        """
+        return self._doc.summary_collection_name is not None
+
+    def create_summary_stats(self):
+        """Creates a materialized summary of the statistics that the App
+        displays for the unfiltered dataset, such as the counts of each
+        field, the label and tag counts of each label field, and the bounds
+        of numeric fields.
+
+        The summary is stored in a collection alongside the dataset and is
+        maintained incrementally as samples are added, edited, and deleted, so
+        that the App can load large datasets without scanning all of their
+        samples. Only the statistics that depend on modified fields are
+        recomputed, and only when they are next requested.
+
+        If the dataset already has summary stats, they are recomputed from
+        scratch.
+        """
+        if not self.has_summary_stats:
+            self._doc.summary_collection_name = (
+                "summary." + self._sample_collection_name
+            )
+            self._doc.save()
+
+        self._summary_stats.build()
+
+    def delete_summary_stats(self):
+        """Deletes the summary stats of the dataset, if any.
+
+        See :meth:`create_summary_stats` for details.
+        """
+        if not self.has_summary_stats:
+            return
+
+        self._summary_stats.delete()
+        self._doc.summary_collection_name = None
+        self._doc.save()
+
+    @property
+    def _summary_stats(self):
+        return fosum.DatasetSummary(self)
+
     def first(self):
         """Returns the first sample in the dataset.
 
@@ -945,6 +1027,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             fos.Sample._reload_docs(self._sample_collection_name)
 
         self._reload()
+        self._mark_modified(
+            paths=fields + new_fields + embedded_fields + embedded_new_fields
+        )
 
     def _rename_frame_fields(self, field_mapping, view=None):
         if self.media_type != fom.VIDEO:
@@ -971,6 +1056,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             fofr.Frame._reload_docs(self._frame_collection_name)
 
         self._reload()
+        self._mark_modified(
+            paths=[
+                self._FRAMES_PREFIX + f
+                for f in fields
+                + new_fields
+                + embedded_fields
+                + embedded_new_fields
+            ]
+        )
 
     def clone_sample_field(self, field_name, new_field_name):
         """Clones the given sample field into a new field of the dataset.
@@ -1142,6 +1236,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             )
 
         fos.Sample._reload_docs(self._sample_collection_name)
+        self._mark_modified(paths=fields + embedded_fields)
 
     def _clear_frame_fields(self, field_names, view=None):
         if self.media_type != fom.VIDEO:
@@ -1159,6 +1254,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             )
 
         fofr.Frame._reload_docs(self._frame_collection_name)
+        self._mark_modified(
+            paths=[self._FRAMES_PREFIX + f for f in fields + embedded_fields]
+        )
 
     def delete_sample_field(self, field_name, error_level=0):
         """Deletes the field from all samples in the dataset.
@@ -1242,6 +1340,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             fos.Sample._reload_docs(self._sample_collection_name)
 
         self._reload()
+        self._mark_modified(paths=fields + embedded_fields)
 
     def _delete_frame_fields(self, field_names, error_level):
         if self.media_type != fom.VIDEO:
@@ -1260,26 +1359,54 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             fofr.Frame._reload_docs(self._frame_collection_name)
 
         self._reload()
+        self._mark_modified(
+            paths=[self._FRAMES_PREFIX + f for f in fields + embedded_fields]
+        )
 
-    def iter_samples(self, progress=False):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        batch_latency=None,
+    ):
         """Returns an iterator over the samples in the dataset.
 
+        Examples::
+
+            import random as r
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            # Save changes to samples in batches as they are made
+            for sample in dataset.iter_samples(progress=True, autosave=True):
+                sample["random"] = r.random()
+
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
+            autosave (False): whether to automatically save changes to samples
+                emitted by this iterator. The changes are saved in batches via
+                bulk database writes; see
+                :meth:`fiftyone.core.collections.SampleCollection.save_context`
+            batch_size (None): the maximum number of samples to save per batch
+                when ``autosave`` is True
+            batch_latency (None): the maximum number of seconds between batch
+                saves when ``autosave`` is True
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` instances
         """
         pipeline = self._pipeline(detach_frames=True)
+        samples = self._iter_samples(pipeline)
 
-        if progress:
-            with fou.ProgressBar(total=len(self)) as pb:
-                for sample in pb(self._iter_samples(pipeline)):
-                    yield sample
-        else:
-            for sample in self._iter_samples(pipeline):
-                yield sample
+        for sample in self._iter_samples_with_context(
+            samples, progress, autosave, batch_size, batch_latency
+        ):
+            yield sample
 
     def _iter_samples(self, pipeline):
         index = 0
@@ -1414,6 +1541,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         dicts = [self._make_dict(sample) for sample in samples]
 
+        if self.has_summary_stats:
+            summary_docs = self._summary_stats.get_mergeable_docs()
+
         try:
             # adds `_id` to each dict
             self._sample_collection.insert_many(dicts)
@@ -1426,9 +1556,20 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             sample._set_backing_doc(doc, dataset=self)
 
             if self.media_type == fom.VIDEO:
-                sample.frames.save()
+                sample.frames._save()
+
+        sample_ids = [str(d["_id"]) for d in dicts]
 
-        return [str(d["_id"]) for d in dicts]
+        # The stats of the new samples are merged into the summary stats,
+        # which also accounts for their frames
+        if self.has_summary_stats:
+            summary = self._summary_stats
+            deltas = summary.compute_deltas(summary_docs, sample_ids)
+            summary.apply_deltas(summary_docs, deltas)
+
+        self._mark_modified(paths=())
+
+        return sample_ids
 
     def _upsert_samples_batch(self, samples, expand_schema, validate):
         if self.media_type is None and samples:
@@ -1461,6 +1602,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             if self.media_type == fom.VIDEO:
                 sample.frames.save()
 
+        self._mark_modified()
+
     def _make_dict(self, sample, include_id=False):
         d = sample.to_mongo_dict(include_id=include_id)
 
@@ -1475,6 +1618,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         else:
             coll = self._sample_collection
 
+        if self.has_summary_stats:
+            ops = list(ops)
+            paths = fosum.get_update_paths(ops, frames=frames)
+        else:
+            paths = None
+
         foo.bulk_write(ops, coll, ordered=ordered)
 
         if frames:
@@ -1482,6 +1631,51 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         else:
             fos.Sample._reload_docs(self._sample_collection_name)
 
+        self._mark_modified(paths=paths)
+
+    def _merge_values(self, field_name, ids, values, frames=False):
+        if frames:
+            coll = self._frame_collection
+        else:
+            coll = self._sample_collection
+
+        # Values are inserted into a temporary collection and then merged
+        # server-side, which is much faster than individual updates
+        conn = foo.get_db_conn()
+        tmp_coll = conn["tmp." + coll.name + "." + str(ObjectId())]
+
+        try:
+            docs = (
+                {"_id": _id, "value": value} for _id, value in zip(ids, values)
+            )
+            foo.insert_documents(docs, tmp_coll)
+
+            tmp_coll.aggregate(
+                [
+                    {
+                        "$merge": {
+                            "into": coll.name,
+                            "on": "_id",
+                            "whenMatched": [
+                                {"$set": {field_name: "$$new.value"}}
+                            ],
+                            "whenNotMatched": "discard",
+                        }
+                    }
+                ]
+            )
+        finally:
+            tmp_coll.drop()
+
+        if frames:
+            fofr.Frame._reload_docs(self._frame_collection_name)
+            path = self._FRAMES_PREFIX + field_name
+        else:
+            fos.Sample._reload_docs(self._sample_collection_name)
+            path = field_name
+
+        self._mark_modified(paths=[path])
+
     def _merge_doc(
         self,
         doc,
@@ -1715,6 +1909,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         sample_ids = _get_sample_ids(samples_or_ids)
         _sample_ids = [ObjectId(_id) for _id in sample_ids]
 
+        # The stats of the deleted samples must be computed before they are
+        # deleted so that they can be removed from the summary stats
+        if self.has_summary_stats:
+            summary = self._summary_stats
+            summary_docs = summary.get_mergeable_docs()
+            deltas = summary.compute_deltas(
+                summary_docs, sample_ids, remove=True
+            )
+
         self._sample_collection.delete_many({"_id": {"$in": _sample_ids}})
 
         fos.Sample._reset_docs(
@@ -1730,6 +1933,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 self._frame_collection_name, sample_ids=sample_ids
             )
 
+        if self.has_summary_stats:
+            summary.apply_deltas(summary_docs, deltas, remove=True)
+
+        self._mark_modified(paths=())
+
     def delete_labels(
         self, labels=None, ids=None, tags=None, view=None, fields=None
     ):
@@ -1874,6 +2082,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             foo.bulk_write(frame_ops, self._frame_collection)
             fofr.Frame._reload_docs(self._frame_collection_name)
 
+        self._mark_modified()
+
     def _delete_labels(self, labels, fields=None):
         if etau.is_str(fields):
             fields = [fields]
@@ -2000,6 +2210,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 self._frame_collection_name, sample_ids=sample_ids
             )
 
+        self._mark_modified()
+
     @deprecated(reason="Use delete_samples() instead")
     def remove_sample(self, sample_or_id):
         """Removes the given sample from the dataset.
@@ -2058,6 +2270,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
     def _save(self, view=None, fields=None):
         if view is not None:
             _save_view(view, fields)
+            self._mark_modified()
 
         self._doc.save()
 
@@ -2097,6 +2310,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._frame_doc_cls.drop_collection()
         fofr.Frame._reset_docs(self._frame_collection_name)
 
+        self._mark_modified()
+
     def delete(self):
         """Deletes the dataset.
 
@@ -3989,6 +4204,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         return _pipeline
 
+    def _unwound_frames_pipeline(self, pipeline):
+        # Frame-level pipelines can be run directly on the frames collection
+        return self._frame_collection_name, pipeline
+
     def _aggregate(
         self,
         pipeline=None,
@@ -4194,6 +4413,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if self.media_type == fom.VIDEO:
             fofr.Frame._reload_docs(self._frame_collection_name, hard=hard)
 
+        # Reloading does not modify the dataset, so its summary stats remain
+        # valid
+        self._mark_modified(paths=())
+
     def _serialize(self):
         return self._doc.to_dict(extended=True)
 
@@ -4369,6 +4592,13 @@ def _delete_dataset_doc(dataset_doc):
         if run_doc.results is not None:
             run_doc.results.delete()
 
+    if dataset_doc.summary_collection_name is not None:
+        conn = foo.get_db_conn()
+        conn.drop_collection(dataset_doc.summary_collection_name)
+
+    if dataset_doc.embeddings_stores:
+        foem.delete_stores(dataset_doc)
+
     dataset_doc.delete()
 
 
@@ -4396,6 +4626,8 @@ def _clone_dataset_or_view(dataset_or_view, name):
     dataset_doc.name = name
     dataset_doc.persistent = False
     dataset_doc.sample_collection_name = sample_collection_name
+    dataset_doc.summary_collection_name = None
+    dataset_doc.embeddings_stores = {}
 
     # Run results get special treatment at the end
     dataset_doc.annotation_runs = {}
@@ -5175,6 +5407,8 @@ def _merge_samples_pipeline(
     if is_video:
         fofr.Frame._reload_docs(dst_dataset._frame_collection_name)
 
+    dst_dataset._mark_modified()
+
 
 def _merge_docs(
     sample_collection,
@@ -13,7 +13,11 @@ import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
 from fiftyone.core.singletons import DocumentSingleton
+import fiftyone.core.utils as fou
+
+fosum = fou.lazy_import("fiftyone.core.summary")
 
 
 class _Document(object):
@@ -401,12 +405,49 @@ class _Document(object):
 
     def save(self):
         """Saves the document to the database."""
+        self._save()
+
+    def _save(self, deferred=False):
+        """Saves the document to the database.
+
+        Args:
+            deferred (False): whether to defer the database updates. If True,
+                the ``pymongo`` operations that must be performed to save the
+                document are returned rather than executed
+
+        Returns:
+            a list of ``pymongo`` operations, which is empty unless
+            ``deferred`` is True
+        """
         if not self._in_db:
             raise ValueError(
                 "Cannot save a document that has not been added to a dataset"
             )
 
-        self._doc.save()
+        ops, paths = self._save_doc(deferred)
+
+        if not deferred:
+            self._dataset._mark_modified(paths=paths)
+
+        return ops
+
+    def _save_doc(self, deferred, **kwargs):
+        # When the dataset has summary stats, the updates are performed here
+        # rather than by the backing document, so that only the stats that
+        # depend on the modified fields are invalidated
+        if deferred or not self._dataset.has_summary_stats:
+            return self._doc._save(deferred=deferred, **kwargs), None
+
+        ops = self._doc._save(deferred=True, **kwargs)
+        if ops:
+            foo.bulk_write(ops, self._doc._get_collection())
+
+        frames = (
+            self._doc._get_collection_name()
+            == self._dataset._frame_collection_name
+        )
+
+        return [], fosum.get_update_paths(ops, frames=frames)
 
     def _parse_fields(self, fields=None, omit_fields=None):
         if fields is None:
@@ -755,8 +796,36 @@ class DocumentView(_Document):
 
     def save(self):
         """Saves the document view to the database."""
-        self._doc.save(filtered_fields=self._filtered_fields)
+        self._save()
+
+    def _save(self, deferred=False):
+        """Saves the document view to the database.
+
+        Args:
+            deferred (False): whether to defer the database updates. If True,
+                the ``pymongo`` operations that must be performed to save the
+                document are returned rather than executed, and the caller is
+                responsible for calling :meth:`_reload_parents` after
+                performing them
+
+        Returns:
+            a list of ``pymongo`` operations, which is empty unless
+            ``deferred`` is True
+        """
+        ops, paths = self._save_doc(
+            deferred, filtered_fields=self._filtered_fields
+        )
 
+        if not deferred:
+            self._reload_parents()
+            self._dataset._mark_modified(paths=paths)
+
+        return ops
+
+    def _reload_parents(self):
+        """Reloads any in-memory source documents of this document view from
+        the database.
+        """
         if issubclass(type(self._DOCUMENT_CLS), DocumentSingleton):
             self._DOCUMENT_CLS._reload_instance(self)
 
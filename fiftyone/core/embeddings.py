@@ -0,0 +1,407 @@
+"""
+On-disk embeddings stores.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from copy import deepcopy
+import os
+
+import numpy as np
+
+import eta.core.utils as etau
+
+import fiftyone as fo
+
+
+_DEFAULT_SHARD_SIZE = 2 ** 20
+_ID_DTYPE = np.dtype("S12")
+_STORES_DIR = "__embeddings__"
+
+
+class EmbeddingsStore(object):
+    """A store of embedding vectors for the samples of a dataset that lives
+    on disk and is accessed via memory maps, so that collections whose
+    embeddings do not fit in memory can be processed.
+
+    Embeddings are appended to a sequence of shards, each of which contains
+    up to ``shard_size`` vectors stored as a raw row-major array alongside the
+    IDs of the samples to which they belong. Only a small manifest describing
+    the shards is stored in the dataset's database document; the shards
+    themselves are stored in a directory within
+    ``fiftyone.config.default_dataset_dir``.
+
+    Embeddings are indexed by sample ID. If embeddings are added for a sample
+    that already has an embedding in the store, the most recently added
+    embedding is used.
+
+    Args:
+        dataset: a :class:`fiftyone.core.dataset.Dataset`
+        name: the name of the store
+        shard_size (None): the maximum number of embeddings to store per
+            shard. Only applicable when the store is created
+    """
+
+    def __init__(self, dataset, name, shard_size=None):
+        if not name or os.sep in name or name.startswith("."):
+            raise ValueError("Invalid embeddings store name '%s'" % name)
+
+        if shard_size is None:
+            shard_size = _DEFAULT_SHARD_SIZE
+
+        self._dataset = dataset
+        self._name = name
+        self._shard_size = shard_size
+        self._manifest = deepcopy(
+            dataset._doc.embeddings_stores.get(name, None)
+        )
+        self._shards = None
+        self._index = None
+
+    def __repr__(self):
+        return "<%s: name=%s, num_embeddings=%d>" % (
+            self.__class__.__name__,
+            self._name,
+            len(self),
+        )
+
+    def __len__(self):
+        if self._manifest is None:
+            return 0
+
+        return sum(shard["count"] for shard in self._manifest["shards"])
+
+    @property
+    def name(self):
+        """The name of the store."""
+        return self._name
+
+    @property
+    def exists(self):
+        """Whether the store exists."""
+        return self._manifest is not None
+
+    @property
+    def store_dir(self):
+        """The directory in which the shards of the store are written."""
+        return os.path.join(get_stores_dir(self._dataset._doc), self._name)
+
+    @property
+    def dim(self):
+        """The dimension of the embeddings in the store, or None if the store
+        does not exist.
+        """
+        if self._manifest is None:
+            return None
+
+        return self._manifest["dim"]
+
+    @property
+    def dtype(self):
+        """The ``numpy.dtype`` of the embeddings in the store, or None if the
+        store does not exist.
+        """
+        if self._manifest is None:
+            return None
+
+        return np.dtype(self._manifest["dtype"])
+
+    @property
+    def num_shards(self):
+        """The number of shards in the store."""
+        if self._manifest is None:
+            return 0
+
+        return len(self._manifest["shards"])
+
+    def add(self, sample_ids, embeddings):
+        """Adds the given embeddings to the store.
+
+        The store is created if necessary, in which case its dimension and
+        data type are inferred from the provided embeddings.
+
+        Args:
+            sample_ids: an iterable of sample IDs
+            embeddings: a ``num_samples x num_dims`` array or an iterable of
+                1D embedding vectors
+        """
+        self._append(sample_ids, embeddings)
+        self._save()
+
+    def iter_shards(self):
+        """Returns an iterator over the shards of the store.
+
+        The embeddings are read-only ``numpy.memmap`` instances, so no data is
+        read from disk until the arrays are accessed.
+
+        Returns:
+            an iterator that emits ``(sample_ids, embeddings)`` tuples
+            containing a list of sample IDs and a ``num_samples x num_dims``
+            array of embeddings
+        """
+        for ids, embeddings in self._get_shards():
+            yield _keys_to_ids(ids), embeddings
+
+    def get_embeddings(self, sample_ids=None):
+        """Returns the embeddings for the given samples.
+
+        When the requested embeddings are stored contiguously in a single
+        shard, which is the case when the embeddings for a collection are
+        computed in one pass and are loaded in the same order, a zero-copy
+        ``numpy.memmap`` view into the shard is returned. Otherwise, the
+        embeddings are gathered into an in-memory array.
+
+        Args:
+            sample_ids (None): an iterable of sample IDs. By default, all
+                embeddings in the store are returned in the order they were
+                added
+
+        Returns:
+            a ``num_samples x num_dims`` array
+
+        Raises:
+            ValueError: if any of the samples have no embeddings in the store
+        """
+        self._validate()
+        shards = self._get_shards()
+
+        if sample_ids is None:
+            if len(shards) == 1:
+                return shards[0][1]
+
+            return np.concatenate([embeddings for _, embeddings in shards])
+
+        rows = self._get_rows(sample_ids)
+
+        starts = np.cumsum([0] + [len(ids) for ids, _ in shards])
+        shard_inds = np.searchsorted(starts, rows, side="right") - 1
+
+        num_rows = len(rows)
+        if num_rows > 0 and shard_inds[0] == shard_inds[-1]:
+            first = rows[0]
+            if rows[-1] - first == num_rows - 1 and (
+                num_rows == 1 or (np.diff(rows) == 1).all()
+            ):
+                idx = shard_inds[0]
+                start = first - starts[idx]
+                return shards[idx][1][start : start + num_rows]
+
+        embeddings = np.empty((num_rows, self.dim), dtype=self.dtype)
+        for idx, (_, shard_embeddings) in enumerate(shards):
+            inds = np.nonzero(shard_inds == idx)[0]
+            if inds.size > 0:
+                embeddings[inds] = shard_embeddings[rows[inds] - starts[idx]]
+
+        return embeddings
+
+    def contains(self, sample_ids):
+        """Determines whether the store contains embeddings for the given
+        samples.
+
+        Args:
+            sample_ids: an iterable of sample IDs
+
+        Returns:
+            a boolean array
+        """
+        keys = _ids_to_keys(sample_ids)
+        if self._manifest is None:
+            return np.zeros(len(keys), dtype=bool)
+
+        _, found = self._lookup(keys)
+        return found
+
+    def delete(self):
+        """Deletes the store from the dataset and from disk."""
+        self._shards = None
+        self._index = None
+        self._manifest = None
+
+        etau.delete_dir(self.store_dir)
+
+        embeddings_stores = dict(self._dataset._doc.embeddings_stores)
+        embeddings_stores.pop(self._name, None)
+        self._dataset._doc.embeddings_stores = embeddings_stores
+        self._dataset._doc.save()
+
+    def _validate(self):
+        if self._manifest is None:
+            raise ValueError(
+                "Dataset '%s' has no embeddings store '%s'"
+                % (self._dataset.name, self._name)
+            )
+
+    def _save(self):
+        embeddings_stores = dict(self._dataset._doc.embeddings_stores)
+        embeddings_stores[self._name] = deepcopy(self._manifest)
+        self._dataset._doc.embeddings_stores = embeddings_stores
+        self._dataset._doc.save()
+
+    def _append(self, sample_ids, embeddings):
+        keys = _ids_to_keys(sample_ids)
+        num_embeddings = len(keys)
+        if num_embeddings == 0:
+            return
+
+        embeddings = np.asarray(embeddings)
+        if embeddings.ndim != 2 or len(embeddings) != num_embeddings:
+            raise ValueError(
+                "Expected %d embedding vectors; found array of shape %s"
+                % (num_embeddings, embeddings.shape)
+            )
+
+        if self._manifest is None:
+            self._manifest = {
+                "dim": int(embeddings.shape[1]),
+                "dtype": embeddings.dtype.str,
+                "shard_size": int(self._shard_size),
+                "shards": [],
+            }
+
+        dim = self._manifest["dim"]
+        if embeddings.shape[1] != dim:
+            raise ValueError(
+                "Embeddings store '%s' contains %d-dimensional embeddings; "
+                "found %d-dimensional embeddings"
+                % (self._name, dim, embeddings.shape[1])
+            )
+
+        dtype = np.dtype(self._manifest["dtype"])
+        embeddings = np.ascontiguousarray(embeddings, dtype=dtype)
+
+        etau.ensure_dir(self.store_dir)
+
+        shard_size = self._manifest["shard_size"]
+        shards = self._manifest["shards"]
+
+        start = 0
+        while start < num_embeddings:
+            if not shards or shards[-1]["count"] >= shard_size:
+                shards.append({"filename": "%06d" % len(shards), "count": 0})
+
+            shard = shards[-1]
+            count = shard["count"]
+            num = min(shard_size - count, num_embeddings - start)
+
+            ids_path, embeddings_path = self._get_shard_paths(shard)
+            _append_array(
+                ids_path,
+                count * _ID_DTYPE.itemsize,
+                keys[start : start + num],
+            )
+            _append_array(
+                embeddings_path,
+                count * dim * dtype.itemsize,
+                embeddings[start : start + num],
+            )
+
+            shard["count"] = count + num
+            start += num
+
+        self._shards = None
+        self._index = None
+
+    def _get_shard_paths(self, shard):
+        store_dir = self.store_dir
+        filename = shard["filename"]
+        ids_path = os.path.join(store_dir, filename + ".ids")
+        embeddings_path = os.path.join(store_dir, filename + ".vecs")
+        return ids_path, embeddings_path
+
+    def _get_shards(self):
+        if self._shards is None:
+            dim = self._manifest["dim"]
+            dtype = np.dtype(self._manifest["dtype"])
+
+            shards = []
+            for shard in self._manifest["shards"]:
+                count = shard["count"]
+                ids_path, embeddings_path = self._get_shard_paths(shard)
+                ids = np.memmap(
+                    ids_path, dtype=_ID_DTYPE, mode="r", shape=(count,)
+                )
+                embeddings = np.memmap(
+                    embeddings_path, dtype=dtype, mode="r", shape=(count, dim)
+                )
+                shards.append((ids, embeddings))
+
+            self._shards = shards
+
+        return self._shards
+
+    def _get_index(self):
+        # Sorted unique IDs and the row of the most recent embedding for each
+        if self._index is None:
+            ids = np.concatenate([ids for ids, _ in self._get_shards()])
+            keys, inds = np.unique(ids[::-1], return_index=True)
+            self._index = (keys, len(ids) - 1 - inds)
+
+        return self._index
+
+    def _lookup(self, keys):
+        index_keys, index_rows = self._get_index()
+        inds = np.searchsorted(index_keys, keys)
+        inds = np.minimum(inds, len(index_keys) - 1)
+        found = index_keys[inds] == keys
+        return index_rows[inds], found
+
+    def _get_rows(self, sample_ids):
+        rows, found = self._lookup(_ids_to_keys(sample_ids))
+
+        num_missing = len(found) - np.count_nonzero(found)
+        if num_missing > 0:
+            raise ValueError(
+                "Embeddings store '%s' has no embeddings for %d sample(s)"
+                % (self._name, num_missing)
+            )
+
+        return rows
+
+
+def get_stores_dir(dataset_doc):
+    """Returns the directory in which the embeddings stores of the given
+    dataset are written.
+
+    Args:
+        dataset_doc: a :class:`fiftyone.core.odm.dataset.DatasetDocument`
+
+    Returns:
+        the directory
+    """
+    return os.path.join(
+        fo.config.default_dataset_dir,
+        _STORES_DIR,
+        dataset_doc.sample_collection_name,
+    )
+
+
+def delete_stores(dataset_doc):
+    """Deletes the on-disk contents of all embeddings stores of the given
+    dataset.
+
+    Args:
+        dataset_doc: a :class:`fiftyone.core.odm.dataset.DatasetDocument`
+    """
+    etau.delete_dir(get_stores_dir(dataset_doc))
+
+
+def _ids_to_keys(sample_ids):
+    # ObjectIds are stored as their raw 12 bytes
+    hex_str = "".join(str(_id) for _id in sample_ids)
+    return np.frombuffer(bytes.fromhex(hex_str), dtype=_ID_DTYPE)
+
+
+def _keys_to_ids(keys):
+    hex_str = np.ascontiguousarray(keys).tobytes().hex()
+    return [hex_str[i : i + 24] for i in range(0, len(hex_str), 24)]
+
+
+def _append_array(path, offset, arr):
+    # Discards any data beyond `offset`, which may have been left behind by an
+    # interrupted write that was never recorded in the manifest
+    mode = "r+b" if os.path.isfile(path) else "wb"
+    with open(path, mode) as f:
+        f.truncate(offset)
+        f.seek(offset)
+        f.write(arr.tobytes())
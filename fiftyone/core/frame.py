@@ -421,6 +421,10 @@ class Frames(object):
 
     def save(self):
         """Saves all frames for the sample to the database."""
+        self._save()
+        self._dataset._mark_modified(paths=["frames"])
+
+    def _save(self):
         if not self._in_db:
             raise ValueError(
                 "Cannot save frames of a sample that has not been added to "
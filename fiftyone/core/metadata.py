@@ -5,11 +5,14 @@ Metadata stored in dataset samples.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-import itertools
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import multiprocessing
 import os
 
+from pymongo import UpdateOne
+import PIL.Image
+
 import eta.core.image as etai
 import eta.core.utils as etau
 import eta.core.video as etav
@@ -79,13 +82,20 @@ class ImageMetadata(Metadata):
         """
         if etau.is_str(image_or_path):
             # From image on disk
-            m = etai.ImageMetadata.build_for(image_or_path)
+            try:
+                # Only read the image's header, if possible
+                width, height, num_channels = _get_image_info(image_or_path)
+            except Exception:
+                m = etai.ImageMetadata.build_for(image_or_path)
+                width, height = m.frame_size
+                num_channels = m.num_channels
+
             return cls(
-                size_bytes=m.size_bytes,
-                mime_type=m.mime_type,
-                width=m.frame_size[0],
-                height=m.frame_size[1],
-                num_channels=m.num_channels,
+                size_bytes=os.path.getsize(image_or_path),
+                mime_type=etau.guess_mime_type(image_or_path),
+                width=width,
+                height=height,
+                num_channels=num_channels,
             )
 
         # From in-memory image
@@ -157,7 +167,11 @@ def compute_sample_metadata(sample, skip_failures=False):
 
 
 def compute_metadata(
-    sample_collection, overwrite=False, num_workers=None, skip_failures=True
+    sample_collection,
+    overwrite=False,
+    num_workers=None,
+    skip_failures=True,
+    batch_size=1000,
 ):
     """Populates the ``metadata`` field of all samples in the collection.
 
@@ -168,20 +182,22 @@ def compute_metadata(
         sample_collection: a
             :class:`fiftyone.core.collections.SampleCollection`
         overwrite (False): whether to overwrite existing metadata
-        num_workers (None): the number of processes to use. By default,
+        num_workers (None): the number of worker threads to use. By default,
             ``multiprocessing.cpu_count()`` is used
         skip_failures (True): whether to gracefully continue without raising an
             error if metadata cannot be computed for a sample
+        batch_size (1000): the number of samples whose metadata to write to the
+            database per batch
     """
     if num_workers is None:
         num_workers = multiprocessing.cpu_count()
 
-    if num_workers == 1:
-        _compute_metadata(sample_collection, overwrite=overwrite)
+    if overwrite:
+        samples = sample_collection
     else:
-        _compute_metadata_multi(
-            sample_collection, num_workers, overwrite=overwrite,
-        )
+        samples = sample_collection.exists("metadata", False)
+
+    _compute_metadata(samples, num_workers, batch_size)
 
     num_missing = len(sample_collection.exists("metadata", False))
     if num_missing > 0:
@@ -196,50 +212,59 @@ def compute_metadata(
             raise ValueError(msg)
 
 
-def _compute_metadata(sample_collection, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
+def _compute_metadata(sample_collection, num_workers, batch_size):
+    ids, filepaths = sample_collection.values(["_id", "filepath"])
 
-    num_samples = len(sample_collection)
+    num_samples = len(ids)
     if num_samples == 0:
         return
 
-    logger.info("Computing %s metadata...", sample_collection.media_type)
+    media_type = sample_collection.media_type
+    batches = fou.iter_batches(zip(ids, filepaths), batch_size)
+
+    def _submit(executor):
+        batch = next(batches, None)
+        if batch is None:
+            return None
+
+        return [
+            (
+                _id,
+                executor.submit(
+                    _compute_sample_metadata,
+                    filepath,
+                    media_type,
+                    skip_failures=True,
+                ),
+            )
+            for _id, filepath in batch
+        ]
+
+    logger.info("Computing %s metadata...", media_type)
     with fou.ProgressBar(total=num_samples) as pb:
-        for sample in pb(sample_collection.select_fields()):
-            compute_sample_metadata(sample, skip_failures=True)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # The next batch is probed while the current one is written
+            futures = _submit(executor)
+            while futures is not None:
+                next_futures = _submit(executor)
 
+                ops = []
+                for _id, future in futures:
+                    metadata = future.result()
+                    if metadata is not None:
+                        ops.append(
+                            UpdateOne(
+                                {"_id": _id},
+                                {"$set": {"metadata": metadata.to_mongo()}},
+                            )
+                        )
 
-def _compute_metadata_multi(sample_collection, num_workers, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
+                    pb.update()
 
-    ids, filepaths = sample_collection.values(["id", "filepath"])
-    media_types = itertools.repeat(sample_collection.media_type)
+                if ops:
+                    sample_collection._dataset._bulk_write(ops)
 
-    inputs = list(zip(ids, filepaths, media_types))
-    num_samples = len(inputs)
-
-    if num_samples == 0:
-        return
-
-    logger.info("Computing %s metadata...", sample_collection.media_type)
-    with fou.ProgressBar(total=num_samples) as pb:
-        with multiprocessing.Pool(processes=num_workers) as pool:
-            for sample_id, metadata in pb(
-                pool.imap_unordered(_do_compute_metadata, inputs)
-            ):
-                sample = sample_collection[sample_id]
-                sample.metadata = metadata
-                sample.save()
-
-
-def _do_compute_metadata(args):
-    sample_id, filepath, media_type = args
-    metadata = _compute_sample_metadata(
-        filepath, media_type, skip_failures=True
-    )
-    return sample_id, metadata
+                futures = next_futures
 
 
 def _compute_sample_metadata(filepath, media_type, skip_failures=False):
@@ -252,6 +277,25 @@ def _compute_sample_metadata(filepath, media_type, skip_failures=False):
         return None
 
 
+def _get_image_info(filepath):
+    # PIL only reads the image's header until pixel data is requested
+    with PIL.Image.open(filepath) as img:
+        width, height = img.size
+        mode = img.mode
+
+        # Report channels consistently with `eta.core.image.read()`
+        if mode in ("P", "PA"):
+            num_channels = 4 if "transparency" in img.info else 3
+        elif mode == "LA":
+            num_channels = 4
+        elif mode == "CMYK":
+            num_channels = 3
+        else:
+            num_channels = len(img.getbands())
+
+    return width, height, num_channels
+
+
 def _get_metadata(filepath, media_type):
     if media_type == fom.IMAGE:
         metadata = ImageMetadata.build_for(filepath)
@@ -5,12 +5,20 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import inspect
 import itertools
 import logging
+import multiprocessing
+import queue
+import threading
+import time
 
+from bson import ObjectId
 import numpy as np
+from pymongo import UpdateOne
 
 import eta.core.image as etai
 import eta.core.learning as etal
@@ -20,8 +28,10 @@ import eta.core.video as etav
 import eta.core.web as etaw
 
 import fiftyone as fo
+import fiftyone.core.embeddings as foem
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.sample as fosa
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
@@ -43,6 +53,17 @@ _ALLOWED_PATCH_TYPES = (
     fol.Polylines,
 )
 
+# The number of batches of images to decode ahead of the batch being processed
+_NUM_PREFETCH_BATCHES = 2
+
+# The maximum number of predicted batches that may be awaiting database writes
+_MAX_PENDING_WRITES = 4
+
+# The number of samples and the maximum latency, in seconds, with which
+# predictions are gathered before loading their samples and writing them
+_WRITE_BATCH_SIZE = 64
+_WRITE_LATENCY = 0.2
+
 
 def apply_model(
     samples,
@@ -53,6 +74,8 @@ def apply_model(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    frame_stride=None,
+    max_fps=None,
     **trainer_kwargs,
 ):
     """Applies the :class:`FiftyOne model <Model>` or
@@ -80,11 +103,20 @@ def apply_model(
             logits, ``model.has_logits == True``
         batch_size (None): an optional batch size to use, if the model supports
             batching
-        num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+        num_workers (None): the number of workers to use when loading images,
+            or the number of videos to read concurrently when applying image
+            models to the frames of video collections. Not applicable to
+            video models
         skip_failures (True): whether to gracefully continue without raising an
             error if predictions cannot be generated for a sample. Only
             applicable to :class:`Model` instances
+        frame_stride (None): an optional stride at which to sample frames when
+            applying image models to the frames of video collections. For
+            example, ``frame_stride=5`` processes frames 1, 6, 11, ...
+        max_fps (None): an optional maximum frame rate at which to sample
+            frames when applying image models to the frames of video
+            collections. Videos whose frame rate exceeds this value are
+            subsampled accordingly
         **trainer_kwargs: optional keyword arguments used to initialize the
             :mod:`Trainer <flash:flash.core.trainer>` when using Flash models.
             These can be used to, for example, configure the number of GPUs to
@@ -127,9 +159,21 @@ def apply_model(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if num_workers is not None and model.media_type != "image":
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for image models"
+        )
+
+    process_frames = (
+        samples.media_type == fom.VIDEO and model.media_type == "image"
+    )
+
+    if (frame_stride is not None or max_fps is not None) and (
+        not process_frames
+    ):
+        logger.warning(
+            "Ignoring `frame_stride` and `max_fps` parameters; only supported "
+            "when applying image models to video collections"
         )
 
     with contextlib.ExitStack() as context:
@@ -164,23 +208,23 @@ def apply_model(
 
         batch_size = _parse_batch_size(batch_size, model, use_data_loader)
 
-        if samples.media_type == fom.VIDEO and model.media_type == "image":
+        if process_frames:
             label_field, _ = samples._handle_frame_field(label_field)
+            get_stride = _parse_frame_stride(frame_stride, max_fps)
 
-            if batch_size is not None:
-                return _apply_image_model_to_frames_batch(
-                    samples,
-                    model,
-                    label_field,
-                    confidence_thresh,
-                    batch_size,
-                    skip_failures,
-                )
-
-            return _apply_image_model_to_frames_single(
-                samples, model, label_field, confidence_thresh, skip_failures
+            return _apply_image_model_to_frames(
+                samples,
+                model,
+                label_field,
+                confidence_thresh,
+                batch_size,
+                num_workers,
+                get_stride,
+                skip_failures,
             )
 
+        samples = _select_inference_fields(samples)
+
         if use_data_loader:
             return _apply_image_model_data_loader(
                 samples,
@@ -199,11 +243,17 @@ def apply_model(
                 label_field,
                 confidence_thresh,
                 batch_size,
+                num_workers,
                 skip_failures,
             )
 
         return _apply_image_model_single(
-            samples, model, label_field, confidence_thresh, skip_failures
+            samples,
+            model,
+            label_field,
+            confidence_thresh,
+            num_workers,
+            skip_failures,
         )
 
 
@@ -219,24 +269,32 @@ def _is_flash_model(model):
 
 
 def _apply_image_model_single(
-    samples, model, label_field, confidence_thresh, skip_failures
+    samples, model, label_field, confidence_thresh, num_workers, skip_failures
 ):
-    errors = []
+    batches = _iter_decoded_batches(samples, 1, num_workers)
+    writer = _SamplesWriter(
+        samples,
+        _make_add_labels_fcn(label_field, confidence_thresh),
+        skip_failures,
+    )
 
-    with fou.ProgressBar() as pb:
-        for sample in pb(samples):
+    with fou.ProgressBar(samples) as pb, writer:
+        for sample_ids, filepaths, imgs, read_errors in batches:
             try:
-                img = etai.read(sample.filepath)
-                labels = model.predict(img)
+                if read_errors:
+                    raise read_errors[0][1]
 
-                sample.add_labels(
-                    labels, label_field, confidence_thresh=confidence_thresh
-                )
+                labels = model.predict(imgs[0])
+                writer.write(filepaths[0], sample_ids, [labels])
             except Exception as e:
                 if not skip_failures:
                     raise e
 
-                errors.append((sample.filepath, e))
+                writer.errors.append((filepaths[0], e))
+
+            pb.update()
+
+    errors = writer.errors
 
     if errors:
         lines = [
@@ -259,48 +317,43 @@ def _apply_image_model_single(
 
 
 def _apply_image_model_batch(
-    samples, model, label_field, confidence_thresh, batch_size, skip_failures
+    samples,
+    model,
+    label_field,
+    confidence_thresh,
+    batch_size,
+    num_workers,
+    skip_failures,
 ):
-    samples_loader = fou.iter_batches(samples, batch_size)
-
-    errors = []
+    batches = _iter_decoded_batches(samples, batch_size, num_workers)
+    writer = _SamplesWriter(
+        samples,
+        _make_add_labels_fcn(label_field, confidence_thresh),
+        skip_failures,
+    )
 
-    with fou.ProgressBar(samples) as pb:
-        for idx, sample_batch in enumerate(samples_loader, 1):
+    with fou.ProgressBar(samples) as pb, writer:
+        for idx, (sample_ids, _, imgs, read_errors) in enumerate(batches, 1):
             try:
-                imgs = [etai.read(sample.filepath) for sample in sample_batch]
-                labels_batch = model.predict_all(imgs)
+                if read_errors:
+                    if not skip_failures:
+                        raise read_errors[0][1]
 
-                for sample, labels in zip(sample_batch, labels_batch):
-                    sample.add_labels(
-                        labels,
-                        label_field,
-                        confidence_thresh=confidence_thresh,
-                    )
+                    writer.errors.extend(read_errors)
 
+                inds, labels_batch = _apply_to_readable(
+                    model.predict_all, imgs
+                )
+                writer.write(idx, [sample_ids[i] for i in inds], labels_batch)
             except Exception as e:
                 if not skip_failures:
                     raise e
 
-                errors.append((idx, e))
+                writer.errors.append((idx, e))
 
-            pb.update(len(sample_batch))
+            pb.update(len(sample_ids))
 
-    if errors:
-        lines = ["Batch: %s\nError: %s" % (idx, str(e)) for idx, e in errors]
-
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d batches" % num_errors
-        else:
-            estr = "%d batch" % num_errors
-
-        lines.append(
-            "Errors occured while generating predictions for %s. See above "
-            "for details." % estr
-        )
-
-        logger.warning("\n\n".join(lines))
+    _log_batch_errors(writer.errors)
 
 
 def _apply_image_model_data_loader(
@@ -312,139 +365,495 @@ def _apply_image_model_data_loader(
     num_workers,
     skip_failures,
 ):
-    samples_loader = fou.iter_batches(samples, batch_size)
     data_loader = _make_data_loader(
         samples, model, batch_size, num_workers, skip_failures
     )
+    writer = _SamplesWriter(
+        samples,
+        _make_add_labels_fcn(label_field, confidence_thresh),
+        skip_failures,
+    )
 
-    errors = []
-
-    with fou.ProgressBar(samples) as pb:
-        for idx, (sample_batch, imgs) in enumerate(
-            zip(samples_loader, data_loader), 1
-        ):
+    with fou.ProgressBar(samples) as pb, writer:
+        for idx, (imgs, sample_ids) in enumerate(data_loader, 1):
             try:
                 if isinstance(imgs, Exception):
                     raise imgs
 
                 labels_batch = model.predict_all(imgs)
-
-                for sample, labels in zip(sample_batch, labels_batch):
-                    sample.add_labels(
-                        labels,
-                        label_field,
-                        confidence_thresh=confidence_thresh,
-                    )
-
+                writer.write(idx, sample_ids, labels_batch)
             except Exception as e:
                 if not skip_failures:
                     raise e
 
-                errors.append((idx, e))
+                writer.errors.append((idx, e))
 
-            pb.update(len(sample_batch))
+            pb.update(len(sample_ids))
 
-    if errors:
-        lines = ["Batch: %s\nError: %s" % (idx, str(e)) for idx, e in errors]
+    _log_batch_errors(writer.errors)
 
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d batches" % num_errors
+
+def _log_batch_errors(errors, outputs="predictions"):
+    # Errors are keyed by batch index, or by filepath for images that could
+    # not be read
+    if not errors:
+        return
+
+    lines = []
+    num_images = 0
+    num_batches = 0
+    for key, e in errors:
+        if isinstance(key, str):
+            lines.append("Image: %s\nError: %s" % (key, str(e)))
+            num_images += 1
         else:
-            estr = "%d batch" % num_errors
+            lines.append("Batch: %s\nError: %s" % (key, str(e)))
+            num_batches += 1
 
-        lines.append(
-            "Errors occured while generating predictions for %s. See above "
-            "for details." % estr
+    counts = []
+    if num_images > 0:
+        counts.append(_pluralize(num_images, "image", "images"))
+
+    if num_batches > 0:
+        counts.append(_pluralize(num_batches, "batch", "batches"))
+
+    lines.append(
+        "Errors occurred while generating %s for %s. See above for "
+        "details." % (outputs, " and ".join(counts))
+    )
+
+    logger.warning("\n\n".join(lines))
+
+
+def _pluralize(num, singular, plural):
+    return "%d %s" % (num, singular if num == 1 else plural)
+
+
+def _select_inference_fields(samples):
+    # Inference only requires the default fields of each sample, so we avoid
+    # loading other, potentially large, fields from the database. Patches and
+    # frames views are left as-is, since their samples must be synced with
+    # their source collections when saved
+    if samples._is_patches or samples._is_frames:
+        return samples
+
+    return samples.select_fields()
+
+
+def _iter_decoded_batches(samples, batch_size, num_workers):
+    # Emits `(sample_ids, filepaths, imgs, errors)` tuples, where the images are
+    # decoded by a pool of worker threads, up to `_NUM_PREFETCH_BATCHES`
+    # batches (or enough batches to keep all workers busy) ahead of the batch
+    # currently being processed by the caller. Images that cannot be read are
+    # emitted as None, and `errors` contains `(filepath, exception)` tuples
+    # describing why
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    num_workers = max(num_workers, 1)
+    num_prefetch = max(
+        _NUM_PREFETCH_BATCHES, int(np.ceil(num_workers / batch_size))
+    )
+
+    ids, filepaths = samples.values(["id", "filepath"])
+    batches = fou.iter_batches(zip(ids, filepaths), batch_size)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending = deque()
+
+        def _submit():
+            batch = next(batches, None)
+            if batch is None:
+                return False
+
+            sample_ids, paths = zip(*batch)
+            futures = [executor.submit(etai.read, path) for path in paths]
+            pending.append((sample_ids, paths, futures))
+            return True
+
+        for _ in range(num_prefetch):
+            if not _submit():
+                break
+
+        while pending:
+            sample_ids, paths, futures = pending.popleft()
+            _submit()
+
+            imgs = []
+            errors = []
+            for path, future in zip(paths, futures):
+                try:
+                    imgs.append(future.result())
+                except Exception as e:
+                    imgs.append(None)
+                    errors.append((path, e))
+
+            yield sample_ids, paths, imgs, errors
+
+
+def _apply_to_readable(fcn, imgs):
+    # Applies `fcn` to the images that were successfully read, and returns the
+    # indices of those images along with the outputs
+    inds = [idx for idx, img in enumerate(imgs) if img is not None]
+    if not inds:
+        return [], []
+
+    if len(inds) < len(imgs):
+        imgs = [imgs[idx] for idx in inds]
+
+    return inds, list(fcn(imgs))
+
+
+def _make_add_labels_fcn(label_field, confidence_thresh):
+    def add_labels(sample, labels):
+        sample._add_labels(
+            labels, label_field, confidence_thresh=confidence_thresh
         )
 
-        logger.warning("\n\n".join(lines))
+    return add_labels
 
 
-def _apply_image_model_to_frames_single(
-    samples, model, label_field, confidence_thresh, skip_failures
-):
-    frame_counts, total_frame_count = _get_frame_counts(samples)
+def _make_set_field_fcn(field_name):
+    def set_field(sample, value):
+        sample[field_name] = value
 
-    errors = []
+    return set_field
 
-    with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
+
+class _BackgroundWriter(object):
+    """Base class for contexts that write values computed by models to the
+    database via bulk writes in a background thread, so that database writes
+    overlap with decoding and inference.
+
+    Values are provided via :meth:`write` along with the keys of the
+    documents to which they belong, and pending batches are gathered so that
+    they can be written together.
+
+    Errors that occur while writing a batch are recorded in :attr:`errors`
+    if ``skip_failures`` is True, and are otherwise raised by the next call to
+    :meth:`write` or when the context exits.
+
+    Args:
+        skip_failures: whether to record errors rather than raising them
+    """
+
+    def __init__(self, skip_failures):
+        self.skip_failures = skip_failures
+        self.errors = []
+
+        self._queue = queue.Queue(maxsize=_MAX_PENDING_WRITES)
+        self._thread = None
+        self._error = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+        if args[0] is None:
+            self._raise_error()
+
+    def write(self, key, refs, values):
+        """Queues the given values to be written.
+
+        Args:
+            key: a key to associate with any errors that occur while writing
+                the batch
+            refs: an iterable of references to the documents to which the
+                values belong
+            values: an iterable of values
+        """
+        self._raise_error()
+        self._queue.put((key, refs, values))
+
+    def _write(self, items):
+        raise NotImplementedError("subclasses must implement _write()")
+
+    def _flush(self):
+        pass
+
+    def _handle_error(self, key, e):
+        if not self.skip_failures:
+            self._error = e
+            return
+
+        self.errors.append((key, e))
+
+    def _raise_error(self):
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    def _run(self):
+        done = False
+        try:
+            while not done:
+                items, done = self._get_items()
+                if items and self._error is None:
+                    self._write(items)
+
+            self._flush()
+        except Exception as e:
+            self._error = e
+
+            # Drain the queue so that the producer never blocks
+            while not done:
+                done = self._queue.get() is None
+
+    def _get_items(self):
+        # Waits for the next batch and then gathers further batches until
+        # enough values have accumulated to be written together, or until the
+        # write latency has elapsed
+        item = self._queue.get()
+        if item is None:
+            return [], True
+
+        items = [item]
+        num_values = len(item[1])
+        deadline = time.time() + _WRITE_LATENCY
+
+        while num_values < _WRITE_BATCH_SIZE:
             try:
-                with etav.FFmpegVideoReader(sample.filepath) as video_reader:
-                    for img in video_reader:
-                        labels = model.predict(img)
+                timeout = max(deadline - time.time(), 0)
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
 
-                        sample.add_labels(
-                            {video_reader.frame_number: labels},
-                            label_field,
-                            confidence_thresh=confidence_thresh,
-                        )
+            if item is None:
+                return items, True
 
-                        pb.update()
+            items.append(item)
+            num_values += len(item[1])
+
+        return items, False
 
+
+class _SamplesWriter(_BackgroundWriter):
+    """Context that applies values computed for samples and saves the samples
+    via bulk database writes in a background thread.
+
+    The samples corresponding to the sample IDs provided to :meth:`write` are
+    loaded from the collection in batches, ``update_fcn(sample, value)`` is
+    applied to each of them, and they are saved via a
+    :class:`fiftyone.core.collections.SaveContext`.
+
+    Args:
+        samples: a :class:`fiftyone.core.collections.SampleCollection`
+        update_fcn: a function that applies a value to a sample
+        skip_failures: whether to record errors rather than raising them
+    """
+
+    def __init__(self, samples, update_fcn, skip_failures):
+        super().__init__(skip_failures)
+        self.samples = samples
+        self.update_fcn = update_fcn
+
+        self._ctx = samples.save_context()
+
+    def _write(self, items):
+        sample_ids = [_id for _, ids, _ in items for _id in ids]
+        samples_map = {
+            sample.id: sample for sample in self.samples.select(sample_ids)
+        }
+
+        for key, ids, values in items:
+            try:
+                for _id, value in zip(ids, values):
+                    sample = samples_map.get(_id, None)
+                    if sample is None:
+                        raise ValueError("Sample '%s' not found" % _id)
+
+                    self.update_fcn(sample, value)
+                    self._ctx.save(sample)
             except Exception as e:
-                if not skip_failures:
-                    raise e
+                self._handle_error(key, e)
+                if self._error is not None:
+                    return
 
-                errors.append((sample.filepath, e))
+    def _flush(self):
+        self._ctx.flush()
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
 
-    if errors:
-        lines = [
-            "Video: %s\nError: %s" % (filepath, str(e))
-            for filepath, e in errors
-        ]
+class _EmbeddingsStoreWriter(_BackgroundWriter):
+    """Context that appends embeddings computed for samples to an
+    :class:`fiftyone.core.embeddings.EmbeddingsStore` in a background thread.
 
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d videos" % num_errors
-        else:
-            estr = "%d video" % num_errors
+    ``None`` values, which indicate samples for which embeddings could not be
+    computed, are skipped. The store's manifest is saved when the context
+    exits.
 
-        lines.append(
-            "Errors occured while generating predictions for %s. See above "
-            "for details." % estr
-        )
+    Args:
+        store: a :class:`fiftyone.core.embeddings.EmbeddingsStore`
+    """
 
-        logger.warning("\n\n".join(lines))
+    def __init__(self, store):
+        super().__init__(False)
+        self.store = store
 
+    def _write(self, items):
+        sample_ids = []
+        embeddings = []
+        for _, ids, values in items:
+            for _id, embedding in zip(ids, values):
+                if embedding is not None:
+                    sample_ids.append(_id)
+                    embeddings.append(embedding)
 
-def _apply_image_model_to_frames_batch(
-    samples, model, label_field, confidence_thresh, batch_size, skip_failures
-):
-    frame_counts, total_frame_count = _get_frame_counts(samples)
+        if sample_ids:
+            self.store._append(sample_ids, np.stack(embeddings))
 
-    errors = []
+    def _flush(self):
+        if self.store.exists:
+            self.store._save()
 
-    with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
-            try:
-                with etav.FFmpegVideoReader(sample.filepath) as video_reader:
-                    for fns, imgs in _iter_batches(video_reader, batch_size):
-                        labels_batch = model.predict_all(imgs)
 
-                        sample.add_labels(
+class _FrameLabelsWriter(_BackgroundWriter):
+    """Context that writes frame labels directly to the frames of a video
+    collection via bulk database writes in a background thread.
+
+    The references provided to :meth:`write` must be
+    ``(sample_id, frame_number)`` tuples. Frames that do not yet exist are
+    created.
+
+    Args:
+        samples: a :class:`fiftyone.core.collections.SampleCollection`
+        label_field: the name (or prefix) of the frame field in which to store
+            the labels
+        confidence_thresh: an optional confidence threshold to apply to the
+            labels
+        skip_failures: whether to record errors rather than raising them
+    """
+
+    def __init__(self, samples, label_field, confidence_thresh, skip_failures):
+        super().__init__(skip_failures)
+        self.samples = samples
+        self.label_field = label_field
+        self.confidence_thresh = confidence_thresh
+
+        self._dataset = samples._dataset
+        self._schema = self._dataset.get_frame_field_schema()
+
+    def _write(self, items):
+        ops = []
+        for key, refs, labels_batch in items:
+            try:
+                for (sample_id, frame_number), labels in zip(
+                    refs, labels_batch
+                ):
+                    update = self._make_update(labels)
+                    if not update:
+                        continue
+
+                    ops.append(
+                        UpdateOne(
                             {
-                                fn: labels
-                                for fn, labels in zip(fns, labels_batch)
+                                "_sample_id": ObjectId(sample_id),
+                                "frame_number": frame_number,
                             },
-                            label_field,
-                            confidence_thresh=confidence_thresh,
+                            {"$set": update},
+                            upsert=True,
                         )
+                    )
+            except Exception as e:
+                self._handle_error(key, e)
+                if self._error is not None:
+                    return
 
-                        pb.update(len(imgs))
+        if ops:
+            self._dataset._bulk_write(ops, frames=True)
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+    def _make_update(self, labels):
+        if self.confidence_thresh is not None:
+            labels = fosa._apply_confidence_thresh(
+                labels, self.confidence_thresh
+            )
 
-                errors.append((sample.filepath, e))
+        if isinstance(labels, dict):
+            if self.label_field:
+                label_key = lambda k: self.label_field + "_" + k
+            else:
+                label_key = lambda k: k
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
+            labels = {label_key(k): v for k, v in labels.items()}
+        else:
+            labels = {self.label_field: labels}
+
+        update = {}
+        for field_name, value in labels.items():
+            if value is None:
+                continue
+
+            field = self._schema.get(field_name, None)
+            if field is None:
+                self._dataset._add_implied_frame_field(field_name, value)
+                self._schema = self._dataset.get_frame_field_schema()
+                field = self._schema[field_name]
+
+            field.validate(value)
+            update[field_name] = field.to_mongo(value)
+
+        return update
+
+
+def _apply_image_model_to_frames(
+    samples,
+    model,
+    label_field,
+    confidence_thresh,
+    batch_size,
+    num_workers,
+    get_stride,
+    skip_failures,
+):
+    if batch_size is None:
+        predict_fcn = lambda imgs: [model.predict(imgs[0])]
+        batch_size = 1
+    else:
+        predict_fcn = model.predict_all
+
+    videos, total_frame_count = _get_frame_sampling(samples, get_stride)
+    batches = _iter_frame_batches(videos, batch_size, num_workers)
+    writer = _FrameLabelsWriter(
+        samples, label_field, confidence_thresh, skip_failures
+    )
+
+    errors = []
+
+    with contextlib.closing(batches), writer:
+        with fou.ProgressBar(total=total_frame_count) as pb:
+            for frame_refs, imgs, video_errors in batches:
+                for filepath, e in video_errors:
+                    if not skip_failures:
+                        raise e
+
+                    errors.append((filepath, e))
+
+                if not imgs:
+                    continue
+
+                # Batches may contain frames from multiple videos
+                key = ", ".join(
+                    sorted({videos[_id][0] for _id, _ in frame_refs})
+                )
+
+                try:
+                    labels_batch = predict_fcn(imgs)
+                    writer.write(key, frame_refs, labels_batch)
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
+
+                    errors.append((key, e))
+
+                pb.update(len(imgs))
+
+    errors.extend(writer.errors)
 
     if errors:
         lines = [
@@ -454,12 +863,12 @@ def _apply_image_model_to_frames_batch(
 
         num_errors = len(errors)
         if num_errors > 1:
-            estr = "%d videos" % num_errors
+            estr = "%d errors" % num_errors
         else:
-            estr = "%d video" % num_errors
+            estr = "%d error" % num_errors
 
         lines.append(
-            "Errors occured while generating predictions for %s. See above "
+            "Encountered %s while generating frame predictions. See above "
             "for details." % estr
         )
 
@@ -519,6 +928,44 @@ def _get_frame_counts(samples):
     return frame_counts, total_frame_count
 
 
+def _get_frame_sampling(samples, get_stride):
+    # Returns a dict mapping sample IDs to `(filepath, frame_numbers, stride)`
+    # tuples, where `frame_numbers` is None if the frames to read could not be
+    # enumerated in advance, in which case every `stride`-th frame should be
+    # read, and the (possibly partial) total number of frames that will be
+    # read
+    samples.compute_metadata()
+
+    ids, filepaths, frame_rates, frame_counts = samples.values(
+        [
+            "id",
+            "filepath",
+            "metadata.frame_rate",
+            "metadata.total_frame_count",
+        ]
+    )
+
+    videos = {}
+    total_frame_count = 0
+    for _id, filepath, frame_rate, frame_count in zip(
+        ids, filepaths, frame_rates, frame_counts
+    ):
+        stride = get_stride(frame_rate) if get_stride is not None else 1
+        frame_count = frame_count or 0
+
+        if stride > 1 and frame_count > 0:
+            frame_numbers = list(range(1, frame_count + 1, stride))
+            total_frame_count += len(frame_numbers)
+            stride = 1
+        else:
+            frame_numbers = None
+            total_frame_count += int(np.ceil(frame_count / stride))
+
+        videos[_id] = (filepath, frame_numbers, stride)
+
+    return videos, total_frame_count
+
+
 def _iter_batches(video_reader, batch_size):
     frame_numbers = []
     imgs = []
@@ -530,7 +977,120 @@ def _iter_batches(video_reader, batch_size):
             frame_numbers = []
             imgs = []
 
-    return frame_numbers, imgs
+    if imgs:
+        yield frame_numbers, imgs
+
+
+def _parse_frame_stride(frame_stride, max_fps):
+    # Returns None if all frames should be processed, or else a function that
+    # returns the stride to use for a video with the given frame rate
+    if max_fps is None:
+        if frame_stride is None or frame_stride <= 1:
+            return None
+
+        return lambda frame_rate: frame_stride
+
+    frame_stride = frame_stride or 1
+
+    def get_stride(frame_rate):
+        if not frame_rate:
+            return frame_stride
+
+        return max(frame_stride, int(np.ceil(frame_rate / max_fps)))
+
+    return get_stride
+
+
+def _iter_frame_batches(videos, batch_size, num_workers):
+    # Emits `(frame_refs, imgs, errors)` tuples, where `frame_refs` are the
+    # `(sample_id, frame_number)` of each image and `errors` contains the
+    # `(filepath, Exception)` of any videos that failed to be read.
+    #
+    # Multiple videos are read concurrently, each by a worker thread that
+    # drives its own ffmpeg process, and the frames of different videos are
+    # packed together into full batches
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    num_workers = max(min(num_workers, len(videos)), 1)
+    frames_queue = queue.Queue(
+        maxsize=batch_size * (num_workers + _NUM_PREFETCH_BATCHES)
+    )
+    videos_iter = iter(list(videos.items()))
+    videos_lock = threading.Lock()
+    stop = threading.Event()
+
+    def _read_videos():
+        while not stop.is_set():
+            with videos_lock:
+                sample_id, (filepath, frame_numbers, stride) = next(
+                    videos_iter, (None, (None, None, None))
+                )
+
+            if sample_id is None:
+                break
+
+            try:
+                with etav.FFmpegVideoReader(
+                    filepath, frames=frame_numbers
+                ) as video_reader:
+                    for img in video_reader:
+                        if stop.is_set():
+                            break
+
+                        frame_number = video_reader.frame_number
+                        if (frame_number - 1) % stride:
+                            continue
+
+                        ref = (sample_id, frame_number)
+                        frames_queue.put((ref, img))
+            except Exception as e:
+                frames_queue.put((None, (filepath, e)))
+
+        frames_queue.put(None)
+
+    workers = [
+        threading.Thread(target=_read_videos, daemon=True)
+        for _ in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        num_active = len(workers)
+        frame_refs = []
+        imgs = []
+        errors = []
+        while num_active > 0:
+            item = frames_queue.get()
+            if item is None:
+                num_active -= 1
+            elif item[0] is None:
+                errors.append(item[1])
+            else:
+                frame_refs.append(item[0])
+                imgs.append(item[1])
+
+            if errors:
+                yield [], [], errors
+                errors = []
+
+            if len(imgs) >= batch_size:
+                yield frame_refs, imgs, []
+                frame_refs = []
+                imgs = []
+
+        if imgs:
+            yield frame_refs, imgs, []
+    finally:
+        stop.set()
+
+        # Unblock any workers that are waiting to enqueue frames
+        while any(worker.is_alive() for worker in workers):
+            try:
+                frames_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
 
 
 def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
@@ -542,16 +1102,21 @@ def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
     if num_workers is None:
         num_workers = fout.recommend_num_workers()
 
+    ids, filepaths = samples.values(["id", "filepath"])
+
     dataset = fout.TorchImageDataset(
-        samples.values("filepath"),
+        filepaths,
+        sample_ids=ids,
         transform=model.transforms,
         use_numpy=use_numpy,
         force_rgb=True,
         skip_failures=skip_failures,
     )
 
-    def handle_errors(batch):
-        errors = [b for b in batch if isinstance(b, Exception)]
+    # The loader emits `(imgs, sample_ids)` batches, where `imgs` may be an
+    # Exception if the batch could not be loaded
+    def handle_errors(imgs):
+        errors = [img for img in imgs if isinstance(img, Exception)]
 
         if not errors:
             return None
@@ -563,42 +1128,33 @@ def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
 
     if model.ragged_batches:
 
-        def collate_fn(batch):
-            error = handle_errors(batch)
-            if error is not None:
-                return error
-
-            return batch  # return list
+        def collate_imgs(imgs):
+            return list(imgs)
 
     elif use_numpy:
 
-        def collate_fn(batch):
-            error = handle_errors(batch)
-            if error is not None:
-                return error
+        def collate_imgs(imgs):
+            return np.stack(imgs)
 
-            try:
-                return np.stack(batch)
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+    else:
 
-                return e
+        def collate_imgs(imgs):
+            return tud.dataloader.default_collate(imgs)
 
-    else:
+    def collate_fn(batch):
+        imgs, sample_ids = zip(*batch)
 
-        def collate_fn(batch):
-            error = handle_errors(batch)
-            if error is not None:
-                return error
+        error = handle_errors(imgs)
+        if error is not None:
+            return error, sample_ids
 
-            try:
-                return tud.dataloader.default_collate(batch)
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+        try:
+            return collate_imgs(imgs), sample_ids
+        except Exception as e:
+            if not skip_failures:
+                raise e
 
-                return e
+            return e, sample_ids
 
     if batch_size is None:
         batch_size = 1
@@ -618,6 +1174,7 @@ def compute_embeddings(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    embeddings_store=None,
     **trainer_kwargs,
 ):
     """Computes embeddings for the samples in the collection using the given
@@ -639,7 +1196,9 @@ def compute_embeddings(
     embeddings, i.e., :meth:`Model.has_embeddings` must return ``True``.
 
     If an ``embeddings_field`` is provided, the embeddings are saved to the
-    samples; otherwise, the embeddings are returned in-memory.
+    samples. If an ``embeddings_store`` is provided, the embeddings are
+    appended to an on-disk :class:`fiftyone.core.embeddings.EmbeddingsStore`
+    with that name. Otherwise, the embeddings are returned in-memory.
 
     Args:
         samples: a :class:`fiftyone.core.collections.SampleCollection`
@@ -650,10 +1209,13 @@ def compute_embeddings(
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+            Only applicable when using image models on image collections
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample. Only
             applicable to :class:`Model` instances
+        embeddings_store (None): the name of an embeddings store to which to
+            append the embeddings. Only applicable when computing one embedding
+            per sample with a :class:`Model`
         **trainer_kwargs: optional keyword arguments used to initialize the
             :mod:`Trainer <flash:flash.core.trainer>` when using Flash models.
             These can be used to, for example, configure the number of GPUs to
@@ -662,7 +1224,8 @@ def compute_embeddings(
     Returns:
         one of the following:
 
-        -   ``None``, if an ``embeddings_field`` is provided
+        -   ``None``, if an ``embeddings_field`` or ``embeddings_store`` is
+            provided
         -   a ``num_samples x num_dim`` array of embeddings, when computing
             embeddings for image/video collections with image/video models,
             respectively, and no ``embeddings_field`` is provided. If
@@ -677,6 +1240,28 @@ def compute_embeddings(
             contain arrays of embeddings for all frames 1, 2, ... until the
             error occurred, or ``None`` if no embeddings were computed at all
     """
+    if embeddings_store is not None:
+        if embeddings_field is not None:
+            raise ValueError(
+                "Only one of `embeddings_field` and `embeddings_store` may be "
+                "provided"
+            )
+
+        if _is_flash_model(model):
+            raise ValueError(
+                "Embeddings stores are not supported for Flash models"
+            )
+
+        if samples.media_type == fom.VIDEO and model.media_type == "image":
+            raise ValueError(
+                "Embeddings stores are not supported when computing frame "
+                "embeddings"
+            )
+
+        embeddings_store = foem.EmbeddingsStore(
+            samples._dataset, embeddings_store
+        )
+
     if _is_flash_model(model):
         return fouf.compute_flash_embeddings(
             samples,
@@ -712,9 +1297,10 @@ def compute_embeddings(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if num_workers is not None and samples.media_type != fom.IMAGE:
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for image "
+            "collections"
         )
 
     with contextlib.ExitStack() as context:
@@ -727,7 +1313,11 @@ def compute_embeddings(
 
         if samples.media_type == fom.VIDEO and model.media_type == "video":
             return _compute_video_embeddings(
-                samples, model, embeddings_field, skip_failures
+                samples,
+                model,
+                embeddings_field,
+                embeddings_store,
+                skip_failures,
             )
 
         batch_size = _parse_batch_size(batch_size, model, use_data_loader)
@@ -747,11 +1337,14 @@ def compute_embeddings(
                 samples, model, embeddings_field, skip_failures
             )
 
+        samples = _select_inference_fields(samples)
+
         if use_data_loader:
             return _compute_image_embeddings_data_loader(
                 samples,
                 model,
                 embeddings_field,
+                embeddings_store,
                 batch_size,
                 num_workers,
                 skip_failures,
@@ -759,180 +1352,155 @@ def compute_embeddings(
 
         if batch_size is not None:
             return _compute_image_embeddings_batch(
-                samples, model, embeddings_field, batch_size, skip_failures
-            )
-
-        return _compute_image_embeddings_single(
-            samples, model, embeddings_field, skip_failures
-        )
-
-
-def _compute_image_embeddings_single(
-    samples, model, embeddings_field, skip_failures
-):
-    embeddings = []
-    errors = []
-
-    with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            embedding = None
-
-            try:
-                img = etai.read(sample.filepath)
-                embedding = model.embed(img)[0]
-            except Exception as e:
-                if not skip_failures:
-                    raise e
-
-                errors.append((sample.filepath, e))
-
-            if embeddings_field:
-                sample[embeddings_field] = embedding
-                sample.save()
-            else:
-                embeddings.append(embedding)
-
-    if errors:
-        lines = [
-            "Image: %s:\nError: %s" % (filepath, str(e))
-            for filepath, e in errors
-        ]
-
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d images" % num_errors
-        else:
-            estr = "%d image" % num_errors
-
-        lines.append(
-            "Errors occurred while generating embeddings for %s. See above "
-            "for details." % estr
-        )
-
-        logger.warning("\n\n".join(lines))
-
-    if embeddings_field:
-        return None
-
-    if errors:
-        return embeddings  # may contain None, must return as list
-
-    return np.stack(embeddings)
-
-
-def _compute_image_embeddings_batch(
-    samples, model, embeddings_field, batch_size, skip_failures
-):
-    samples_loader = fou.iter_batches(samples, batch_size)
-
-    embeddings = []
-    errors = []
-
-    with fou.ProgressBar(samples) as pb:
-        for idx, sample_batch in enumerate(samples_loader, 1):
-            embeddings_batch = [None] * len(sample_batch)
-
-            try:
-                imgs = [etai.read(sample.filepath) for sample in sample_batch]
-                embeddings_batch = list(model.embed_all(imgs))  # list of 1D
-            except Exception as e:
-                if not skip_failures:
-                    raise e
-
-                errors.append((idx, e))
-
-            if embeddings_field:
-                for sample, embedding in zip(sample_batch, embeddings_batch):
-                    sample[embeddings_field] = embedding
-                    sample.save()
-            else:
-                embeddings.extend(embeddings_batch)
-
-            pb.update(len(sample_batch))
+                samples,
+                model,
+                embeddings_field,
+                embeddings_store,
+                batch_size,
+                num_workers,
+                skip_failures,
+            )
 
-    if errors:
-        lines = ["Batch: %s\nError: %s" % (idx, str(e)) for idx, e in errors]
+        return _compute_image_embeddings_single(
+            samples,
+            model,
+            embeddings_field,
+            embeddings_store,
+            num_workers,
+            skip_failures,
+        )
 
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d batches" % num_errors
-        else:
-            estr = "%d batch" % num_errors
 
-        lines.append(
-            "Errors occurred while generating embeddings for %s. See above "
-            "for details." % estr
-        )
+def _compute_image_embeddings_single(
+    samples,
+    model,
+    embeddings_field,
+    embeddings_store,
+    num_workers,
+    skip_failures,
+):
+    batches = _iter_decoded_batches(samples, 1, num_workers)
 
-        logger.warning("\n\n".join(lines))
+    return _compute_image_embeddings(
+        samples,
+        batches,
+        lambda imgs: [model.embed(imgs[0])[0]],
+        embeddings_field,
+        embeddings_store,
+        skip_failures,
+        single=True,
+    )
 
-    if embeddings_field:
-        return None
 
-    if errors:
-        return embeddings  # may contain None, must return as list
+def _compute_image_embeddings_batch(
+    samples,
+    model,
+    embeddings_field,
+    embeddings_store,
+    batch_size,
+    num_workers,
+    skip_failures,
+):
+    batches = _iter_decoded_batches(samples, batch_size, num_workers)
 
-    return np.stack(embeddings)
+    return _compute_image_embeddings(
+        samples,
+        batches,
+        lambda imgs: list(model.embed_all(imgs)),  # list of 1D
+        embeddings_field,
+        embeddings_store,
+        skip_failures,
+    )
 
 
 def _compute_image_embeddings_data_loader(
-    samples, model, embeddings_field, batch_size, num_workers, skip_failures
+    samples,
+    model,
+    embeddings_field,
+    embeddings_store,
+    batch_size,
+    num_workers,
+    skip_failures,
 ):
     data_loader = _make_data_loader(
         samples, model, batch_size, num_workers, skip_failures
     )
+    batches = (
+        (sample_ids, None, imgs, []) for imgs, sample_ids in data_loader
+    )
 
-    if embeddings_field:
-        samples_loader = fou.iter_batches(samples, batch_size)
-    else:
-        samples_loader = itertools.repeat([None] * batch_size)
+    return _compute_image_embeddings(
+        samples,
+        batches,
+        lambda imgs: list(model.embed_all(imgs)),  # list of 1D
+        embeddings_field,
+        embeddings_store,
+        skip_failures,
+    )
 
+
+def _compute_image_embeddings(
+    samples,
+    batches,
+    embed_fcn,
+    embeddings_field,
+    embeddings_store,
+    skip_failures,
+    single=False,
+):
     embeddings = []
     errors = []
 
-    with fou.ProgressBar(samples) as pb:
-        for idx, (sample_batch, imgs) in enumerate(
-            zip(samples_loader, data_loader), 1
-        ):
-            embeddings_batch = [None] * len(sample_batch)
+    if embeddings_field:
+        writer = _SamplesWriter(
+            samples, _make_set_field_fcn(embeddings_field), skip_failures
+        )
+    elif embeddings_store is not None:
+        writer = _EmbeddingsStoreWriter(embeddings_store)
+    else:
+        writer = None
+
+    with fou.ProgressBar(samples) as pb, contextlib.ExitStack() as context:
+        if writer is not None:
+            context.enter_context(writer)
+
+        for idx, batch in enumerate(batches, 1):
+            sample_ids, filepaths, imgs, read_errors = batch
+            key = filepaths[0] if single else idx
+            embeddings_batch = [None] * len(sample_ids)
 
             try:
                 if isinstance(imgs, Exception):
                     raise imgs
 
-                embeddings_batch = list(model.embed_all(imgs))  # list of 1D
+                if read_errors:
+                    if single or not skip_failures:
+                        raise read_errors[0][1]
+
+                    errors.extend(read_errors)
+
+                inds, outputs = _apply_to_readable(embed_fcn, imgs)
+                for i, embedding in zip(inds, outputs):
+                    embeddings_batch[i] = embedding
             except Exception as e:
                 if not skip_failures:
                     raise e
 
-                errors.append((idx, e))
+                errors.append((key, e))
 
-            if embeddings_field:
-                for sample, embedding in zip(sample_batch, embeddings_batch):
-                    sample[embeddings_field] = embedding
-                    sample.save()
+            if writer is not None:
+                writer.write(key, sample_ids, embeddings_batch)
             else:
                 embeddings.extend(embeddings_batch)
 
-            pb.update(len(sample_batch))
-
-    if errors:
-        lines = ["Batch: %s\nError: %s" % (idx, str(e)) for idx, e in errors]
-
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d batches" % num_errors
-        else:
-            estr = "%d batch" % num_errors
+            pb.update(len(sample_ids))
 
-        lines.append(
-            "Errors occurred while generating embeddings for %s. See above "
-            "for details." % estr
-        )
+    if writer is not None:
+        errors.extend(writer.errors)
 
-        logger.warning("\n\n".join(lines))
+    _log_batch_errors(errors, outputs="embeddings")
 
-    if embeddings_field:
+    if writer is not None:
         return None
 
     if errors:
@@ -1086,11 +1654,21 @@ def _compute_frame_embeddings_batch(
     return embeddings_dict
 
 
-def _compute_video_embeddings(samples, model, embeddings_field, skip_failures):
+def _compute_video_embeddings(
+    samples, model, embeddings_field, embeddings_store, skip_failures
+):
     embeddings = []
     errors = []
 
-    with fou.ProgressBar() as pb:
+    if embeddings_store is not None:
+        writer = _EmbeddingsStoreWriter(embeddings_store)
+    else:
+        writer = None
+
+    with fou.ProgressBar() as pb, contextlib.ExitStack() as context:
+        if writer is not None:
+            context.enter_context(writer)
+
         for sample in pb(samples):
             embedding = None
 
@@ -1107,6 +1685,8 @@ def _compute_video_embeddings(samples, model, embeddings_field, skip_failures):
             if embeddings_field:
                 sample[embeddings_field] = embedding
                 sample.save()
+            elif writer is not None:
+                writer.write(sample.filepath, [sample.id], [embedding])
             else:
                 embeddings.append(embedding)
 
@@ -1129,7 +1709,7 @@ def _compute_video_embeddings(samples, model, embeddings_field, skip_failures):
 
         logger.warning("\n\n".join(lines))
 
-    if embeddings_field:
+    if embeddings_field or writer is not None:
         return None
 
     if errors:
@@ -1196,8 +1776,8 @@ def compute_patch_embeddings(
 
         batch_size (None): an optional batch size to use, if the model supports
             batching
-        num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch models
+        num_workers (None): the number of workers to use when loading images
+            and extracting their patches. Only applicable to image collections
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample
 
@@ -1246,9 +1826,10 @@ def compute_patch_embeddings(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if num_workers is not None and samples.media_type != fom.IMAGE:
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for image "
+            "collections"
         )
 
     if samples.media_type == fom.VIDEO:
@@ -1289,20 +1870,6 @@ def compute_patch_embeddings(
                 skip_failures,
             )
 
-        if use_data_loader:
-            return _embed_patches_data_loader(
-                samples,
-                model,
-                patches_field,
-                embeddings_field,
-                force_square,
-                alpha,
-                handle_missing,
-                batch_size,
-                num_workers,
-                skip_failures,
-            )
-
         return _embed_patches(
             samples,
             model,
@@ -1312,6 +1879,8 @@ def compute_patch_embeddings(
             alpha,
             handle_missing,
             batch_size,
+            num_workers,
+            use_data_loader,
             skip_failures,
         )
 
@@ -1325,48 +1894,109 @@ def _embed_patches(
     alpha,
     handle_missing,
     batch_size,
+    num_workers,
+    use_data_loader,
     skip_failures,
 ):
+    ids, filepaths, labels = samples.values(["id", "filepath", patches_field])
+    filepaths_map = dict(zip(ids, filepaths))
+
+    # Patches are parsed up front so that images without patches (or whose
+    # patches are invalid) never need to be loaded
+    patches_list = []
+    missing = []
+    for _id, label in zip(ids, labels):
+        try:
+            patches = foup._parse_patches(
+                label, patches_field, handle_missing, "Sample '%s'" % _id
+            )
+        except Exception as e:
+            if not skip_failures:
+                raise e
+
+            patches = e
+
+        if isinstance(patches, fol.Detections):
+            patches_list.append((_id, patches))
+        else:
+            missing.append((_id, patches))
+
+    if use_data_loader:
+        data_loader = _make_patch_data_loader(
+            model,
+            [filepaths_map[_id] for _id, _ in patches_list],
+            [patches for _, patches in patches_list],
+            [_id for _id, _ in patches_list],
+            force_square,
+            alpha,
+            num_workers,
+            skip_failures,
+        )
+        sources = (
+            (sample_id, img_patches) for img_patches, sample_id in data_loader
+        )
+        collate_fcn = _make_patch_collate_fcn(model)
+    else:
+        sources = _iter_image_patches(
+            [(_id, filepaths_map[_id], p) for _id, p in patches_list],
+            force_square,
+            alpha,
+            num_workers,
+        )
+        collate_fcn = list
+
+    if batch_size is None:
+        batch_size = 1
+        embed_fcn = lambda patches: model.embed(patches[0])
+    else:
+        embed_fcn = model.embed_all
+
+    results = _iter_packed_patch_embeddings(
+        sources, batch_size, collate_fcn, embed_fcn, skip_failures
+    )
+
     embeddings_dict = {}
     errors = []
 
-    with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            embeddings = None
+    if embeddings_field:
+        writer = _SamplesWriter(
+            _select_inference_fields(samples),
+            _make_set_field_fcn(embeddings_field),
+            skip_failures,
+        )
+    else:
+        writer = None
 
-            try:
-                patches = foup.parse_patches(
-                    sample, patches_field, handle_missing=handle_missing
-                )
+    with fou.ProgressBar(total=len(ids)) as pb, contextlib.ExitStack() as ctx:
+        if writer is not None:
+            ctx.enter_context(writer)
 
-                if patches is not None:
-                    img = etai.read(sample.filepath)
+        for batch in itertools.chain(
+            fou.iter_batches(missing, _WRITE_BATCH_SIZE), results
+        ):
+            sample_ids = []
+            embeddings_batch = []
+            for sample_id, embeddings in batch:
+                if isinstance(embeddings, Exception):
+                    errors.append((filepaths_map[sample_id], embeddings))
+                    embeddings = None
 
-                    if batch_size is None:
-                        embeddings = _embed_patches_single(
-                            model, img, patches, force_square, alpha
-                        )
-                    else:
-                        embeddings = _embed_patches_batch(
-                            model,
-                            img,
-                            patches,
-                            force_square,
-                            alpha,
-                            batch_size,
-                        )
+                sample_ids.append(sample_id)
+                embeddings_batch.append(embeddings)
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+            if writer is not None:
+                writer.write(
+                    ", ".join(filepaths_map[_id] for _id in sample_ids),
+                    sample_ids,
+                    embeddings_batch,
+                )
+            else:
+                embeddings_dict.update(zip(sample_ids, embeddings_batch))
 
-                errors.append((sample.filepath, e))
+            pb.update(len(sample_ids))
 
-            if embeddings_field:
-                sample[embeddings_field] = embeddings
-                sample.save()
-            else:
-                embeddings_dict[sample.id] = embeddings
+    if writer is not None:
+        errors.extend(writer.errors)
 
     if errors:
         lines = [
@@ -1390,7 +2020,136 @@ def _embed_patches(
     if embeddings_field:
         return None
 
-    return embeddings_dict
+    return {_id: embeddings_dict.get(_id, None) for _id in ids}
+
+
+def _iter_image_patches(records, force_square, alpha, num_workers):
+    # Emits `(sample_id, patches)` tuples for the given
+    # `(sample_id, filepath, detections)` records, where the images are
+    # loaded and their patches extracted by a pool of worker threads. The
+    # patches are emitted as an Exception if they could not be extracted
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    num_workers = max(num_workers, 1)
+    records = iter(records)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending = deque()
+
+        def _submit():
+            record = next(records, None)
+            if record is None:
+                return False
+
+            sample_id, filepath, detections = record
+            future = executor.submit(
+                _extract_patches, filepath, detections, force_square, alpha
+            )
+            pending.append((sample_id, future))
+            return True
+
+        for _ in range(2 * num_workers):
+            if not _submit():
+                break
+
+        while pending:
+            sample_id, future = pending.popleft()
+            _submit()
+
+            try:
+                patches = future.result()
+            except Exception as e:
+                patches = e
+
+            yield sample_id, patches
+
+
+def _extract_patches(filepath, detections, force_square, alpha):
+    img = etai.read(filepath)
+    return [
+        foup.extract_patch(
+            img, detection, force_square=force_square, alpha=alpha
+        )
+        for detection in detections.detections
+    ]
+
+
+def _iter_packed_patch_embeddings(
+    sources, batch_size, collate_fcn, embed_fcn, skip_failures
+):
+    # Packs the patches emitted by `sources` into batches of `batch_size`
+    # patches, which may span multiple images, embeds them, and emits lists of
+    # `(sample_id, embeddings)` tuples for the samples whose patches have all
+    # been embedded after each batch. Samples whose patches could not be
+    # loaded or embedded are emitted with an Exception in place of their
+    # embeddings
+    pending = deque()  # [sample_id, num_remaining, chunks, error]
+    patches_buffer = []
+
+    def _embed(num_patches):
+        batch = patches_buffer[:num_patches]
+        del patches_buffer[:num_patches]
+
+        try:
+            embeddings = embed_fcn(collate_fcn(batch))
+            error = None
+        except Exception as e:
+            if not skip_failures:
+                raise e
+
+            embeddings = None
+            error = e
+
+        completed = []
+        start = 0
+        while start < num_patches:
+            entry = pending[0]
+            count = min(entry[1], num_patches - start)
+
+            if error is not None:
+                entry[3] = error
+            elif entry[3] is None:
+                entry[2].append(embeddings[start : (start + count)])
+
+            entry[1] -= count
+            start += count
+
+            if entry[1] == 0:
+                pending.popleft()
+                sample_id, _, chunks, _error = entry
+                if _error is not None:
+                    completed.append((sample_id, _error))
+                else:
+                    completed.append((sample_id, np.concatenate(chunks)))
+
+        return completed
+
+    for sample_id, patches in sources:
+        if isinstance(patches, Exception):
+            if not skip_failures:
+                raise patches
+
+            yield [(sample_id, patches)]
+            continue
+
+        patches = list(patches)
+        if not patches:
+            yield [(sample_id, None)]
+            continue
+
+        pending.append([sample_id, len(patches), [], None])
+        patches_buffer.extend(patches)
+
+        completed = []
+        while len(patches_buffer) >= batch_size:
+            completed.extend(_embed(batch_size))
+
+        if completed:
+            yield completed
+
+    if patches_buffer:
+        yield _embed(len(patches_buffer))
 
 
 def _embed_patches_single(model, img, detections, force_square, alpha):
@@ -1422,87 +2181,6 @@ def _embed_patches_batch(
     return np.concatenate(embeddings)
 
 
-def _embed_patches_data_loader(
-    samples,
-    model,
-    patches_field,
-    embeddings_field,
-    force_square,
-    alpha,
-    handle_missing,
-    batch_size,
-    num_workers,
-    skip_failures,
-):
-    data_loader = _make_patch_data_loader(
-        samples,
-        model,
-        patches_field,
-        force_square,
-        alpha,
-        handle_missing,
-        num_workers,
-        skip_failures,
-    )
-
-    embeddings_dict = {}
-    errors = []
-
-    with fou.ProgressBar(samples) as pb:
-        for idx, (sample, patches) in pb(
-            enumerate(zip(samples, data_loader), 1)
-        ):
-            embeddings = None
-
-            try:
-                if isinstance(patches, Exception):
-                    raise patches
-
-                if patches is not None:
-                    embeddings = []
-                    for patches_batch in fou.iter_slices(patches, batch_size):
-                        embeddings_batch = model.embed_all(patches_batch)
-                        embeddings.append(embeddings_batch)
-
-                    embeddings = np.concatenate(embeddings)
-
-            except Exception as e:
-                if not skip_failures:
-                    raise e
-
-                errors.append((idx, e))
-
-            if embeddings_field:
-                sample[embeddings_field] = embeddings
-                sample.save()
-            else:
-                embeddings_dict[sample.id] = embeddings
-
-    if errors:
-        lines = [
-            "Image: %s:\nError: %s" % (filepath, str(e))
-            for filepath, e in errors
-        ]
-
-        num_errors = len(errors)
-        if num_errors > 1:
-            estr = "%d batches" % num_errors
-        else:
-            estr = "%d batch" % num_errors
-
-        lines.append(
-            "Errors occurred while generating embeddings for %s. See above "
-            "for details." % estr
-        )
-
-        logger.warning("\n\n".join(lines))
-
-    if embeddings_field:
-        return None
-
-    return embeddings_dict
-
-
 def _embed_frame_patches(
     samples,
     model,
@@ -1595,12 +2273,12 @@ def _embed_frame_patches(
 
 
 def _make_patch_data_loader(
-    samples,
     model,
-    patches_field,
+    filepaths,
+    patches,
+    sample_ids,
     force_square,
     alpha,
-    handle_missing,
     num_workers,
     skip_failures,
 ):
@@ -1612,19 +2290,11 @@ def _make_patch_data_loader(
     if num_workers is None:
         num_workers = fout.recommend_num_workers()
 
-    image_paths = []
-    detections = []
-    for sample in samples.select_fields(patches_field):
-        patches = foup.parse_patches(
-            sample, patches_field, handle_missing=handle_missing
-        )
-        image_paths.append(sample.filepath)
-        detections.append(patches)
-
     dataset = fout.TorchImagePatchesDataset(
-        image_paths,
-        detections,
+        filepaths,
+        patches,
         transform=model.transforms,
+        sample_ids=sample_ids,
         ragged_batches=model.ragged_batches,
         use_numpy=use_numpy,
         force_rgb=True,
@@ -1633,14 +2303,26 @@ def _make_patch_data_loader(
         skip_failures=skip_failures,
     )
 
+    # The loader emits `(patches, sample_id)` tuples for each image, whose
+    # patches are then packed into batches by the caller
     return tud.DataLoader(
         dataset,
         batch_size=1,
         num_workers=num_workers,
-        collate_fn=lambda batch: batch[0],  # return patches directly
+        collate_fn=lambda batch: batch[0],
     )
 
 
+def _make_patch_collate_fcn(model):
+    if model.ragged_batches:
+        return list
+
+    if not isinstance(model, TorchModelMixin):
+        return np.stack
+
+    return tud.dataloader.default_collate
+
+
 def _parse_batch_size(batch_size, model, use_data_loader):
     if batch_size is None:
         batch_size = fo.config.default_batch_size
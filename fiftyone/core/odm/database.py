@@ -5,11 +5,11 @@ Database utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from itertools import repeat
 import logging
-from multiprocessing.pool import ThreadPool
 import os
+import threading
 
 import asyncio
 from bson import json_util
@@ -21,6 +21,7 @@ from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
 
 import eta.core.utils as etau
 
+import fiftyone as fo
 import fiftyone.constants as foc
 from fiftyone.core.config import FiftyOneConfigError
 import fiftyone.core.service as fos
@@ -34,6 +35,8 @@ _client = None
 _async_client = None
 _connection_kwargs = {}
 _db_service = None
+_aggregation_executor = None
+_aggregation_executor_lock = threading.Lock()
 
 
 _PERMANENT_COLLS = {"datasets", "fs.files", "fs.chunks"}
@@ -140,8 +143,10 @@ def _validate_db_version(config, client):
 def aggregate(collection, pipelines):
     """Executes one or more aggregations on a collection.
 
-    Multiple aggregations are executed using multiple threads, and their
-    results are returned as lists rather than cursors.
+    Multiple aggregations are executed in parallel using a thread pool that
+    is shared across calls and whose size can be configured via
+    ``fiftyone.config.max_aggregation_workers``, and their results are
+    returned as lists rather than cursors.
 
     Args:
         collection: a ``pymongo.collection.Collection`` or
@@ -180,12 +185,31 @@ def aggregate(collection, pipelines):
 def _do_pooled_aggregate(collection, pipelines):
     # @todo: MongoDB 5.0 supports snapshots which can be used to make the
     # results consistent, i.e. read from the same point in time
-    with ThreadPool(processes=len(pipelines)) as pool:
-        return pool.map(
-            lambda p: list(collection.aggregate(p, allowDiskUse=True)),
-            pipelines,
-            chunksize=1,
-        )
+    executor = _get_aggregation_executor()
+    futures = [
+        executor.submit(_do_aggregate, collection, pipeline)
+        for pipeline in pipelines
+    ]
+    return [future.result() for future in futures]
+
+
+def _do_aggregate(collection, pipeline):
+    return list(collection.aggregate(pipeline, allowDiskUse=True))
+
+
+def _get_aggregation_executor():
+    global _aggregation_executor
+
+    # The executor is shared by all aggregations in the process so that we
+    # don't pay the cost of spawning and joining threads on every call
+    with _aggregation_executor_lock:
+        if _aggregation_executor is None:
+            _aggregation_executor = ThreadPoolExecutor(
+                max_workers=fo.config.max_aggregation_workers,
+                thread_name_prefix="fiftyone-aggregation",
+            )
+
+        return _aggregation_executor
 
 
 async def _do_async_pooled_aggregate(collection, pipelines):
@@ -190,6 +190,7 @@ class DatasetDocument(Document):
     media_type = StringField()
     name = StringField(unique=True, required=True)
     sample_collection_name = StringField(unique=True, required=True)
+    summary_collection_name = StringField(null=True)
     persistent = BooleanField(default=False)
     info = DictField()
     annotation_runs = DictField(
@@ -197,6 +198,7 @@ class DatasetDocument(Document):
     )
     brain_methods = DictField(EmbeddedDocumentField(document_type=RunDocument))
     evaluations = DictField(EmbeddedDocumentField(document_type=RunDocument))
+    embeddings_stores = DictField()
     sample_fields = EmbeddedDocumentListField(
         document_type=SampleFieldDocument
     )
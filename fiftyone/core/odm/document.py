@@ -12,6 +12,7 @@ import re
 from bson import json_util, ObjectId
 import mongoengine
 import pymongo
+from pymongo import UpdateOne
 
 import fiftyone.core.utils as fou
 
@@ -404,6 +405,29 @@ class Document(BaseDocument, mongoengine.Document):
         Returns:
             self
         """
+        self._save(validate=validate, clean=clean, **kwargs)
+        return self
+
+    def _save(self, deferred=False, validate=True, clean=True, **kwargs):
+        """Saves the :class:`Document` to the database, optionally deferring
+        the writes to an existing document.
+
+        When ``deferred`` is True, the updates to an existing document are not
+        performed but are instead returned as a list of ``pymongo`` operations
+        that the caller must execute, e.g., via
+        :meth:`fiftyone.core.odm.database.bulk_write`. New documents are always
+        inserted immediately.
+
+        Args:
+            deferred (False): whether to defer updates to existing documents
+            validate (True): validates the document
+            clean (True): call the document's clean method; requires
+                ``validate`` to be True
+
+        Returns:
+            a list of ``pymongo`` operations, which is empty unless
+            ``deferred`` is True and the document has pending updates
+        """
         # pylint: disable=no-member
         if self._meta.get("abstract"):
             raise mongoengine.InvalidDocumentError(
@@ -423,6 +447,8 @@ class Document(BaseDocument, mongoengine.Document):
         if self._meta.get("auto_create_index", True):
             self.ensure_indexes()
 
+        ops = []
+
         try:
             # Save a new document or update an existing one
             if created:
@@ -458,7 +484,9 @@ class Document(BaseDocument, mongoengine.Document):
                 if removals:
                     update_doc["$unset"] = removals
 
-                if update_doc:
+                if update_doc and deferred:
+                    ops = self._get_update_ops(object_id, update_doc, **kwargs)
+                elif update_doc:
                     updated_existing = self._update(
                         object_id, update_doc, **kwargs
                     )
@@ -491,7 +519,7 @@ class Document(BaseDocument, mongoengine.Document):
         self._clear_changed_fields()
         self._created = False
 
-        return self
+        return ops
 
     def _update(self, object_id, update_doc, **kwargs):
         """Updates an existing document.
@@ -511,6 +539,14 @@ class Document(BaseDocument, mongoengine.Document):
 
         return updated_existing
 
+    def _get_update_ops(self, object_id, update_doc, **kwargs):
+        """Returns the list of ``pymongo`` operations that perform the given
+        update to an existing document.
+
+        Helper method; should only be used by :meth:`Document._save`.
+        """
+        return [UpdateOne({"_id": object_id}, update_doc, upsert=True)]
+
 
 class DynamicDocument(BaseDocument, mongoengine.DynamicDocument):
     """Base class for dynamic documents that are stored in a MongoDB
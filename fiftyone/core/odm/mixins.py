@@ -14,6 +14,7 @@ import six
 from bson import json_util
 from bson.binary import Binary
 import numpy as np
+from pymongo import UpdateOne
 
 import fiftyone as fo
 import fiftyone.core.fields as fof
@@ -204,6 +205,9 @@ class DatasetMixin(object):
     subtypes that are backed by a dataset.
     """
 
+    # Incremented whenever fields are declared, renamed, or deleted
+    _schema_version = 0
+
     def __setattr__(self, name, value):
         if name in self._fields and value is not None:
             self._fields[name].validate(value)
@@ -719,6 +723,7 @@ class DatasetMixin(object):
 
         cls._fields[field.name] = field
         cls._fields_ordered += (field.name,)
+        cls._schema_version += 1
 
         try:
             if issubclass(cls, SampleDocument):
@@ -766,6 +771,7 @@ class DatasetMixin(object):
             (fn if fn != field_name else new_field_name)
             for fn in cls._fields_ordered
         )
+        cls._schema_version += 1
         delattr(cls, field_name)
 
         try:
@@ -802,6 +808,7 @@ class DatasetMixin(object):
         cls._fields_ordered = tuple(
             fn for fn in cls._fields_ordered if fn != field_name
         )
+        cls._schema_version += 1
         delattr(cls, field_name)
 
         dataset_doc = cls._dataset_doc()
@@ -855,6 +862,38 @@ class DatasetMixin(object):
 
         return updated_existing
 
+    def _get_update_ops(
+        self, object_id, update_doc, filtered_fields=None, **kwargs
+    ):
+        """Returns the list of ``pymongo`` operations that perform the given
+        update to an existing document.
+
+        Helper method; should only be used inside
+        :meth:`DatasetSampleDocument.save`.
+        """
+        select_dict = {"_id": object_id}
+
+        extra_updates = self._extract_extra_updates(
+            update_doc, filtered_fields
+        )
+
+        ops = []
+
+        if update_doc:
+            ops.append(UpdateOne(select_dict, update_doc, upsert=True))
+
+        for update, element_id in extra_updates:
+            ops.append(
+                UpdateOne(
+                    select_dict,
+                    update,
+                    array_filters=[{"element._id": element_id}],
+                    upsert=True,
+                )
+            )
+
+        return ops
+
     def _extract_extra_updates(self, update_doc, filtered_fields):
         """Extracts updates for filtered list fields that need to be updated
         by ID, not relative position (index).
@@ -91,6 +91,8 @@ class _PatchesView(fov.DatasetView):
         self._patches_stage = patches_stage
         self._patches_dataset = patches_dataset
         self.__stages = _stages
+        self._compiled_pipeline = None
+        self._cached_count = None
 
     def __copy__(self):
         return self.__class__(
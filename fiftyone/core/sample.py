@@ -163,6 +163,18 @@ class _SampleMixin(object):
                 encountered to the dataset schema. If False, an error is raised
                 if any fields are not in the dataset schema
         """
+        self._add_labels(
+            labels,
+            label_field,
+            confidence_thresh=confidence_thresh,
+            expand_schema=expand_schema,
+        )
+
+        self.save()
+
+    def _add_labels(
+        self, labels, label_field, confidence_thresh=None, expand_schema=True
+    ):
         if label_field:
             label_key = lambda k: label_field + "_" + k
         else:
@@ -209,8 +221,6 @@ class _SampleMixin(object):
             # Single sample-level field
             self.set_field(label_field, labels, create=expand_schema)
 
-        self.save()
-
     def merge(
         self,
         sample,
@@ -458,6 +468,9 @@ class Sample(_SampleMixin, Document, metaclass=SampleSingleton):
 
     def save(self):
         """Saves the sample to the database."""
+        self._save()
+
+    def _save(self, deferred=False):
         if not self._in_db:
             raise ValueError(
                 "Cannot save a sample that has not been added to a dataset"
@@ -466,7 +479,7 @@ class Sample(_SampleMixin, Document, metaclass=SampleSingleton):
         if self.media_type == fomm.VIDEO:
             self.frames.save()
 
-        super().save()
+        return super()._save(deferred=deferred)
 
     @classmethod
     def from_frame(cls, frame, filepath):
@@ -603,10 +616,13 @@ class SampleView(_SampleMixin, DocumentView):
             This will permanently delete any omitted or filtered contents from
             the source dataset.
         """
+        self._save()
+
+    def _save(self, deferred=False):
         if self.media_type == fomm.VIDEO:
             self.frames.save()
 
-        super().save()
+        return super()._save(deferred=deferred)
 
 
 def _apply_confidence_thresh(label, confidence_thresh):
@@ -5,6 +5,7 @@ Defines the shared state between the FiftyOne App and backend.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import defaultdict
 import logging
 
 import eta.core.serial as etas
@@ -165,6 +166,7 @@ class DatasetStatistics(object):
 
     def __init__(self, view, filters=None):
         self._aggregations = self._build(view, filters)
+        self._dependencies = self._build_dependencies(self._aggregations)
 
     @property
     def aggregations(self):
@@ -173,6 +175,25 @@ class DatasetStatistics(object):
         """
         return self._aggregations
 
+    def get_dependent_aggregations(self, paths):
+        """Returns the indexes of the aggregations in :attr:`aggregations`
+        whose results depend on the given field paths, i.e., the aggregations
+        that must be recomputed after the values of the paths are modified.
+
+        Args:
+            paths: an iterable of field paths
+
+        Returns:
+            a sorted list of indexes
+        """
+        inds = set()
+        for path in paths:
+            for agg_path, agg_inds in self._dependencies.items():
+                if agg_path == path or agg_path.startswith(path + "."):
+                    inds.update(agg_inds)
+
+        return sorted(inds)
+
     @classmethod
     def fields(cls, collection):
         """Returns the list of filterable fields on the provided
@@ -284,6 +305,15 @@ class DatasetStatistics(object):
 
         return aggregations
 
+    @staticmethod
+    def _build_dependencies(aggregations):
+        dependencies = defaultdict(list)
+        for idx, agg in enumerate(aggregations):
+            if agg.field_name is not None:
+                dependencies[agg.field_name].append(idx)
+
+        return dict(dependencies)
+
 
 def _expand_labels_path(root, label_field):
     if issubclass(label_field.document_type, fol._HasLabelList):
@@ -0,0 +1,503 @@
+"""
+Materialized dataset summaries.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import numbers
+
+from pymongo import UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
+
+import fiftyone.core.aggregations as foa
+import fiftyone.core.odm as foo
+import fiftyone.core.utils as fou
+
+fost = fou.lazy_import("fiftyone.core.state")
+
+
+logger = logging.getLogger(__name__)
+
+
+_FRAMES_PREFIX = "frames."
+_MERGEABLE_VALUES_SUFFIXES = (".label", ".tags")
+
+
+class DatasetSummary(object):
+    """A materialized summary of the statistics that the App computes for the
+    unfiltered contents of a dataset.
+
+    The summary is stored in a collection alongside the dataset's samples,
+    with one document per aggregation. It is maintained incrementally by the
+    dataset's write methods: the statistics of added and deleted samples are
+    merged into the stored results where possible, and edits to fields mark
+    only the results that depend on those fields as stale. Stale results are
+    recomputed the next time they are requested.
+
+    Each document carries a version that is incremented whenever it changes,
+    and all read-modify-write updates are conditioned on the version that was
+    read, so concurrent writers never store outdated results; a conflicting
+    update simply leaves the result stale.
+
+    Args:
+        dataset: a :class:`fiftyone.core.dataset.Dataset`
+    """
+
+    def __init__(self, dataset):
+        self._dataset = dataset
+
+    @property
+    def _collection(self):
+        conn = foo.get_db_conn()
+        return conn[self._dataset._doc.summary_collection_name]
+
+    def build(self):
+        """(Re)computes all results in the summary from scratch."""
+        self._collection.drop()
+        stats = fost.DatasetStatistics(self._dataset)
+        self.get_results(stats.aggregations)
+
+    def delete(self):
+        """Deletes the summary from the database."""
+        self._collection.drop()
+
+    def get_results(self, aggregations):
+        """Returns the results of the given aggregations on the dataset,
+        reading them from the summary where possible.
+
+        Aggregations whose results are missing or stale are computed in a
+        single pass and stored. Aggregations that cannot be summarized are
+        computed but not stored.
+
+        Args:
+            aggregations: a list of
+                :class:`fiftyone.core.aggregations.Aggregation` instances
+
+        Returns:
+            a list of aggregation results
+        """
+        coll = self._collection
+        keys = [_get_key(agg) for agg in aggregations]
+        docs = _find_docs(coll, [k for k in keys if k is not None])
+
+        results = [None] * len(aggregations)
+        stale = []
+        for idx, (agg, key) in enumerate(zip(aggregations, keys)):
+            doc = docs.get(key, None)
+            if (
+                doc is not None
+                and not doc["dirty"]
+                and _is_compatible(agg, doc)
+            ):
+                results[idx] = _parse_doc(agg, doc)
+            else:
+                stale.append(idx)
+
+        if not stale:
+            return results
+
+        # Placeholders are inserted for missing results so that writes that
+        # occur while the results are being computed can invalidate them
+        new_aggs = {
+            keys[idx]: aggregations[idx]
+            for idx in stale
+            if keys[idx] is not None and keys[idx] not in docs
+        }
+        if new_aggs:
+            _insert_placeholders(coll, new_aggs)
+            docs.update(_find_docs(coll, list(new_aggs.keys())))
+
+        _results = self._dataset.aggregate(
+            [_make_summary_aggregation(aggregations[idx]) for idx in stale]
+        )
+
+        ops = []
+        for idx, result in zip(stale, _results):
+            agg = aggregations[idx]
+            key = keys[idx]
+
+            content = _make_content(agg, result)
+            results[idx] = _parse_doc(agg, content)
+
+            doc = docs.get(key, None)
+            if doc is not None:
+                ops.append(_make_update(doc, content))
+
+        _bulk_write(coll, ops)
+
+        return results
+
+    def invalidate(self, paths=None):
+        """Marks the results that depend on the given field paths as stale.
+
+        Args:
+            paths (None): an iterable of modified field paths, with frame
+                fields prefixed by ``"frames."``. By default, all results are
+                marked as stale
+        """
+        if paths is None:
+            query = {}
+        else:
+            roots = set(_get_root(path) for path in paths)
+
+            if not roots:
+                return
+
+            query = {"paths": {"$in": sorted(roots)}}
+
+        self._collection.update_many(query, _INVALIDATE)
+
+    def get_mergeable_docs(self):
+        """Returns the summary documents that are not stale.
+
+        These documents must be read *before* samples are added or deleted,
+        so that the version checks performed by :meth:`apply_deltas` detect
+        any concurrent updates.
+
+        Returns:
+            a list of documents
+        """
+        return list(self._collection.find({"dirty": False}))
+
+    def compute_deltas(self, docs, sample_ids, remove=False):
+        """Computes the contributions of the given samples to the results in
+        the given summary documents.
+
+        When samples are deleted, this method must be called before they are
+        deleted.
+
+        Args:
+            docs: a list of documents returned by :meth:`get_mergeable_docs`
+            sample_ids: a list of sample IDs
+            remove (False): whether the samples are being removed
+
+        Returns:
+            a list of deltas, with ``None`` for results that cannot be merged
+        """
+        inds = []
+        aggregations = []
+        for idx, doc in enumerate(docs):
+            agg = _make_delta_aggregation(doc, remove)
+            if agg is not None:
+                inds.append(idx)
+                aggregations.append(agg)
+
+        deltas = [None] * len(docs)
+        if not aggregations:
+            return deltas
+
+        view = self._dataset.select(sample_ids)
+        for idx, result in zip(inds, view.aggregate(aggregations)):
+            deltas[idx] = result
+
+        return deltas
+
+    def apply_deltas(self, docs, deltas, remove=False):
+        """Merges the given deltas into the summary.
+
+        Results that cannot be merged, or whose documents were modified
+        since they were read, are marked as stale.
+
+        Args:
+            docs: a list of documents returned by :meth:`get_mergeable_docs`
+            deltas: the list of deltas returned by :meth:`compute_deltas`
+            remove (False): whether the samples were removed
+        """
+        coll = self._collection
+
+        ops = []
+        invalid_keys = []
+        for doc, delta in zip(docs, deltas):
+            if delta is None:
+                invalid_keys.append(doc["_id"])
+            else:
+                content = _merge_content(doc, delta, remove)
+                ops.append(_make_update(doc, content))
+
+        if invalid_keys:
+            coll.update_many({"_id": {"$in": invalid_keys}}, _INVALIDATE)
+
+        _bulk_write(coll, ops)
+
+
+def get_update_paths(ops, frames=False):
+    """Returns the field paths modified by the given ``pymongo`` operations.
+
+    Args:
+        ops: a list of ``pymongo`` operations
+        frames (False): whether the operations are applied to a frames
+            collection, in which case the paths are prefixed by
+            ``"frames."``
+
+    Returns:
+        a set of field paths, or None if the operations may modify arbitrary
+        fields, e.g., because they insert or replace samples
+    """
+    paths = set()
+    for op in ops:
+        if not isinstance(op, (UpdateOne, UpdateMany)):
+            return None
+
+        update = op._doc
+        if not isinstance(update, dict):
+            return None
+
+        if op._upsert and set(op._filter.keys()) != {"_id"}:
+            # Upserts may insert new documents. Upserts by ID are only used
+            # to save documents that are already in the dataset
+            if not frames:
+                return None
+
+            paths.add("frames")
+
+        for operator, fields in update.items():
+            if not operator.startswith("$") or not isinstance(fields, dict):
+                return None
+
+            for path in fields.keys():
+                root = path.split(".", 1)[0]
+                paths.add(_FRAMES_PREFIX + root if frames else root)
+
+    return paths
+
+
+_INVALIDATE = {"$set": {"dirty": True}, "$inc": {"version": 1}}
+
+
+def _get_key(agg):
+    if not _is_summarizable(agg):
+        return None
+
+    return "%s:%s" % (type(agg).__name__, agg.field_name or "")
+
+
+def _is_summarizable(agg):
+    if type(agg) not in (foa.Count, foa.Bounds, foa.CountValues):
+        return False
+
+    if agg.expr is not None:
+        return False
+
+    if isinstance(agg, foa.CountValues) and agg._include is not None:
+        return False
+
+    return True
+
+
+def _is_mergeable_values(field_name):
+    if field_name is None:
+        return False
+
+    return field_name == "tags" or field_name.endswith(
+        _MERGEABLE_VALUES_SUFFIXES
+    )
+
+
+def _get_root(path):
+    # The top-level sample or frame field of the path
+    if path is None:
+        return ""
+
+    if path.startswith(_FRAMES_PREFIX):
+        name = path[len(_FRAMES_PREFIX) :].split(".", 1)[0]
+        return _FRAMES_PREFIX + name
+
+    return path.split(".", 1)[0]
+
+
+def _get_dependencies(field_name):
+    # The paths whose modification invalidates an aggregation on the field.
+    # All frame-level results depend on "frames"
+    root = _get_root(field_name)
+    if root.startswith(_FRAMES_PREFIX):
+        return ["frames", root]
+
+    return [root]
+
+
+def _get_params(agg):
+    return [agg._first, agg._sort_by, agg._order]
+
+
+def _is_compatible(agg, doc):
+    if "params" in doc:
+        return doc["params"] == _get_params(agg)
+
+    return True
+
+
+def _make_summary_aggregation(agg):
+    if isinstance(agg, foa.CountValues) and _is_mergeable_values(
+        agg.field_name
+    ):
+        return foa.CountValues(agg.field_name)
+
+    return agg
+
+
+def _make_delta_aggregation(doc, remove):
+    cls = doc["cls"]
+    field_name = doc["field"]
+
+    if cls == "Count":
+        return foa.Count(field_name)
+
+    if cls == "Bounds" and not remove:
+        return foa.Bounds(field_name)
+
+    if cls == "CountValues" and "counts" in doc:
+        return foa.CountValues(field_name)
+
+    return None
+
+
+def _make_content(agg, result):
+    content = {"cls": type(agg).__name__, "field": agg.field_name}
+
+    if isinstance(agg, foa.CountValues):
+        if _is_mergeable_values(agg.field_name):
+            content["counts"] = [[k, v] for k, v in result.items()]
+        else:
+            content["result"] = list(result)
+            content["params"] = _get_params(agg)
+    elif isinstance(agg, foa.Bounds):
+        content["result"] = list(result)
+    else:
+        content["result"] = result
+
+    return content
+
+
+def _parse_doc(agg, doc):
+    if "counts" in doc:
+        return _parse_counts(agg, doc["counts"])
+
+    result = doc["result"]
+    if isinstance(result, list):
+        return tuple(result)
+
+    return result
+
+
+def _parse_counts(agg, counts):
+    # Emulates the sorting and truncation that CountValues performs
+    # server-side
+    if agg._first is None:
+        return {k: v for k, v in counts}
+
+    if agg._sort_by == "count":
+        key = lambda kv: (kv[1], _sort_key(kv[0]))
+    else:
+        key = lambda kv: (_sort_key(kv[0]), kv[1])
+
+    items = sorted(counts, key=key, reverse=agg._order == -1)
+    items = items[: agg._first]
+
+    return len(items), [[k, v] for k, v in items if k is not None]
+
+
+def _sort_key(value):
+    # Approximates MongoDB's comparison order for BSON types
+    if value is None:
+        return 0, 0
+
+    if isinstance(value, bool):
+        return 4, value
+
+    if isinstance(value, numbers.Number):
+        return 1, value
+
+    if isinstance(value, str):
+        return 2, value
+
+    return 3, str(value)
+
+
+def _merge_content(doc, delta, remove):
+    content = {"cls": doc["cls"], "field": doc["field"]}
+    sign = -1 if remove else 1
+
+    if "counts" in doc:
+        counts = {k: v for k, v in doc["counts"]}
+        for k, v in delta.items():
+            counts[k] = counts.get(k, 0) + sign * v
+
+        content["counts"] = [[k, v] for k, v in counts.items() if v > 0]
+    elif doc["cls"] == "Bounds":
+        content["result"] = [
+            _merge_bound(doc["result"][0], delta[0], min),
+            _merge_bound(doc["result"][1], delta[1], max),
+        ]
+    else:
+        content["result"] = doc["result"] + sign * delta
+
+    return content
+
+
+def _merge_bound(a, b, func):
+    if a is None:
+        return b
+
+    if b is None:
+        return a
+
+    return func(a, b)
+
+
+def _make_update(doc, content):
+    update = dict(content)
+    update["paths"] = _get_dependencies(doc["field"])
+    update["dirty"] = False
+    return UpdateOne(
+        {"_id": doc["_id"], "version": doc["version"]},
+        {"$set": update, "$inc": {"version": 1}},
+    )
+
+
+def _find_docs(coll, keys):
+    if not keys:
+        return {}
+
+    return {d["_id"]: d for d in coll.find({"_id": {"$in": keys}})}
+
+
+def _insert_placeholders(coll, aggs_by_key):
+    ops = [
+        UpdateOne(
+            {"_id": key},
+            {
+                "$setOnInsert": {
+                    "cls": type(agg).__name__,
+                    "field": agg.field_name,
+                    "paths": _get_dependencies(agg.field_name),
+                    "dirty": True,
+                    "version": 0,
+                }
+            },
+            upsert=True,
+        )
+        for key, agg in aggs_by_key.items()
+    ]
+
+    _bulk_write(coll, ops)
+
+
+def _bulk_write(coll, ops):
+    if not ops:
+        return
+
+    try:
+        result = coll.bulk_write(ops, ordered=False)
+        num_matched = result.matched_count + result.upserted_count
+    except BulkWriteError as bwe:
+        # Duplicate placeholders from concurrent readers are expected
+        num_matched = len(ops)
+        logger.debug("Summary write errors: %s", bwe.details)
+
+    if num_matched < len(ops):
+        # Some documents were concurrently modified, so we can't tell which
+        # updates were applied. The affected results are invalidated
+        keys = [op._filter["_id"] for op in ops]
+        coll.update_many({"_id": {"$in": keys}}, _INVALIDATE)
@@ -88,6 +88,8 @@ class FramesView(fov.DatasetView):
         self._frames_stage = frames_stage
         self._frames_dataset = frames_dataset
         self.__stages = _stages
+        self._compiled_pipeline = None
+        self._cached_count = None
 
     def __copy__(self):
         return self.__class__(
@@ -249,6 +251,7 @@ class FramesView(fov.DatasetView):
         self._source_collection._dataset._frame_collection.update_one(
             match, {"$set": updates}
         )
+        self._source_collection._dataset._mark_modified()
 
     def _sync_source(self, fields=None, ids=None):
         default_fields = set(
@@ -310,6 +313,7 @@ class FramesView(fov.DatasetView):
             )
 
         self._frames_dataset._aggregate(pipeline=pipeline)
+        self._source_collection._dataset._mark_modified()
 
     def _sync_source_schema(self, fields=None, delete=False):
         schema = self.get_field_schema()
@@ -7,7 +7,9 @@ Dataset views.
 """
 from collections import OrderedDict
 from copy import copy, deepcopy
+import logging
 import numbers
+import timeit
 
 from bson import ObjectId
 from pymongo.errors import CursorNotFound
@@ -23,6 +25,9 @@ import fiftyone.core.stages as fost
 import fiftyone.core.utils as fou
 
 
+logger = logging.getLogger(__name__)
+
+
 class DatasetView(foc.SampleCollection):
     """A view into a :class:`fiftyone.core.dataset.Dataset`.
 
@@ -58,6 +63,8 @@ class DatasetView(foc.SampleCollection):
 
         self.__dataset = dataset
         self.__stages = _stages
+        self._compiled_pipeline = None
+        self._cached_count = None
 
     def __eq__(self, other_view):
         if type(other_view) != type(self):
@@ -70,7 +77,32 @@ class DatasetView(foc.SampleCollection):
         return d == other_d
 
     def __len__(self):
-        return self.count()
+        """Returns the number of samples in the view.
+
+        The length is cached until the view's stages or the contents of the
+        underlying dataset change. Only modifications made by this process are
+        detected, so the cached length may be stale if the dataset was
+        modified elsewhere, e.g., by tagging samples in the App. Call
+        :meth:`reload` to invalidate the cache, or use :meth:`count` to always
+        compute an exact count.
+
+        Returns:
+            the number of samples
+        """
+        key = (
+            tuple(self._stages),
+            self._dataset._schema_version,
+            self._dataset._data_version,
+        )
+
+        cached_count = self._cached_count
+        if cached_count is not None and cached_count[0] == key:
+            return cached_count[1]
+
+        count = self.count()
+        self._cached_count = (key, count)
+
+        return count
 
     def __getitem__(self, id_filepath_slice):
         if isinstance(id_filepath_slice, numbers.Integral):
@@ -267,23 +299,36 @@ class DatasetView(foc.SampleCollection):
         """
         return copy(self)
 
-    def iter_samples(self, progress=False):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        batch_latency=None,
+    ):
         """Returns an iterator over the samples in the view.
 
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
+            autosave (False): whether to automatically save changes to samples
+                emitted by this iterator. The changes are saved in batches via
+                bulk database writes; see
+                :meth:`fiftyone.core.collections.SampleCollection.save_context`
+            batch_size (None): the maximum number of samples to save per batch
+                when ``autosave`` is True
+            batch_latency (None): the maximum number of seconds between batch
+                saves when ``autosave`` is True
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.SampleView` instances
         """
-        if progress:
-            with fou.ProgressBar(total=len(self)) as pb:
-                for sample in pb(self._iter_samples()):
-                    yield sample
-        else:
-            for sample in self._iter_samples():
-                yield sample
+        samples = self._iter_samples()
+
+        for sample in self._iter_samples_with_context(
+            samples, progress, autosave, batch_size, batch_latency
+        ):
+            yield sample
 
     def _iter_samples(self):
         sample_cls = self._sample_cls
@@ -694,11 +739,7 @@ class DatasetView(foc.SampleCollection):
         detach_frames=False,
         frames_only=False,
     ):
-        _pipeline = []
-        _view = self._base_view
-        for stage in self._stages:
-            _pipeline.extend(stage.to_mongo(_view))
-            _view._stages.append(stage)
+        _pipeline = list(self._compile_pipeline())
 
         if pipeline is not None:
             _pipeline.extend(pipeline)
@@ -712,6 +753,64 @@ class DatasetView(foc.SampleCollection):
             frames_only=frames_only,
         )
 
+    def _unwound_frames_pipeline(self, pipeline):
+        if self._needs_frames():
+            # The view's stages operate on frames, so frames must be attached
+            # prior to applying them
+            _pipeline = [
+                {"$project": {"frames": True}},
+                {"$unwind": "$frames"},
+                {"$replaceRoot": {"newRoot": "$frames"}},
+            ]
+        else:
+            # Join frames only after the view's stages have been applied. An
+            # unordered equality join can use the frames collection's
+            # `_sample_id` index directly
+            _pipeline = [
+                {"$project": {"_id": True}},
+                {
+                    "$lookup": {
+                        "from": self._dataset._frame_collection_name,
+                        "localField": "_id",
+                        "foreignField": "_sample_id",
+                        "as": "frames",
+                    }
+                },
+                {"$unwind": "$frames"},
+                {"$replaceRoot": {"newRoot": "$frames"}},
+            ]
+
+        _pipeline = self._pipeline(pipeline=_pipeline + pipeline)
+
+        return self._dataset._sample_collection_name, _pipeline
+
+    def _compile_pipeline(self):
+        # The compiled pipeline is cached and reused until the view's stages
+        # or the underlying dataset's schema change
+        key = (tuple(self._stages), self._dataset._schema_version)
+
+        compiled = self._compiled_pipeline
+        if compiled is not None and compiled[0] == key:
+            return compiled[1]
+
+        start_time = timeit.default_timer()
+
+        _pipeline = []
+        _view = self._base_view
+        for stage in self._stages:
+            _pipeline.extend(stage.to_mongo(_view))
+            _view._stages.append(stage)
+
+        logger.debug(
+            "Compiled %d-stage view pipeline in %.3fs",
+            len(self._stages),
+            timeit.default_timer() - start_time,
+        )
+
+        self._compiled_pipeline = (key, _pipeline)
+
+        return _pipeline
+
     def _aggregate(
         self,
         pipeline=None,
@@ -0,0 +1,34 @@
+"""
+FiftyOne v0.14.0 revision.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+
+
+def up(db, dataset_name):
+    match_d = {"name": dataset_name}
+    dataset_dict = db.datasets.find_one(match_d)
+
+    if "summary_collection_name" not in dataset_dict:
+        dataset_dict["summary_collection_name"] = None
+
+    if "embeddings_stores" not in dataset_dict:
+        dataset_dict["embeddings_stores"] = {}
+
+    db.datasets.replace_one(match_d, dataset_dict)
+
+
+def down(db, dataset_name):
+    match_d = {"name": dataset_name}
+    dataset_dict = db.datasets.find_one(match_d)
+
+    # Summary stats are not maintained by older versions, so they are deleted
+    summary_collection_name = dataset_dict.pop("summary_collection_name", None)
+    if summary_collection_name is not None:
+        db.drop_collection(summary_collection_name)
+
+    dataset_dict.pop("embeddings_stores", None)
+
+    db.datasets.replace_one(match_d, dataset_dict)
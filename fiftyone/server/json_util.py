@@ -5,9 +5,12 @@ FiftyOne server json utilies.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import bson
 from bson import ObjectId, json_util
 from json import JSONEncoder
 from collections import OrderedDict
+import io
+import zlib
 
 import numpy as np
 
@@ -16,6 +19,11 @@ from fiftyone.core.stages import ViewStage
 import fiftyone.core.utils as fou
 
 
+# Headers written by `np.save()` are padded to a multiple of 64 bytes and are
+# rarely longer than 128 bytes
+_NPY_HEADER_SIZE = 1024
+
+
 def _handle_bytes(o):
     for k, v in o.items():
         if isinstance(v, bytes):
@@ -52,6 +60,67 @@ def convert(d):
                 d[idx] = _handle_numpy_array(i)
 
 
+def replace_vector_fields(samples, fields, frame_fields=None):
+    """Replaces the values of the given vector fields of raw sample dicts
+    with their shape strings, as :func:`convert` does, in-place.
+
+    Only the headers of the arrays are decompressed.
+
+    Args:
+        samples: a list of raw sample dicts, optionally with attached
+            ``frames``
+        fields: a list of sample-level vector fields
+        frame_fields (None): an optional list of frame-level vector fields
+    """
+    for sample in samples:
+        _replace_vector_fields(sample, fields)
+
+        if frame_fields:
+            for frame in sample.get("frames", None) or []:
+                _replace_vector_fields(frame, frame_fields)
+
+
+def _replace_vector_fields(d, fields):
+    for field in fields:
+        value = d.get(field, None)
+        if isinstance(value, bytes):
+            d[field] = _get_array_shape(value)
+
+
+def _get_array_shape(raw):
+    header = zlib.decompressobj().decompress(raw, _NPY_HEADER_SIZE)
+    with io.BytesIO(header) as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, _, _ = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, _, _ = np.lib.format.read_array_header_2_0(f)
+
+    return str(shape)
+
+
+def dumps_binary(d):
+    """Serializes a message dict to BSON for clients that negotiated binary
+    messages.
+
+    Unlike JSON serialization, no :func:`convert` pass is required: object IDs
+    are encoded natively and ``bytes`` values such as segmentation masks are
+    shipped as raw binary rather than base64 strings. Raw sample dicts should
+    have their vector fields replaced via :func:`replace_vector_fields`
+    beforehand.
+
+    Args:
+        d: a dict
+
+    Returns:
+        the BSON ``bytes``
+
+    Raises:
+        bson.errors.InvalidDocument: if the dict cannot be encoded as BSON
+    """
+    return bson.encode(d)
+
+
 class FiftyOneJSONEncoder(JSONEncoder):
     """JSON encoder for the FiftyOne server.
 
@@ -7,11 +7,18 @@ FiftyOne Tornado server.
 """
 import asyncio
 import argparse
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+import copy
+import json
+import logging
 import math
 import os
+import re
 import traceback
 
+from bson import ObjectId
+from bson.errors import InvalidDocument
+from pymongo import UpdateOne
 import tornado.escape
 import tornado.ioloop
 import tornado.iostream
@@ -21,6 +28,7 @@ from tornado.web import HTTPError
 import tornado.websocket
 
 import eta.core.serial as etas
+import eta.core.utils as etau
 
 if os.environ.get("FIFTYONE_DISABLE_SERVICES", False):
     del os.environ["FIFTYONE_DISABLE_SERVICES"]
@@ -43,16 +51,36 @@ import fiftyone.core.uid as fou
 import fiftyone.core.view as fov
 
 from fiftyone.server.extended_view import get_extended_view, get_view_field
-from fiftyone.server.json_util import convert, FiftyOneJSONEncoder
+from fiftyone.server.json_util import (
+    convert,
+    dumps_binary,
+    FiftyOneJSONEncoder,
+    replace_vector_fields,
+)
+import fiftyone.server.thumbnails as fost
 import fiftyone.server.utils as fosu
 
 
+logger = logging.getLogger(__name__)
+
 db = foo.get_async_db_conn()
 _notebook_clients = {}
 _deactivated_clients = set()
 _DISCONNECT_TIMEOUT = 1  # seconds
+_STATISTICS_DEBOUNCE = 0.05  # seconds
+_FRAMES_CHUNK_SIZE = 16
 _DEFAULT_NUM_HISTOGRAM_BINS = 25
 _LIST_LIMIT = 200
+_MAX_CACHED_BOUNDS = 256
+_MAX_CACHED_STATISTICS = 8
+_EXPRESSION_STAGES = {
+    etau.get_class_name(cls) for cls in (fosg.Match, fosg.Mongo)
+}
+_VALUE_STAGES = {
+    etau.get_class_name(cls) for cls in (fosg.Mongo, fosg.SetField)
+}
+_bounds_cache = OrderedDict()
+_statistics_cache = OrderedDict()
 
 
 class RequestHandler(tornado.web.RequestHandler):
@@ -142,7 +170,7 @@ class ReactivateHandler(RequestHandler):
         Args:
             handle_id: a handle uuid
         """
-        StateHandler.state["active_handle"] = handle_id
+        StateHandler.update_state(active_handle=handle_id)
         global _deactivated_clients
         _deactivated_clients.discard(handle_id)
         for client in StateHandler.clients:
@@ -170,7 +198,20 @@ class StagesHandler(RequestHandler):
 
 
 class FramesHandler(tornado.web.RequestHandler):
-    """Frames stream requests"""
+    """Frames stream requests
+
+    Args:
+        sampleId: the ID of the video sample
+        frameNumber: the first frame number to return
+        numFrames: the number of frames to return
+        frameCount: the total number of frames in the video
+        fields (None): an optional comma-separated list of frame fields to
+            return. By default, all fields are returned
+        format ("json"): the response format. Supported values are
+            ``"json"``, which returns all frames in a single JSON document, and
+            ``"ndjson"``, which streams newline-delimited JSON documents of
+            frame chunks as they are read from the database
+    """
 
     def set_default_headers(self, *args, **kwargs):
         self.set_header("Access-Control-Allow-Origin", "*")
@@ -185,35 +226,100 @@ class FramesHandler(tornado.web.RequestHandler):
         start_frame = int(self.get_argument("frameNumber"))
         # pylint: disable=no-value-for-parameter
         frame_count = int(self.get_argument("frameCount"))
+        fields = self.get_argument("fields", None)
+        fmt = self.get_argument("format", "json")
 
         if sample_id is None or start_frame is None:
             raise ValueError("error")
 
+        if fmt not in ("json", "ndjson"):
+            raise HTTPError(400, "Unsupported format '%s'" % fmt)
+
         end_frame = min(
             # pylint: disable=no-value-for-parameter
             int(self.get_argument("numFrames")) + start_frame,
             frame_count,
         )
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        elif state.dataset is not None:
-            view = state.dataset
-
-        view = fov.make_optimized_select_view(view, sample_id)
-        view = view.set_field(
-            "frames",
-            F("frames").filter(
-                (F("frame_number") >= start_frame)
-                & (F("frame_number") <= end_frame)
-            ),
+
+        if fields:
+            fields = fields.split(",")
+
+        view = StateHandler.get_view()
+        cursor = _make_frames_cursor(
+            view, sample_id, start_frame, end_frame, fields=fields
         )
 
-        frames = await foo.aggregate(
-            StateHandler.sample_collection(), view._pipeline(frames_only=True)
-        ).to_list(end_frame - start_frame + 1)
+        if fmt == "json":
+            frames = await cursor.to_list(end_frame - start_frame + 1)
+            convert(frames)
+            self.write({"frames": frames, "range": [start_frame, end_frame]})
+            return
+
+        self.set_header("Content-Type", "application/x-ndjson")
+
+        chunk = []
+        chunk_start = start_frame
+        async for frame in cursor:
+            chunk.append(frame)
+            if len(chunk) >= _FRAMES_CHUNK_SIZE:
+                chunk_end = frame["frame_number"]
+                await self._write_chunk(chunk, chunk_start, chunk_end)
+                chunk = []
+                chunk_start = chunk_end + 1
+
+        if chunk or chunk_start <= end_frame:
+            await self._write_chunk(chunk, chunk_start, end_frame)
+
+    async def _write_chunk(self, frames, start_frame, end_frame):
         convert(frames)
-        self.write({"frames": frames, "range": [start_frame, end_frame]})
+        self.write(
+            tornado.escape.json_encode(
+                {"frames": frames, "range": [start_frame, end_frame]}
+            )
+            + "\n"
+        )
+        await self.flush()
+
+
+def _make_frames_cursor(view, sample_id, start_frame, end_frame, fields=None):
+    projection = _make_frames_projection(view, fields)
+
+    if not isinstance(view, fov.DatasetView) or not view._needs_frames():
+        # The view does not modify frames, so the requested frames can be read
+        # directly via the frames collection's (_sample_id, frame_number)
+        # index, regardless of the length of the video
+        coll = db[view._dataset._frame_collection_name]
+        query = {
+            "_sample_id": ObjectId(sample_id),
+            "frame_number": {"$gte": start_frame, "$lte": end_frame},
+        }
+        return coll.find(query, projection).sort("frame_number", 1)
+
+    view = fov.make_optimized_select_view(view, sample_id)
+    view = view.set_field(
+        "frames",
+        F("frames").filter(
+            (F("frame_number") >= start_frame)
+            & (F("frame_number") <= end_frame)
+        ),
+    )
+
+    pipeline = view._pipeline(frames_only=True)
+    pipeline.append({"$project": projection})
+
+    return foo.aggregate(StateHandler.sample_collection(), pipeline)
+
+
+def _make_frames_projection(view, fields=None):
+    if fields is not None:
+        fields = set(fields) | {"id", "frame_number"}
+
+    projection = {"_sample_id": True}
+    for name, field in view.get_frame_field_schema().items():
+        if fields is None or name in fields:
+            projection[field.db_field or name] = True
+
+    return projection
 
 
 class PageHandler(tornado.web.RequestHandler):
@@ -222,6 +328,8 @@ class PageHandler(tornado.web.RequestHandler):
     Args:
         page: the page number
         page_length (20): the number of items to return
+        cursor (None): the cursor returned by the request for the previous
+            page, if any
     """
 
     def set_default_headers(self, *args, **kwargs):
@@ -234,50 +342,114 @@ class PageHandler(tornado.web.RequestHandler):
         # pylint: disable=no-value-for-parameter
         page = int(self.get_argument("page", 1))
         page_length = int(self.get_argument("page_length", 20))
+        cursor = self.get_argument("cursor", None)
 
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        elif state.dataset is not None:
-            view = state.dataset
-        else:
-            self.write({"results": [], "more": False})
+        state = StateHandler.get_state()
+        if state.dataset is None:
+            self.write({"results": [], "more": False, "cursor": None})
             return
 
-        if view.media_type == fom.VIDEO:
-            view = view.set_field(
-                "frames", F("frames").filter((F("frame_number") == 1))
-            )
-
-        view = get_extended_view(view, state.filters, count_labels_tags=True)
-        view = view.skip((page - 1) * page_length)
+        view = StateHandler.get_extended_view(
+            state.filters, count_labels_tags=True, first_frame=True
+        )
+        pipeline, keys = fosu.make_page_pipeline(
+            view, page, page_length, cursor=cursor
+        )
 
         samples = await foo.aggregate(
-            StateHandler.sample_collection(),
-            view.skip((page - 1) * page_length)._pipeline(
-                attach_frames=True, detach_frames=False
-            ),
+            StateHandler.sample_collection(), pipeline
         ).to_list(page_length + 1)
-        convert(samples)
 
         more = False
         if len(samples) > page_length:
             samples = samples[:page_length]
             more = page + 1
 
-        results = [{"sample": s} for s in samples]
-        metadata = {}
+        cursor = fosu.make_page_cursor(keys, samples)
+        if not more:
+            cursor = None
+
+        metadata = await _read_page_metadata(view, samples)
+
+        convert(samples)
+
+        results = []
+        for sample in samples:
+            result = {"sample": sample}
+            result.update(metadata[sample["filepath"]])
+            results.append(result)
+
+        self.write({"results": results, "more": more, "cursor": cursor})
+
+
+async def _read_page_metadata(view, samples):
+    # Media whose metadata is missing is probed in parallel; the probes
+    # themselves are cached by `fosu.probe_metadata()`
+    missing = {}
+    for sample in samples:
+        filepath = sample["filepath"]
+        if not fosu.has_metadata(filepath, sample.get("metadata", None)):
+            missing.setdefault(filepath, []).append(sample["_id"])
+
+    if missing:
+        loop = asyncio.get_event_loop()
+        filepaths = list(missing.keys())
+        probes = await asyncio.gather(
+            *[
+                loop.run_in_executor(None, fosu.probe_metadata, filepath)
+                for filepath in filepaths
+            ]
+        )
+
+        if fo.app_config.write_media_metadata:
+            _write_page_metadata(view, filepaths, probes, missing)
+
+    metadata = {}
+    for sample in samples:
+        filepath = sample["filepath"]
+        if filepath not in metadata:
+            metadata[filepath] = fosu.read_metadata(
+                filepath, sample.get("metadata", None)
+            )
 
-        for r in results:
-            filepath = r["sample"]["filepath"]
-            if filepath not in metadata:
-                metadata[filepath] = fosu.read_metadata(
-                    filepath, r["sample"].get("metadata", None)
+    return metadata
+
+
+def _write_page_metadata(view, filepaths, probes, missing):
+    # Generated datasets are ephemeral, so their metadata is not persisted
+    if view._is_patches or view._is_frames:
+        return
+
+    ops = []
+    for filepath, probe in zip(filepaths, probes):
+        if probe is None:
+            continue
+
+        d = probe.to_mongo()
+        for _id in missing[filepath]:
+            ops.append(
+                UpdateOne(
+                    {"_id": _id, "metadata": None}, {"$set": {"metadata": d}}
                 )
+            )
 
-            r.update(metadata[filepath])
+    if not ops:
+        return
 
-        self.write({"results": results, "more": more})
+    dataset = view._dataset
+    coll = db[dataset._sample_collection_name]
+
+    def _on_done(future):
+        if future.exception() is None:
+            dataset._mark_modified()
+        else:
+            logger.warning(
+                "Failed to write media metadata: %s", future.exception()
+            )
+
+    # The write happens in the background so that it doesn't delay the page
+    future = asyncio.ensure_future(coll.bulk_write(ops, ordered=False))
+    future.add_done_callback(_on_done)
 
 
 class TeamsHandler(RequestHandler):
@@ -295,7 +467,7 @@ def _catch_errors(func):
             result = await func(self, *args, **kwargs)
             return result
         except Exception:
-            StateHandler.state = StateHandler.prev_state
+            StateHandler.set_state(StateHandler.prev_state)
             clients = list(StateHandler.clients)
             if isinstance(self, PollingHandler):
                 clients.append(self)
@@ -364,7 +536,7 @@ class PollingHandler(tornado.web.RequestHandler):
                     message["ignore"] = client
                     global _notebook_clients
                     global _deactivated_clients
-                    StateHandler.state["active_handle"] = message["handle"]
+                    StateHandler.update_state(active_handle=message["handle"])
                     _deactivated_clients.discard(message["handle"])
                     _notebook_clients[client] = message["handle"]
                     event = "update"
@@ -409,11 +581,8 @@ class PollingHandler(tornado.web.RequestHandler):
         elif event == "deactivate":
             self.write_message({"type": "deactivate"})
 
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
+        state = StateHandler.get_state()
+        view = StateHandler.get_view()
 
         if event == "statistics":
             await StateHandler.send_statistics(
@@ -426,8 +595,10 @@ class PollingHandler(tornado.web.RequestHandler):
             )
 
     def write_message(self, message):
-        message = StateHandler.dumps(message)
-        self.write(message)
+        if not isinstance(message, SerializedMessage):
+            message = SerializedMessage(message)
+
+        self.write(message.text)
 
 
 class StateHandler(tornado.websocket.WebSocketHandler):
@@ -440,12 +611,147 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             :class:`fiftyone.core.state.StateDescription`, serialized
         prev_state: the previous a serialized
             :class:`fiftyone.core.state.StateDescription`, serialized
+        revision: a counter that is incremented every time :attr:`state`
+            changes
+        binary: whether the client negotiated binary (BSON) messages by
+            connecting with a ``binary=true`` query parameter
     """
 
     app_clients = set()
     clients = set()
     state = fos.StateDescription().serialize()
     prev_state = fos.StateDescription().serialize()
+    revision = 0
+    binary = False
+
+    _state_cache = None
+    _views_cache = OrderedDict()
+    _max_cached_views = 16
+    _statistics_tasks = {}
+
+    @classmethod
+    def set_state(cls, state):
+        """Sets the current state of the session.
+
+        All changes to :attr:`state` must go through this method (or
+        :meth:`update_state`) so that the cached state and views derived from
+        it are invalidated.
+
+        Args:
+            state: a :class:`fiftyone.core.state.StateDescription` or a
+                serialized ``dict`` version of one
+        """
+        if isinstance(state, fos.StateDescription):
+            state = state.serialize()
+
+        cls.state = state
+        cls.revision += 1
+        cls._state_cache = None
+        cls._views_cache.clear()
+
+    @classmethod
+    def update_state(cls, **kwargs):
+        """Updates the given keys of the current serialized state.
+
+        Args:
+            **kwargs: the serialized state keys to set
+        """
+        state = dict(cls.state)
+        state.update(kwargs)
+        cls.set_state(state)
+
+    @classmethod
+    def get_state(cls):
+        """Returns the current state of the session.
+
+        The state is only deserialized once per :attr:`revision`. The returned
+        object is a shallow copy, so attributes can be reassigned by the
+        caller without affecting the cache.
+
+        Returns:
+            a :class:`fiftyone.core.state.StateDescription`
+        """
+        if cls._state_cache is None or cls._state_cache[0] != cls.revision:
+            state = fos.StateDescription.from_dict(cls.state)
+            cls._state_cache = (cls.revision, state)
+
+        return copy.copy(cls._state_cache[1])
+
+    @classmethod
+    def get_view(cls):
+        """Returns the view of the current state, or its dataset if there is
+        no view.
+
+        Returns:
+            a :class:`fiftyone.core.collections.SampleCollection`, or ``None``
+        """
+        state = cls.get_state()
+        if state.view is not None:
+            return state.view
+
+        return state.dataset
+
+    @classmethod
+    def get_extended_view(
+        cls,
+        filters,
+        count_labels_tags=False,
+        only_matches=True,
+        first_frame=False,
+    ):
+        """Returns the view of the current state extended by the given App
+        filters.
+
+        Extended views are cached per state :attr:`revision` and dataset
+        schema, so repeated requests for the same filters do not rebuild
+        them.
+
+        Args:
+            filters: a dict of App filters
+            count_labels_tags (False): whether to include label tag counts
+            only_matches (True): whether to filter samples that do not match
+                the filters
+            first_frame (False): whether to only include the first frame of
+                video samples
+
+        Returns:
+            a :class:`fiftyone.core.view.DatasetView`
+        """
+        view = cls.get_view()
+        if view is None:
+            return None
+
+        key = (
+            cls.revision,
+            view._dataset._schema_version,
+            json.dumps(filters, sort_keys=True, default=str),
+            count_labels_tags,
+            only_matches,
+            first_frame,
+        )
+
+        extended_view = cls._views_cache.get(key, None)
+        if extended_view is not None:
+            cls._views_cache.move_to_end(key)
+            return extended_view
+
+        if first_frame and view.media_type == fom.VIDEO:
+            view = view.set_field(
+                "frames", F("frames").filter((F("frame_number") == 1))
+            )
+
+        extended_view = get_extended_view(
+            view,
+            filters,
+            count_labels_tags=count_labels_tags,
+            only_matches=only_matches,
+        )
+
+        cls._views_cache[key] = extended_view
+        while len(cls._views_cache) > cls._max_cached_views:
+            cls._views_cache.popitem(last=False)
+
+        return extended_view
 
     @staticmethod
     def dumps(data):
@@ -474,24 +780,43 @@ class StateHandler(tornado.websocket.WebSocketHandler):
     @staticmethod
     def sample_collection():
         """Getter for the current sample collection."""
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            dataset = state.view._dataset
-        else:
-            dataset = state.dataset
-
+        dataset = StateHandler.get_view()._dataset
         return db[dataset._sample_collection_name]
 
+    @staticmethod
+    def dumps_binary(data):
+        """Serializes data to BSON formatted :class:`bytes`.
+
+        Args:
+            data: a serializable ``dict``
+
+        Returns:
+            :class:`bytes`
+        """
+        return dumps_binary(data)
+
     def write_message(self, message):
         """Writes a message to the client.
 
+        Clients that negotiated binary messages are sent BSON frames. Messages
+        that cannot be encoded as BSON fall back to JSON text frames.
+
         Args:
-            message: a serializable object
+            message: a serializable object, or a :class:`SerializedMessage`
+                whose serializations are shared between clients
         """
         if message is None:
             return
-        message = self.dumps(message)
-        return super().write_message(message)
+
+        if not isinstance(message, SerializedMessage):
+            message = SerializedMessage(message)
+
+        if self.binary:
+            data = message.binary
+            if data is not None:
+                return super().write_message(data, binary=True)
+
+        return super().write_message(message.text)
 
     def check_origin(self, origin):
         """Accepts all origins.
@@ -505,6 +830,7 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         """On open, add the client to the active clients set, and write the
         current state to the new client.
         """
+        self.binary = self.get_argument("binary", "false") == "true"
         StateHandler.clients.add(self)
         _write_message(
             {"type": "update", "state": StateHandler.state}, only=self
@@ -561,24 +887,22 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         if not isinstance(self, StateHandler):
             return
 
-        awaitables = self.get_statistics_awaitables(only=self)
-        asyncio.gather(*awaitables)
+        self.schedule_statistics(only=self)
 
     @staticmethod
     async def on_refresh(self, polling_client=None):
         """Event for refreshing an App client."""
-        state = fos.StateDescription.from_dict(StateHandler.state)
+        state = StateHandler.get_state()
         state.refresh = not state.refresh
-        StateHandler.state = state.serialize()
+        StateHandler.set_state(state)
 
         if polling_client:
             PollingHandler.clients[polling_client].update(
                 {"update", "statistics", "extended_statistics"}
             )
         else:
-            awaitables = [self.send_updates(only=self)]
-            awaitables += self.get_statistics_awaitables(only=self)
-            asyncio.gather(*awaitables)
+            await self.send_updates(only=self)
+            self.schedule_statistics(only=self)
 
     @staticmethod
     async def on_filters_update(self, filters):
@@ -589,30 +913,32 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             filters: a :class:`dict` mapping field path to a serialized
                 :class:fiftyone.core.stages.Stage`
         """
-        state = fos.StateDescription.from_dict(StateHandler.state)
+        state = StateHandler.get_state()
         state.filters = filters
         state.selected_labels = []
         state.selected = []
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
+        view = StateHandler.get_view()
 
-        StateHandler.state = state.serialize()
+        StateHandler.set_state(state)
         for clients in PollingHandler.clients.values():
             clients.update({"extended_statistics"})
 
         await self.send_statistics(view, filters=filters, extended=True)
 
     @staticmethod
-    async def on_update(caller, state, ignore_polling_client=None):
+    async def on_update(
+        caller, state, ignore_polling_client=None, touched_paths=None
+    ):
         """Event for state updates. Sends an update message to all active
         clients, and statistics messages to active App clients.
 
         Args:
             state: a serialized :class:`fiftyone.core.state.StateDescription`
+            touched_paths (None): an optional iterable of field paths whose
+                values were modified by the update. If provided, only the
+                statistics that depend on these paths are recomputed
         """
-        StateHandler.state = fos.StateDescription.from_dict(state).serialize()
+        StateHandler.set_state(fos.StateDescription.from_dict(state))
         active_handle = state["active_handle"]
         global _notebook_clients
         global _deactivated_clients
@@ -642,11 +968,8 @@ class StateHandler(tornado.websocket.WebSocketHandler):
 
             events.update({"update", "statistics", "extended_statistics"})
 
-        awaitables = [
-            StateHandler.send_updates(),
-        ]
-        awaitables += StateHandler.get_statistics_awaitables()
-        asyncio.gather(*awaitables)
+        await StateHandler.send_updates()
+        StateHandler.schedule_statistics(touched_paths=touched_paths)
 
     @staticmethod
     async def on_set_selection(self, _ids):
@@ -656,7 +979,7 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         Args:
             _ids: a list of sample _id
         """
-        StateHandler.state["selected"] = _ids
+        StateHandler.update_state(selected=_ids)
         await self.send_updates(ignore=self)
 
     @staticmethod
@@ -665,7 +988,7 @@ class StateHandler(tornado.websocket.WebSocketHandler):
 
         Sends state updates to all active clients.
         """
-        StateHandler.state["selected"] = []
+        StateHandler.update_state(selected=[])
         await self.send_updates(ignore=self)
 
     @staticmethod
@@ -678,7 +1001,7 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         if not isinstance(selected_labels, list):
             raise TypeError("selected_labels must be a list")
 
-        StateHandler.state["selected_labels"] = selected_labels
+        StateHandler.update_state(selected_labels=selected_labels)
         await self.send_updates(ignore=self)
 
     @staticmethod
@@ -689,24 +1012,21 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             dataset_name: the dataset name
         """
         dataset = fod.load_dataset(dataset_name)
-        config = fos.StateDescription.from_dict(StateHandler.state).config
+        config = StateHandler.get_state().config
         active_handle = StateHandler.state["active_handle"]
-        StateHandler.state = fos.StateDescription(
-            dataset=dataset, config=config, active_handle=active_handle
-        ).serialize()
+        StateHandler.set_state(
+            fos.StateDescription(
+                dataset=dataset, config=config, active_handle=active_handle
+            )
+        )
         await self.on_update(self, StateHandler.state)
 
     @staticmethod
     async def on_tag(
         caller, changes, target_labels=False, active_labels=None,
     ):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
-
-        view = get_extended_view(view, state.filters)
+        state = StateHandler.get_state()
+        view = StateHandler.get_extended_view(state.filters)
         if state.selected:
             view = view.select(state.selected)
 
@@ -715,19 +1035,21 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         else:
             fosu.change_sample_tags(view, changes)
 
-        StateHandler.state["refresh"] = not state.refresh
+        StateHandler.update_state(refresh=not state.refresh)
         for clients in PollingHandler.clients.values():
             clients.update({"update"})
 
-        await StateHandler.on_update(caller, StateHandler.state)
+        await StateHandler.on_update(
+            caller,
+            StateHandler.state,
+            touched_paths=_get_tag_paths(view, target_labels, active_labels),
+        )
 
     @staticmethod
     async def on_all_tags(caller, sample_id=None):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view._dataset
-        else:
-            view = state.dataset
+        view = StateHandler.get_view()
+        if view is not None:
+            view = view._dataset
 
         if view is None:
             label = []
@@ -749,16 +1071,12 @@ class StateHandler(tornado.websocket.WebSocketHandler):
 
     @staticmethod
     async def on_modal_statistics(caller, sample_id, uuid, filters=None):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
-
         if filters is not None:
-            view = get_extended_view(
-                view, filters, count_labels_tags=False, only_matches=False
+            view = StateHandler.get_extended_view(
+                filters, count_labels_tags=False, only_matches=False
             )
+        else:
+            view = StateHandler.get_view()
 
         view = view.select(sample_id)
 
@@ -782,13 +1100,8 @@ class StateHandler(tornado.websocket.WebSocketHandler):
 
     @staticmethod
     async def on_save_filters(caller, add_stages=[], with_selected=False):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
-
-        view = get_extended_view(view, state.filters)
+        state = StateHandler.get_state()
+        view = StateHandler.get_extended_view(state.filters)
 
         if with_selected:
             if state.selected:
@@ -817,14 +1130,9 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         active_labels=[],
         frame_number=None,
     ):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
-
+        state = StateHandler.get_state()
         sample_ids = [sample_id]
-        view = get_extended_view(view, filters)
+        view = StateHandler.get_extended_view(filters)
 
         if labels:
             if state.selected_labels:
@@ -849,14 +1157,14 @@ class StateHandler(tornado.websocket.WebSocketHandler):
                 sample_id, sample_ids, current_frame=frame_number, only=caller
             )
 
-        awaitables = [
+        asyncio.ensure_future(
             StateHandler.send_samples(
                 sample_id, sample_ids, current_frame=frame_number
             )
-        ]
-        awaitables += StateHandler.get_statistics_awaitables()
-
-        asyncio.gather(*awaitables)
+        )
+        StateHandler.schedule_statistics(
+            touched_paths=_get_tag_paths(view, labels, active_labels)
+        )
 
     @staticmethod
     async def on_tag_statistics(
@@ -867,13 +1175,8 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         uuid=None,
         labels=False,
     ):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
-
-        view = get_extended_view(view, filters)
+        state = StateHandler.get_state()
+        view = StateHandler.get_extended_view(filters)
 
         if state.selected_labels and labels:
             view = view.select_labels(state.selected_labels)
@@ -913,13 +1216,10 @@ class StateHandler(tornado.websocket.WebSocketHandler):
     async def send_samples(
         cls, sample_id, sample_ids, current_frame=None, only=None
     ):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
-
-        view = get_extended_view(view, state.filters, count_labels_tags=True)
+        state = StateHandler.get_state()
+        view = StateHandler.get_extended_view(
+            state.filters, count_labels_tags=True
+        )
         view = fov.make_optimized_select_view(view, sample_ids)
 
         if view.media_type == fom.VIDEO and current_frame is not None:
@@ -937,19 +1237,28 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             StateHandler.sample_collection(),
             view._pipeline(attach_frames=True, detach_frames=False),
         ).to_list(len(sample_ids))
-        convert(samples)
+
+        # Vectors such as embeddings are only displayed as their shapes, so
+        # they are not sent in full
+        fields, frame_fields = _get_vector_fields(view)
+        replace_vector_fields(samples, fields, frame_fields=frame_fields)
 
         _write_message(
-            {"type": "samples_update", "samples": samples}, app=True, only=only
+            {"type": "samples_update", "samples": samples},
+            app=True,
+            only=only,
+            raw=True,
         )
 
     @classmethod
-    def get_statistics_awaitables(cls, only=None):
+    def get_statistics_awaitables(cls, only=None, touched_paths=None):
         """Gets statistic awaitables that will send statistics to the relevant
         client(s) when executed
 
         Args:
             only (None): a client to restrict the messages to
+            touched_paths (None): an optional iterable of field paths that
+                were modified since the last statistics were sent
 
         Returns:
             a list of coroutines
@@ -957,21 +1266,85 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         if StateHandler.state["dataset"] is None:
             return []
 
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        else:
-            view = state.dataset
+        state = StateHandler.get_state()
+        view = StateHandler.get_view()
 
         return [
             cls.send_statistics(
-                view, extended=False, filters=state.filters, only=only,
+                view,
+                extended=False,
+                filters=state.filters,
+                only=only,
+                touched_paths=touched_paths,
             ),
             cls.send_statistics(
-                view, extended=True, filters=state.filters, only=only
+                view,
+                extended=True,
+                filters=state.filters,
+                only=only,
+                touched_paths=touched_paths,
             ),
         ]
 
+    @classmethod
+    def schedule_statistics(cls, only=None, touched_paths=None):
+        """Schedules sending statistics for the current state to the relevant
+        client(s).
+
+        Bursts of updates are debounced: statistics are computed only after
+        a short delay, and any pending statistics tasks that the new task
+        supersedes are cancelled, so that only the statistics of the latest
+        state are computed.
+
+        Args:
+            only (None): a client to restrict the messages to
+            touched_paths (None): an optional iterable of field paths that
+                were modified since the last statistics were sent
+
+        Returns:
+            an ``asyncio.Task``
+        """
+        # Statistics for all clients supersede those for individual clients
+        if only is None:
+            keys = list(cls._statistics_tasks.keys())
+        else:
+            keys = [only]
+
+        for key in keys:
+            if key not in cls._statistics_tasks:
+                continue
+
+            task, _touched_paths = cls._statistics_tasks.pop(key)
+            if not task.done():
+                task.cancel()
+
+                # The superseded task's paths must still be recomputed
+                touched_paths = _merge_touched_paths(
+                    touched_paths, _touched_paths
+                )
+
+        task = asyncio.ensure_future(
+            cls._send_debounced_statistics(only, touched_paths)
+        )
+        cls._statistics_tasks[only] = (task, touched_paths)
+
+        def _cleanup(task):
+            if cls._statistics_tasks.get(only, (None,))[0] is task:
+                del cls._statistics_tasks[only]
+
+        task.add_done_callback(_cleanup)
+
+        return task
+
+    @classmethod
+    async def _send_debounced_statistics(cls, only, touched_paths):
+        await asyncio.sleep(_STATISTICS_DEBOUNCE)
+        await asyncio.gather(
+            *cls.get_statistics_awaitables(
+                only=only, touched_paths=touched_paths
+            )
+        )
+
     @classmethod
     async def send_updates(cls, ignore=None, only=None):
         """Sends an update event to the all clients, exluding the ignore
@@ -989,7 +1362,7 @@ class StateHandler(tornado.websocket.WebSocketHandler):
 
     @classmethod
     async def send_statistics(
-        cls, view, extended=False, filters=None, only=None
+        cls, view, extended=False, filters=None, only=None, touched_paths=None
     ):
         """Sends a statistics event given using the provided view to all App
         clients, unless an only client is provided in which case it is only
@@ -1000,6 +1373,10 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             extended (False): whether to apply the extended view filters
             filters (None): filter stages to append to the view
             only (None): a client to restrict the message to
+            touched_paths (None): an optional iterable of field paths that
+                were modified since the last statistics for this view were
+                sent. If provided, only the statistics that depend on these
+                paths are recomputed
         """
         base_view = view
         data = []
@@ -1007,8 +1384,11 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             if extended:
                 view = get_extended_view(view, filters)
 
-            aggregations = fos.DatasetStatistics(view, filters).aggregations
-            results = await view._async_aggregate(aggregations)
+            stats = fos.DatasetStatistics(view, filters)
+            aggregations = stats.aggregations
+            results = await _aggregate_statistics(
+                view, stats, base_view, filters, extended, touched_paths
+            )
 
             for agg, result in zip(aggregations, results):
                 data.append(
@@ -1048,12 +1428,7 @@ class StateHandler(tornado.websocket.WebSocketHandler):
         limit=_LIST_LIMIT,
         sample_id=None,
     ):
-        state = fos.StateDescription.from_dict(StateHandler.state)
-        if state.view is not None:
-            view = state.view
-        elif state.dataset is not None:
-            view = state.dataset
-
+        view = StateHandler.get_view()
         view = _get_search_view(view, path, search, selected)
 
         if sample_id is not None:
@@ -1082,16 +1457,12 @@ class StateHandler(tornado.websocket.WebSocketHandler):
             group: the distribution group. Valid groups are 'labels', 'scalars',
                 and 'tags'.
         """
-        state = fos.StateDescription.from_dict(StateHandler.state)
+        state = StateHandler.get_state()
         results = None
-        if state.view is not None:
-            view = state.view
-        elif state.dataset is not None:
-            view = state.dataset
-        else:
+        if state.dataset is None:
             results = []
-
-        view = get_extended_view(view, state.filters)
+        else:
+            view = StateHandler.get_extended_view(state.filters)
 
         if group == "label tags" and results is None:
 
@@ -1199,22 +1570,121 @@ def _get_search_view(view, path, search, selected):
     return meth(expr)
 
 
-def _write_message(message, app=False, session=False, ignore=None, only=None):
+class SerializedMessage(object):
+    """A message whose JSON and BSON serializations are lazily computed at
+    most once, so that they can be shared among all clients that the message
+    is written to.
+
+    Args:
+        message: the message dict
+    """
+
+    def __init__(self, message):
+        self.message = message
+        self._text = None
+        self._binary = None
+        self._binary_failed = False
+
+    @property
+    def text(self):
+        """The JSON serialization of the message."""
+        if self._text is None:
+            self._text = StateHandler.dumps(self.message)
+
+        return self._text
+
+    @property
+    def binary(self):
+        """The BSON serialization of the message, or None if the message
+        cannot be encoded as BSON.
+        """
+        if self._binary is None and not self._binary_failed:
+            try:
+                self._binary = StateHandler.dumps_binary(self.message)
+            except InvalidDocument:
+                self._binary_failed = True
+
+        return self._binary
+
+
+def _get_vector_fields(view):
+    def _get_fields(schema):
+        return [
+            field.db_field or name
+            for name, field in schema.items()
+            if isinstance(field, (fof.VectorField, fof.ArrayField))
+        ]
+
+    fields = _get_fields(view.get_field_schema())
+
+    if view.media_type == fom.VIDEO:
+        frame_fields = _get_fields(view.get_frame_field_schema())
+    else:
+        frame_fields = None
+
+    return fields, frame_fields
+
+
+def _write_message(
+    message, app=False, session=False, ignore=None, only=None, raw=False
+):
+    """Writes a message to the relevant clients.
+
+    Args:
+        message: the message dict
+        app (False): whether to only write to App clients
+        session (False): whether to skip App clients
+        ignore (None): a client to skip
+        only (None): the only client to write to
+        raw (False): whether the message contains raw database values, e.g.
+            ``ObjectId`` and ``bytes``, that must be converted via
+            :func:`fiftyone.server.json_util.convert` before being sent to
+            JSON clients. Binary clients receive object IDs and masks as-is
+    """
     clients = StateHandler.app_clients if app else StateHandler.clients
     clients = _filter_deactivated_clients(clients)
 
     if only:
-        only.write_message(message)
+        clients = [only]
+    else:
+        clients = [
+            client
+            for client in clients
+            if client != ignore
+            and not (session and client in StateHandler.app_clients)
+        ]
+
+    # Messages are serialized at most once per format and shared among the
+    # clients
+    if not raw:
+        message = SerializedMessage(message)
+        for client in clients:
+            client.write_message(message)
+
         return
 
+    # Binary clients are written first because the conversion for JSON
+    # clients happens in-place
+    json_clients = []
+    binary_message = SerializedMessage(message)
     for client in clients:
-        if session and client in StateHandler.app_clients:
-            continue
+        if getattr(client, "binary", False):
+            client.write_message(binary_message)
+        else:
+            json_clients.append(client)
 
-        if client == ignore:
-            continue
+    if json_clients:
+        convert(message)
+        json_message = SerializedMessage(message)
+        for client in json_clients:
+            client.write_message(json_message)
+
+
+def _merge_touched_paths(touched_paths, other_touched_paths):
+    if touched_paths is None or other_touched_paths is None:
+        return None
 
-        client.write_message(message)
+    return set(touched_paths) | set(other_touched_paths)
 
 
 def _filter_deactivated_clients(clients):
@@ -1353,10 +1823,143 @@ def _count_values(f, view):
     return aggregations, fields
 
 
+def _get_tag_paths(view, target_labels, active_labels):
+    if not target_labels:
+        return {"tags"}
+
+    if etau.is_str(active_labels):
+        active_labels = [active_labels]
+
+    paths = set()
+    for path, field in fos.DatasetStatistics.labels(view):
+        if active_labels and path not in active_labels:
+            continue
+
+        paths.add("%s.tags" % fos._expand_labels_path(path, field))
+
+    return paths
+
+
+async def _aggregate_statistics(
+    view, stats, base_view, filters, extended, touched_paths
+):
+    aggregations = stats.aggregations
+
+    # Datasets with summary stats maintain the statistics of their unfiltered
+    # contents, so no scan is required
+    if isinstance(view, fod.Dataset) and view.has_summary_stats:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, view._summary_stats.get_results, aggregations
+        )
+
+    if isinstance(base_view, fov.DatasetView):
+        stages = base_view._serialize()
+    else:
+        stages = []
+
+    key = (
+        base_view._dataset.name,
+        json.dumps(stages, sort_keys=True, default=str),
+        json.dumps(filters, sort_keys=True, default=str),
+        extended,
+    )
+    signature = [(type(agg), agg.field_name) for agg in aggregations]
+
+    # If the view's contents may depend on the touched paths, e.g. it matches
+    # tags, then all statistics may have changed
+    if touched_paths is not None and _view_depends_on_paths(
+        stages, filters, touched_paths
+    ):
+        touched_paths = None
+
+    cached = _statistics_cache.get(key, None)
+    if (
+        touched_paths is not None
+        and cached is not None
+        and cached[0] == signature
+    ):
+        results = list(cached[1])
+        inds = stats.get_dependent_aggregations(touched_paths)
+        if inds:
+            _results = await view._async_aggregate(
+                [aggregations[idx] for idx in inds]
+            )
+            for idx, result in zip(inds, _results):
+                results[idx] = result
+    else:
+        results = await view._async_aggregate(aggregations)
+
+    _statistics_cache[key] = (signature, results)
+    _statistics_cache.move_to_end(key)
+    while len(_statistics_cache) > _MAX_CACHED_STATISTICS:
+        _statistics_cache.popitem(last=False)
+
+    return results
+
+
+def _view_depends_on_paths(stages, filters, paths):
+    # Arbitrary expressions may reference fields in ways that cannot be
+    # reliably detected, so any such stage is assumed to depend on the paths
+    for stage in stages:
+        if stage["_cls"] in _EXPRESSION_STAGES:
+            return True
+
+    names = {path.rsplit(".", 1)[-1] for path in paths}
+    if not names:
+        return False
+
+    # Otherwise, the serialized stages and filters are searched for references
+    # to the fields, e.g. `"tags"`, `"$tags"` or `"$$this.tags"`
+    pattern = re.compile(
+        r"(?<!\w)(%s)(?!\w)" % "|".join(re.escape(n) for n in names)
+    )
+    for obj in (stages, filters):
+        if pattern.search(json.dumps(obj, default=str)):
+            return True
+
+    return False
+
+
 def _numeric_bounds(paths):
     return [foa.Bounds(path) for path in paths]
 
 
+async def _get_numeric_bounds(view, paths):
+    # Bounds are computed over the entire dataset and cached per data version,
+    # so that any view of the dataset can use them as its histogram ranges
+    # without an extra pass over its contents. Views whose stages may change
+    # the values of fields are the exception
+    if isinstance(view, fov.DatasetView) and any(
+        stage["_cls"] in _VALUE_STAGES for stage in view._serialize()
+    ):
+        return await view._async_aggregate(_numeric_bounds(paths))
+
+    dataset = view._dataset
+    base_key = (dataset.name, dataset._data_version)
+
+    bounds = {}
+    missing = []
+    for path in paths:
+        key = base_key + (path,)
+        if key in _bounds_cache:
+            bounds[path] = _bounds_cache[key]
+            _bounds_cache.move_to_end(key)
+        else:
+            missing.append(path)
+
+    if missing:
+        results = await dataset._async_aggregate(_numeric_bounds(missing))
+        for path, result in zip(missing, results):
+            bounds[path] = result
+            _bounds_cache[base_key + (path,)] = result
+
+        while len(_bounds_cache) > _MAX_CACHED_BOUNDS:
+            _bounds_cache.popitem(last=False)
+
+    return [bounds[path] for path in paths]
+
+
 async def _numeric_histograms(view, schema, prefix=""):
     paths = []
     fields = []
@@ -1369,8 +1972,7 @@ async def _numeric_histograms(view, schema, prefix=""):
             paths.append("%s%s" % (prefix, name))
             fields.append(field)
 
-    aggs = _numeric_bounds(paths)
-    bounds = await view._async_aggregate(aggs)
+    bounds = await _get_numeric_bounds(view, paths)
     aggregations = []
     ticks = []
     for range_, field, path in zip(bounds, fields, paths):
@@ -1436,6 +2038,87 @@ class MediaHandler(FileHandler):
         return absolute_path
 
 
+class ThumbnailHandler(MediaHandler):
+    """Serves thumbnails of images from the disk cache returned by
+    :func:`fiftyone.server.thumbnails.get_thumbnail_cache`, generating them on
+    demand.
+
+    The ``size`` query parameter specifies the desired size of the thumbnail,
+    in pixels. Non-image media and images that cannot be decoded are served
+    as-is.
+    """
+
+    _thumbnail_key = None
+    _thumbnail_path = None
+
+    async def get(self, path, include_body=True):
+        filepath = self.get_absolute_path(self.root, path)
+        mime_type = etau.guess_mime_type(filepath)
+        if mime_type is None or not mime_type.startswith("image/"):
+            return await super().get(path, include_body=include_body)
+
+        cache = fost.get_thumbnail_cache()
+        try:
+            size = int(self.get_argument("size", 512))
+        except ValueError:
+            raise HTTPError(400, "Invalid thumbnail size")
+
+        try:
+            key = cache.get_key(filepath, size)
+        except FileNotFoundError:
+            raise HTTPError(404)
+
+        # Clients that already have this thumbnail don't need it generated
+        if self._etag_matches(key):
+            self.set_header("Etag", '"%s"' % key)
+            self.set_status(304)
+            return
+
+        loop = asyncio.get_event_loop()
+        try:
+            thumbnail_path = await loop.run_in_executor(
+                None, cache.get_thumbnail_path, filepath, size, key
+            )
+        except Exception as e:
+            # Images that cannot be decoded, e.g. SVGs, are served as-is
+            logger.debug("Failed to generate thumbnail for '%s': %s", path, e)
+            return await super().get(path, include_body=include_body)
+
+        self._thumbnail_key = key
+        self._thumbnail_path = thumbnail_path
+
+        return await super().get(path, include_body=include_body)
+
+    def validate_absolute_path(self, root, absolute_path):
+        if self._thumbnail_path is not None:
+            return self._thumbnail_path
+
+        return super().validate_absolute_path(root, absolute_path)
+
+    def compute_etag(self):
+        if self._thumbnail_key is not None:
+            return '"%s"' % self._thumbnail_key
+
+        return super().compute_etag()
+
+    def get_content_type(self):
+        if self._thumbnail_path is None:
+            return super().get_content_type()
+
+        with open(self._thumbnail_path, "rb") as f:
+            header = f.read(8)
+
+        if header.startswith(b"\x89PNG"):
+            return "image/png"
+
+        return "image/jpeg"
+
+    def _etag_matches(self, key):
+        etags = self.request.headers.get("If-None-Match", "")
+        etags = [e.strip().strip('"') for e in etags.split(",")]
+        return key in etags or "*" in etags
+
+
 class Application(tornado.web.Application):
     """FiftyOne Tornado Application"""
 
@@ -1454,6 +2137,7 @@ class Application(tornado.web.Application):
             (r"/stages", StagesHandler),
             (r"/state", StateHandler),
             (r"/teams", TeamsHandler),
+            (r"/thumbnail/(.*)", ThumbnailHandler, {"path": ""},),
             (
                 r"/(.*)",
                 FileHandler,
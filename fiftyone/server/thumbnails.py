@@ -0,0 +1,279 @@
+"""
+FiftyOne server thumbnails.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+
+import PIL.Image
+import PIL.ImageOps
+
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.media as fom
+import fiftyone.core.utils as fou
+
+
+logger = logging.getLogger(__name__)
+
+
+THUMBNAIL_SIZES = (256, 512, 1024)
+"""The supported thumbnail sizes, in pixels. Requested sizes are rounded up to
+the nearest bucket so that cached thumbnails can be shared between clients.
+"""
+
+_JPEG_QUALITY = 85
+_EVICTION_RATIO = 0.9
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class ThumbnailCache(object):
+    """A least recently used disk cache of image thumbnails.
+
+    Thumbnails are keyed by the filepath, modification time, and size of the
+    source image, as well as the thumbnail size bucket, so modified images
+    are regenerated automatically. When the total size of the cache exceeds
+    ``max_size``, the least recently used thumbnails are deleted.
+
+    Args:
+        cache_dir: the directory in which to store thumbnails
+        max_size: the maximum size of the cache, in bytes
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._size = None
+
+    @staticmethod
+    def get_bucket(size):
+        """Returns the thumbnail size bucket for the given size.
+
+        Args:
+            size: the requested size, in pixels
+
+        Returns:
+            the size bucket, in pixels
+        """
+        for bucket in THUMBNAIL_SIZES:
+            if size <= bucket:
+                return bucket
+
+        return THUMBNAIL_SIZES[-1]
+
+    def get_key(self, filepath, size):
+        """Returns the cache key of the thumbnail of the given image.
+
+        The key is also suitable for use as an HTTP ``ETag``.
+
+        Args:
+            filepath: the path to the source image
+            size: the requested size, in pixels
+
+        Returns:
+            the key
+        """
+        stat = os.stat(filepath)
+        s = "%s:%d:%d:%d" % (
+            filepath,
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.get_bucket(size),
+        )
+        return hashlib.sha1(s.encode()).hexdigest()
+
+    def get_thumbnail_path(self, filepath, size, key=None):
+        """Returns the path to a thumbnail of the given image, generating it
+        if necessary.
+
+        Args:
+            filepath: the path to the source image
+            size: the requested size, in pixels
+            key (None): the precomputed key of the thumbnail, if available
+
+        Returns:
+            the path to the thumbnail
+        """
+        if key is None:
+            key = self.get_key(filepath, size)
+
+        thumbnail_path = self._get_cache_path(key)
+
+        try:
+            # Bump the access time so that eviction is least recently used
+            os.utime(thumbnail_path)
+            return thumbnail_path
+        except FileNotFoundError:
+            pass
+
+        num_bytes = _make_thumbnail(
+            filepath, thumbnail_path, self.get_bucket(size)
+        )
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._compute_size()
+            else:
+                self._size += num_bytes
+
+            if self._size > self.max_size:
+                self._evict(keep=thumbnail_path)
+
+        return thumbnail_path
+
+    def clear(self):
+        """Deletes all thumbnails from the cache."""
+        with self._lock:
+            etau.delete_dir(self.cache_dir)
+            self._size = 0
+
+    def _get_cache_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _iter_thumbnails(self):
+        for root, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+                yield path, stat
+
+    def _compute_size(self):
+        return sum(stat.st_size for _, stat in self._iter_thumbnails())
+
+    def _evict(self, keep=None):
+        thumbnails = sorted(
+            self._iter_thumbnails(), key=lambda t: t[1].st_mtime_ns
+        )
+
+        size = sum(stat.st_size for _, stat in thumbnails)
+        target_size = _EVICTION_RATIO * self.max_size
+        for path, stat in thumbnails:
+            if size <= target_size:
+                break
+
+            if path == keep:
+                continue
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            size -= stat.st_size
+
+        self._size = size
+
+
+def get_thumbnail_cache():
+    """Returns the thumbnail cache configured by
+    ``fo.app_config.thumbnail_cache_dir`` and
+    ``fo.app_config.thumbnail_cache_size``.
+
+    Returns:
+        a :class:`ThumbnailCache`
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = ThumbnailCache(
+                fo.app_config.thumbnail_cache_dir,
+                fo.app_config.thumbnail_cache_size,
+            )
+
+    return _cache
+
+
+def warm_thumbnail_cache(
+    sample_collection, sizes=None, num_workers=None, skip_failures=True
+):
+    """Populates the thumbnail cache with thumbnails of the images in the
+    given collection, so that the App can render them immediately.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        sizes (None): an optional list of thumbnail sizes to generate. By
+            default, the size used by the App's grid is generated
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used
+        skip_failures (True): whether to gracefully continue without raising
+            an error if a thumbnail cannot be generated
+    """
+    if sample_collection.media_type != fom.IMAGE:
+        raise ValueError(
+            "Thumbnails can only be generated for image collections"
+        )
+
+    if sizes is None:
+        sizes = [512]
+
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    cache = get_thumbnail_cache()
+    filepaths = sample_collection.values("filepath")
+
+    def _warm(filepath):
+        try:
+            for size in sizes:
+                cache.get_thumbnail_path(filepath, size)
+        except Exception as e:
+            if not skip_failures:
+                raise
+
+            logger.warning(
+                "Failed to generate thumbnail for '%s': %s", filepath, e
+            )
+
+    logger.info("Generating thumbnails...")
+    with fou.ProgressBar(total=len(filepaths)) as pb:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for _ in pb(executor.map(_warm, filepaths)):
+                pass
+
+
+def _make_thumbnail(inpath, outpath, size):
+    with PIL.Image.open(inpath) as img:
+        # Lets JPEG decoders downsample while decoding, which is much faster
+        # than decoding the full resolution image
+        img.draft("RGB", (size, size))
+
+        # EXIF data is not saved with thumbnails, so any orientation must be
+        # applied to the pixels
+        img = PIL.ImageOps.exif_transpose(img)
+
+        img.thumbnail((size, size))
+
+        if img.mode in ("RGBA", "LA", "P"):
+            fmt = "PNG"
+        else:
+            fmt = "JPEG"
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+
+        etau.ensure_basedir(outpath)
+        tmp_path = "%s.%s.tmp" % (outpath, threading.get_ident())
+        if fmt == "JPEG":
+            img.save(tmp_path, fmt, quality=_JPEG_QUALITY)
+        else:
+            img.save(tmp_path, fmt)
+
+    os.replace(tmp_path, outpath)
+    return os.path.getsize(outpath)
@@ -5,7 +5,9 @@ FiftyOne server utils.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import base64
 import collections
+import functools
 import json
 import mimetypes
 import os
@@ -13,12 +15,17 @@ import io
 import struct
 import warnings
 
-import eta.core.video as etav
+from bson import json_util
+import eta.core.utils as etau
 import PIL.Image
 
 from fiftyone import ViewField as F
+import fiftyone.core.metadata as fomt
+import fiftyone.core.stages as fosg
 
 
+_MAX_CACHED_METADATA = 16384
+
 FILE_UNKNOWN = "Sorry, don't know how to get size for this file."
 
 
@@ -115,6 +122,260 @@ def _get_tag_modifier(changes):
     return edit_tags
 
 
+_PAGE_KEY = "_page_key"
+_REORDERING_STAGES = (
+    fosg.GeoNear,
+    fosg.GroupBy,
+    fosg.Limit,
+    fosg.Shuffle,
+    fosg.Skip,
+    fosg.SortBySimilarity,
+    fosg.Take,
+)
+_NON_REORDERING_OPS = {"$addFields", "$match", "$project", "$set", "$unset"}
+
+
+def get_page_keys(sample_collection):
+    """Returns the sort keys that define the order of the samples in the
+    collection, if the collection supports keyset pagination.
+
+    Keyset pagination is supported for collections whose order is defined by
+    an optional :class:`fiftyone.core.stages.SortBy` stage on non-list sample
+    fields. Collections containing stages like
+    :class:`fiftyone.core.stages.Skip` or
+    :class:`fiftyone.core.stages.Shuffle` must be paginated via skips.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+
+    Returns:
+        a list of ``(path, order)`` tuples whose last element is
+        ``("_id", order)``, or None if the collection cannot be keyed
+    """
+    sort_stage = None
+    for stage in getattr(sample_collection, "_stages", []):
+        if isinstance(stage, _REORDERING_STAGES):
+            return None
+
+        if isinstance(stage, (fosg.Select, fosg.SelectBy)) and stage.ordered:
+            return None
+
+        if isinstance(stage, fosg.Mongo) and any(
+            set(s.keys()) - _NON_REORDERING_OPS for s in stage.pipeline
+        ):
+            return None
+
+        if isinstance(stage, fosg.SortBy):
+            sort_stage = stage
+
+    if sort_stage is None:
+        # Generated collections' IDs do not reflect their natural order
+        if sample_collection._is_patches or sample_collection._is_frames:
+            return None
+
+        return [("_id", 1)]
+
+    field_or_expr = sort_stage._get_mongo_field_or_expr()
+    if etau.is_str(field_or_expr):
+        keys = [(field_or_expr, 1)]
+    elif isinstance(field_or_expr, list):
+        keys = list(field_or_expr)
+    else:
+        return None
+
+    for path, _ in keys:
+        if not etau.is_str(path) or "$" in path:
+            return None
+
+        (
+            _,
+            is_frame_field,
+            list_fields,
+            _,
+            _,
+        ) = sample_collection._parse_field_name(path, allow_missing=True)
+        if is_frame_field or list_fields:
+            return None
+
+    if sort_stage.reverse:
+        keys = [(path, -order) for path, order in keys]
+
+    return keys + [("_id", keys[-1][1])]
+
+
+def make_page_pipeline(sample_collection, page, page_length, cursor=None):
+    """Returns an aggregation pipeline that loads the given page of samples
+    from the collection.
+
+    If a ``cursor`` returned by :meth:`make_page_cursor` for the previous page
+    is provided and is valid for the collection, the page is loaded via a
+    ``$match`` on the sort keys of the collection, so the cost of loading a
+    page does not depend on its depth. Otherwise, a skip is used.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        page: the page number, starting from 1
+        page_length: the number of samples per page. One additional sample is
+            loaded so that the existence of another page can be detected
+        cursor (None): an optional cursor for the previous page
+
+    Returns:
+        a tuple of
+
+        -   the aggregation pipeline
+        -   the sort keys of the collection, which must be passed to
+            :meth:`make_page_cursor`, or None if the collection must be
+            paginated via skips
+    """
+    keys = get_page_keys(sample_collection)
+    if keys is None:
+        pipeline = _make_skip_pipeline(sample_collection, page, page_length)
+        return pipeline, None
+
+    last = None
+    if cursor is not None and page > 1:
+        last = _parse_page_cursor(cursor, keys)
+
+    if last is None and page > 1:
+        view = sample_collection.skip((page - 1) * page_length)
+    else:
+        view = sample_collection
+
+    view = view.limit(page_length + 1)
+    pipeline = view._pipeline(attach_frames=True, detach_frames=False)
+
+    keyset = []
+    if last is not None:
+        keyset.append({"$match": _make_keyset_match(keys, last)})
+
+    keyset.append({"$sort": collections.OrderedDict(keys)})
+
+    if len(keys) == 1:
+        # The collection has no reordering stages, so its documents can be
+        # keyed by the `_id` index at the start of the pipeline
+        return keyset + pipeline, keys
+
+    # Replace the sort of the `SortBy` stage with the keyset, and record the
+    # sort values before any subsequent stages can modify them
+    sort = collections.OrderedDict(keys[:-1])
+    inds = [i for i, s in enumerate(pipeline) if s.get("$sort", None) == sort]
+
+    if not inds:
+        pipeline = _make_skip_pipeline(sample_collection, page, page_length)
+        return pipeline, None
+
+    keyset.append({"$set": {_PAGE_KEY: ["$" + path for path, _ in keys[:-1]]}})
+
+    idx = inds[-1]
+    rest = [_preserve_page_key(stage) for stage in pipeline[(idx + 1) :]]
+    return pipeline[:idx] + keyset + rest, keys
+
+
+def _preserve_page_key(stage):
+    # Inclusion projections, e.g. from `select_fields()`, would otherwise
+    # remove the recorded sort values
+    project = stage.get("$project", None)
+    if project is None or all(
+        v in (0, False) for k, v in project.items() if k != "_id"
+    ):
+        return stage
+
+    project = collections.OrderedDict(project)
+    project[_PAGE_KEY] = True
+    return {"$project": project}
+
+
+def _make_skip_pipeline(sample_collection, page, page_length):
+    view = sample_collection.skip((page - 1) * page_length)
+    view = view.limit(page_length + 1)
+    pipeline = view._pipeline(attach_frames=True, detach_frames=False)
+
+    # Ties in the final sort may be ordered differently by each page's query,
+    # so `_id` is added as a tiebreak to ensure that pages never overlap
+    for idx in range(len(pipeline) - 1, -1, -1):
+        sort = pipeline[idx].get("$sort", None)
+        if sort is not None:
+            if "_id" not in sort:
+                sort = collections.OrderedDict(sort)
+                sort["_id"] = 1
+                pipeline = list(pipeline)
+                pipeline[idx] = {"$sort": sort}
+
+            break
+
+    return pipeline
+
+
+def make_page_cursor(keys, samples):
+    """Returns an opaque cursor that can be passed to
+    :meth:`make_page_pipeline` to load the page following the given samples.
+
+    Any internal sort values are removed from the provided samples.
+
+    Args:
+        keys: the sort keys returned by :meth:`make_page_pipeline`
+        samples: the list of sample dicts in the page, as returned by the
+            database
+
+    Returns:
+        the cursor string, or None if no cursor can be generated
+    """
+    values = [sample.pop(_PAGE_KEY, None) for sample in samples]
+
+    if keys is None or not samples:
+        return None
+
+    if len(keys) > 1:
+        if values[-1] is None:
+            return None
+
+        values = values[-1] + [samples[-1]["_id"]]
+    else:
+        values = [samples[-1]["_id"]]
+
+    cursor = json_util.dumps({"keys": keys, "values": values})
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def _parse_page_cursor(cursor, keys):
+    try:
+        d = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        return None
+
+    # Cursors for a different sort order are ignored
+    if [tuple(k) for k in d.get("keys", [])] != keys:
+        return None
+
+    return d["values"]
+
+
+def _make_keyset_match(keys, values):
+    # Matches documents that occur after `values` in sort order
+    clauses = []
+    for idx, ((path, order), value) in enumerate(zip(keys, values)):
+        prev = {p: v for (p, _), v in zip(keys[:idx], values[:idx])}
+
+        # null/missing values occur first in ascending order
+        if value is None:
+            if order < 0:
+                continue
+
+            after = {path: {"$ne": None}}
+        elif order > 0:
+            after = {path: {"$gt": value}}
+        elif path == "_id":
+            after = {path: {"$lt": value}}
+        else:
+            after = {"$or": [{path: {"$lt": value}}, {path: None}]}
+
+        clauses.append({"$and": [prev, after]} if prev else after)
+
+    return {"$or": clauses}
+
+
 def read_metadata(filepath, metadata=None):
     """
     Calculates the metadata for a specified media file
@@ -126,30 +387,61 @@ def read_metadata(filepath, metadata=None):
     Returns:
         dict
     """
-    mimetype, _ = mimetypes.guess_type(filepath)
-    if mimetype.startswith("video/"):
-        if metadata:
-            width = metadata.get("frame_width", None)
-            height = metadata.get("frame_height", None)
-            frame_rate = metadata.get("frame_rate", None)
+    is_video = _is_video(filepath)
 
-            if width and height and frame_rate:
-                return {
-                    "width": width,
-                    "height": height,
-                    "frame_rate": frame_rate,
-                }
+    if metadata:
+        d = _parse_metadata(metadata, is_video)
+        if d is not None:
+            return d
 
-        return read_video_metadata(filepath)
+    d = _parse_metadata(probe_metadata(filepath), is_video)
+    if d is not None:
+        return d
 
-    if metadata:
-        width = metadata.get("width", None)
-        height = metadata.get("height", None)
+    if is_video:
+        return {"width": 512, "height": 512, "frame_rate": 30}
+
+    return {"width": 512, "height": 512}
+
+
+def has_metadata(filepath, metadata):
+    """Determines whether the given existing metadata contains everything
+    that :func:`read_metadata` needs, i.e., whether the media does not need to
+    be probed.
 
-        if width and height:
-            return {"width": width, "height": height}
+    Args:
+        filepath: path to the file
+        metadata: existing metadata dict, or None
 
-    return read_image_metadata(filepath)
+    Returns:
+        True/False
+    """
+    if not metadata:
+        return False
+
+    return _parse_metadata(metadata, _is_video(filepath)) is not None
+
+
+def probe_metadata(filepath):
+    """Computes the :class:`fiftyone.core.metadata.Metadata` for the specified
+    media file.
+
+    Results are cached in a process-wide LRU cache keyed by filepath and
+    modification time, so media is only probed again if it changes on disk.
+
+    Args:
+        filepath: path to the file
+
+    Returns:
+        a :class:`fiftyone.core.metadata.Metadata`, or None if the media could
+        not be read
+    """
+    try:
+        mtime = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return None
+
+    return _probe_metadata(filepath, mtime)
 
 
 def read_image_metadata(filepath):
@@ -162,14 +454,14 @@ def read_image_metadata(filepath):
     Returns:
         dict
     """
-    try:
-        width, height = get_image_size(filepath)
-        return {"width": width, "height": height}
-    except:
-        return {
-            "width": 512,
-            "height": 512,
-        }
+    d = _parse_metadata(probe_metadata(filepath), False)
+    if d is not None:
+        return d
+
+    return {
+        "width": 512,
+        "height": 512,
+    }
 
 
 def read_video_metadata(filepath):
@@ -182,15 +474,55 @@ def read_video_metadata(filepath):
     Returns:
         dict
     """
+    d = _parse_metadata(probe_metadata(filepath), True)
+    if d is not None:
+        return d
+
+    return {"width": 512, "height": 512, "frame_rate": 30}
+
+
+def _is_video(filepath):
+    mimetype, _ = mimetypes.guess_type(filepath)
+    return mimetype is not None and mimetype.startswith("video/")
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_METADATA)
+def _probe_metadata(filepath, mtime):
     try:
-        info = etav.VideoStreamInfo.build_for(filepath)
-        return {
-            "width": info.frame_size[0],
-            "height": info.frame_size[1],
-            "frame_rate": info.frame_rate,
-        }
+        if _is_video(filepath):
+            return fomt.VideoMetadata.build_for(filepath)
+
+        return fomt.ImageMetadata.build_for(filepath)
     except:
-        return {"width": 512, "height": 512, "frame_rate": 30}
+        return None
+
+
+def _parse_metadata(metadata, is_video):
+    if metadata is None:
+        return None
+
+    if isinstance(metadata, fomt.Metadata):
+        metadata = metadata.to_dict()
+
+    get = metadata.get
+
+    if is_video:
+        width = get("frame_width")
+        height = get("frame_height")
+        frame_rate = get("frame_rate")
+
+        if width and height and frame_rate:
+            return {"width": width, "height": height, "frame_rate": frame_rate}
+
+        return None
+
+    width = get("width")
+    height = get("height")
+
+    if width and height:
+        return {"width": width, "height": height}
+
+    return None
 
 
 types = collections.OrderedDict()
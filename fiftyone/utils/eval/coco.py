@@ -8,18 +8,24 @@ COCO-style detection evaluation.
 import logging
 from collections import defaultdict
 
+from bson import ObjectId
 import numpy as np
+from pymongo import UpdateOne
 
+import fiftyone.core.labels as fol
 import fiftyone.core.plots as fop
+import fiftyone.core.utils as fou
 
 from .detection import (
     DetectionEvaluation,
     DetectionEvaluationConfig,
     DetectionResults,
+    _tally_matches,
 )
 from .utils import (
     compute_ious,
     make_iscrowd_fcn,
+    _compute_bbox_array_ious,
 )
 
 
@@ -128,6 +134,112 @@ class COCOEvaluation(DetectionEvaluation):
                 "evaluation"
             )
 
+    def evaluate_samples(self, samples, eval_key=None):
+        """Performs COCO-style evaluation on the given samples.
+
+        When evaluating the bounding boxes of
+        :class:`fiftyone.core.labels.Detections`, only the necessary
+        attributes of the objects are loaded from the database, matching is
+        performed on arrays, and the results are saved via bulk updates, which
+        are then synced to the source collection of patches and frames views.
+        Otherwise, :meth:`evaluate_image` is applied to each image.
+
+        Args:
+            samples: a :class:`fiftyone.core.collections.SampleCollection`
+            eval_key (None): the evaluation key for this evaluation
+
+        Returns:
+            a list of matched
+            ``(gt_label, pred_label, iou, pred_confidence, gt_id, pred_id)``
+            tuples
+        """
+        if not self._can_evaluate_columns(samples):
+            return super().evaluate_samples(samples, eval_key=eval_key)
+
+        iou_thresh = min(self.config.iou, 1 - 1e-10)
+        classwise = self.config.classwise
+
+        columns = _load_columns(samples, self.config)
+        processing_frames = samples._is_frame_field(self.config.pred_field)
+
+        if eval_key is not None:
+            gt_path, _ = samples._handle_frame_field(
+                _get_list_path(samples, self.config.gt_field)
+            )
+            pred_path, _ = samples._handle_frame_field(
+                _get_list_path(samples, self.config.pred_field)
+            )
+
+        matches = []
+        sample_ops = []
+        frame_ops = []
+        with fou.ProgressBar(total=len(columns)) as pb:
+            for sample_id, images in pb(columns):
+                sample_tp = 0
+                sample_fp = 0
+                sample_fn = 0
+                for image_id, gts, preds in images:
+                    cats = _coco_columns_setup(gts, preds, classwise)
+                    image_matches, gt_results, pred_results = _match_columns(
+                        gts, preds, cats, iou_thresh
+                    )
+
+                    # omit iscrowd
+                    image_matches = [m[:-1] for m in image_matches]
+                    matches.extend(image_matches)
+
+                    if eval_key is None:
+                        continue
+
+                    tp, fp, fn = _tally_matches(image_matches)
+                    sample_tp += tp
+                    sample_fp += fp
+                    sample_fn += fn
+
+                    update, array_filters = _make_update(
+                        eval_key,
+                        gt_path,
+                        gts["ids"],
+                        gt_results,
+                        pred_path,
+                        preds["ids"],
+                        pred_results,
+                    )
+
+                    if processing_frames:
+                        update.update(_make_counts(eval_key, tp, fp, fn))
+
+                    if update:
+                        ops = frame_ops if processing_frames else sample_ops
+                        ops.append(
+                            UpdateOne(
+                                {"_id": image_id},
+                                {"$set": update},
+                                array_filters=array_filters or None,
+                            )
+                        )
+
+                if eval_key is not None:
+                    update = _make_counts(
+                        eval_key, sample_tp, sample_fp, sample_fn
+                    )
+                    sample_ops.append(
+                        UpdateOne({"_id": sample_id}, {"$set": update})
+                    )
+
+        dataset = samples._dataset
+        if sample_ops:
+            dataset._bulk_write(sample_ops)
+
+        if frame_ops:
+            dataset._bulk_write(frame_ops, frames=True)
+
+        if eval_key is not None:
+            ids = [sample_id for sample_id, _ in columns]
+            _sync_source(samples, self.config, eval_key, ids)
+
+        return matches
+
     def evaluate_image(self, sample_or_frame, eval_key=None):
         """Performs COCO-style evaluation on the given image.
 
@@ -206,9 +318,6 @@ class COCOEvaluation(DetectionEvaluation):
                 samples=samples,
             )
 
-        _samples = samples.select_fields([gt_field, pred_field])
-        processing_frames = samples._is_frame_field(pred_field)
-
         iou_threshs = self.config.iou_threshs
         thresh_matches = {t: {} for t in iou_threshs}
 
@@ -219,50 +328,36 @@ class COCOEvaluation(DetectionEvaluation):
 
         # IoU sweep
         logger.info("Performing IoU sweep...")
-        for sample in _samples.iter_samples(progress=True):
-            if processing_frames:
-                images = sample.frames.values()
-            else:
-                images = [sample]
-
-            for image in images:
-                # Don't edit user's data during sweep
-                gts = _copy_labels(image[self.gt_field])
-                preds = _copy_labels(image[self.pred_field])
-
-                image_matches = _coco_evaluation_iou_sweep(
-                    gts, preds, self.config
-                )
-
-                for t, t_matches in image_matches.items():
-                    for match in t_matches:
-                        gt_label = match[0]
-                        pred_label = match[1]
-                        iscrowd = match[-1]
-
-                        if _classes is not None:
-                            _classes.add(gt_label)
-                            _classes.add(pred_label)
-
-                        if iscrowd:
-                            continue
+        for image_matches in self._iou_sweep(samples):
+            for t, t_matches in image_matches.items():
+                for match in t_matches:
+                    gt_label = match[0]
+                    pred_label = match[1]
+                    iscrowd = match[-1]
+
+                    if _classes is not None:
+                        _classes.add(gt_label)
+                        _classes.add(pred_label)
+
+                    if iscrowd:
+                        continue
 
-                        c = gt_label if gt_label is not None else pred_label
+                    c = gt_label if gt_label is not None else pred_label
 
-                        if c not in thresh_matches[t]:
-                            thresh_matches[t][c] = {
-                                "tp": [],
-                                "fp": [],
-                                "num_gt": 0,
-                            }
+                    if c not in thresh_matches[t]:
+                        thresh_matches[t][c] = {
+                            "tp": [],
+                            "fp": [],
+                            "num_gt": 0,
+                        }
 
-                        if gt_label == pred_label:
-                            thresh_matches[t][c]["tp"].append(match)
-                        elif pred_label:
-                            thresh_matches[t][c]["fp"].append(match)
+                    if gt_label == pred_label:
+                        thresh_matches[t][c]["tp"].append(match)
+                    elif pred_label:
+                        thresh_matches[t][c]["fp"].append(match)
 
-                        if gt_label:
-                            thresh_matches[t][c]["num_gt"] += 1
+                    if gt_label:
+                        thresh_matches[t][c]["num_gt"] += 1
 
         if _classes is not None:
             _classes.discard(None)
@@ -324,6 +419,53 @@ class COCOEvaluation(DetectionEvaluation):
             samples=samples,
         )
 
+    def _can_evaluate_columns(self, samples):
+        if self.config.use_masks:
+            return False
+
+        label_type = samples._get_label_field_type(self.config.pred_field)
+        return issubclass(label_type, fol.Detections)
+
+    def _iou_sweep(self, samples):
+        if self._can_evaluate_columns(samples):
+            iou_threshs = self.config.iou_threshs
+            classwise = self.config.classwise
+            max_preds = self.config.max_preds
+
+            columns = _load_columns(samples, self.config)
+
+            with fou.ProgressBar(total=len(columns)) as pb:
+                for _, images in pb(columns):
+                    for _, gts, preds in images:
+                        cats = _coco_columns_setup(
+                            gts, preds, classwise, max_preds=max_preds
+                        )
+                        yield {
+                            t: _match_columns(gts, preds, cats, t)[0]
+                            for t in iou_threshs
+                        }
+
+            return
+
+        gt_field = self.config.gt_field
+        pred_field = self.config.pred_field
+
+        _samples = samples.select_fields([gt_field, pred_field])
+        processing_frames = samples._is_frame_field(pred_field)
+
+        for sample in _samples.iter_samples(progress=True):
+            if processing_frames:
+                images = sample.frames.values()
+            else:
+                images = [sample]
+
+            for image in images:
+                # Don't edit user's data during sweep
+                gts = _copy_labels(image[self.gt_field])
+                preds = _copy_labels(image[self.pred_field])
+
+                yield _coco_evaluation_iou_sweep(gts, preds, self.config)
+
 
 class COCODetectionResults(DetectionResults):
     """Class that stores the results of a COCO detection evaluation.
@@ -687,3 +829,302 @@ def _copy_labels(labels):
         _label._id = label._id
 
     return _labels
+
+
+def _get_list_path(samples, field_name):
+    label_type = samples._get_label_field_type(field_name)
+    return field_name + "." + label_type._LABEL_LIST_FIELD
+
+
+def _sync_source(samples, config, eval_key, ids):
+    # Bulk updates are not synced to the source collection of generated views
+    # like they are when saving their samples, so we must do so explicitly
+    if samples._is_patches:
+        for field in (config.gt_field, config.pred_field):
+            samples._sync_source_field(field, ids=ids)
+    elif samples._is_frames:
+        fields = [config.gt_field, config.pred_field]
+        fields.extend(eval_key + suffix for suffix in ("_tp", "_fp", "_fn"))
+        samples._sync_source(fields=fields, ids=ids)
+
+
+def _load_columns(samples, config):
+    # Only the attributes required for matching are loaded, as a list of
+    # ``(sample_id, [(image_id, gts, preds), ...])`` tuples
+    gt_path = _get_list_path(samples, config.gt_field)
+    pred_path = _get_list_path(samples, config.pred_field)
+    processing_frames = samples._is_frame_field(config.pred_field)
+
+    if processing_frames:
+        image_id_path = samples._FRAMES_PREFIX + "_id"
+    else:
+        image_id_path = "_id"
+
+    (
+        sample_ids,
+        image_ids,
+        gt_ids,
+        gt_labels,
+        gt_boxes,
+        gt_crowds,
+        gt_attr_crowds,
+        pred_ids,
+        pred_labels,
+        pred_boxes,
+        pred_confs,
+    ) = samples.values(
+        [
+            "_id",
+            image_id_path,
+            gt_path + ".id",
+            gt_path + ".label",
+            gt_path + ".bounding_box",
+            gt_path + "." + config.iscrowd,
+            gt_path + ".attributes." + config.iscrowd + ".value",
+            pred_path + ".id",
+            pred_path + ".label",
+            pred_path + ".bounding_box",
+            pred_path + ".confidence",
+        ],
+        _raw=True,
+    )
+
+    columns = zip(
+        image_ids,
+        gt_ids,
+        gt_labels,
+        gt_boxes,
+        gt_crowds,
+        gt_attr_crowds,
+        pred_ids,
+        pred_labels,
+        pred_boxes,
+        pred_confs,
+    )
+
+    if not processing_frames:
+        return [
+            (sample_id, [_parse_image_columns(*image_columns)])
+            for sample_id, image_columns in zip(sample_ids, columns)
+        ]
+
+    return [
+        (
+            sample_id,
+            [
+                _parse_image_columns(*image_columns)
+                for image_columns in zip(*(c or [] for c in sample_columns))
+            ],
+        )
+        for sample_id, sample_columns in zip(sample_ids, columns)
+    ]
+
+
+def _parse_image_columns(
+    image_id,
+    gt_ids,
+    gt_labels,
+    gt_boxes,
+    gt_crowds,
+    gt_attr_crowds,
+    pred_ids,
+    pred_labels,
+    pred_boxes,
+    pred_confs,
+):
+    # Crowd status may be a dynamic attribute or an `Attribute`, in that order
+    gt_crowds = [
+        bool(c if c is not None else a)
+        for c, a in zip(gt_crowds or [], gt_attr_crowds or [])
+    ]
+
+    gts = {
+        "ids": gt_ids or [],
+        "labels": gt_labels or [],
+        "boxes": _parse_boxes(gt_boxes),
+        "crowds": np.array(gt_crowds, dtype=bool),
+    }
+
+    preds = {
+        "ids": pred_ids or [],
+        "labels": pred_labels or [],
+        "boxes": _parse_boxes(pred_boxes),
+        "confs": pred_confs or [],
+    }
+
+    return image_id, gts, preds
+
+
+def _parse_boxes(boxes):
+    return np.array(boxes or [], dtype=float).reshape(-1, 4)
+
+
+def _coco_columns_setup(gts, preds, classwise, max_preds=None):
+    # Organize ground truth and predictions by category
+    cats = defaultdict(lambda: ([], []))
+
+    for idx, label in enumerate(gts["labels"]):
+        cats[label if classwise else "all"][0].append(idx)
+
+    for idx, label in enumerate(preds["labels"]):
+        cats[label if classwise else "all"][1].append(idx)
+
+    # Compute IoUs within each category
+    setup = []
+    for gt_inds, pred_inds in cats.values():
+        gt_inds = np.array(gt_inds, dtype=int)
+        pred_inds = np.array(pred_inds, dtype=int)
+
+        # Highest confidence predictions first
+        confs = np.array(
+            [preds["confs"][i] or -1 for i in pred_inds], dtype=float
+        )
+        pred_inds = pred_inds[np.argsort(-confs, kind="stable")]
+
+        if max_preds is not None:
+            pred_inds = pred_inds[:max_preds]
+
+        # Sort ground truth so crowds are last
+        gt_inds = gt_inds[np.argsort(gts["crowds"][gt_inds], kind="stable")]
+
+        # Compute ``num_preds x num_gts`` IoUs
+        ious = _compute_bbox_array_ious(
+            preds["boxes"][pred_inds],
+            gts["boxes"][gt_inds],
+            gts["crowds"][gt_inds],
+        )
+
+        setup.append((gt_inds, pred_inds, ious))
+
+    return setup
+
+
+def _match_columns(gts, preds, cats, iou_thresh):
+    # This is an array-based implementation of `_compute_matches()` that
+    # returns ``(eval, id, iou)`` results for each object rather than
+    # modifying them
+    matches = []
+    gt_results = [None] * len(gts["ids"])
+    pred_results = [None] * len(preds["ids"])
+
+    # Match preds to GT, highest confidence first
+    for gt_inds, pred_inds, ious in cats:
+        gt_crowds = gts["crowds"][gt_inds]
+        gt_labels = [gts["labels"][i] for i in gt_inds]
+        gt_matched = np.zeros(len(gt_inds), dtype=bool)
+
+        # Match each prediction to the highest available IoU ground truth
+        for pred_idx, pred_ious in zip(pred_inds, ious):
+            pred_id = preds["ids"][pred_idx]
+            pred_label = preds["labels"][pred_idx]
+            pred_conf = preds["confs"][pred_idx]
+            above_thresh = pred_ious >= iou_thresh
+
+            # Only iscrowd GTs can have multiple matches, and crowds are only
+            # considered if no non-crowd GT can be matched
+            inds = np.flatnonzero(above_thresh & ~gt_crowds & ~gt_matched)
+            if inds.size == 0:
+                # Only objects with the same class can match a crowd
+                same_label = np.array(
+                    [label == pred_label for label in gt_labels], dtype=bool
+                )
+                inds = np.flatnonzero(above_thresh & gt_crowds & same_label)
+
+            if inds.size == 0:
+                pred_results[pred_idx] = ("fp", _NO_MATCH_ID, _NO_MATCH_IOU)
+                matches.append(
+                    (None, pred_label, None, pred_conf, None, pred_id, None)
+                )
+                continue
+
+            # Ties are broken in favor of the last GT, per `_compute_matches()`
+            best_ious = pred_ious[inds]
+            best = inds[np.flatnonzero(best_ious == best_ious.max())[-1]]
+            best_iou = float(pred_ious[best])
+
+            gt_idx = gt_inds[best]
+            gt_id = gts["ids"][gt_idx]
+            gt_label = gt_labels[best]
+            gt_iscrowd = bool(gt_crowds[best])
+
+            # For crowd GTs, record info for first (highest confidence)
+            # matching prediction on the GT object
+            if not gt_matched[best]:
+                gt_matched[best] = True
+                gt_results[gt_idx] = (
+                    "tp" if gt_label == pred_label else "fn",
+                    pred_id,
+                    best_iou,
+                )
+
+            pred_results[pred_idx] = (
+                "tp" if gt_label == pred_label else "fp",
+                gt_id,
+                best_iou,
+            )
+            matches.append(
+                (
+                    gt_label,
+                    pred_label,
+                    best_iou,
+                    pred_conf,
+                    gt_id,
+                    pred_id,
+                    gt_iscrowd,
+                )
+            )
+
+        # Leftover GTs are false negatives, in their original order
+        for idx in np.argsort(gt_inds):
+            if gt_matched[idx]:
+                continue
+
+            gt_idx = gt_inds[idx]
+            gt_results[gt_idx] = ("fn", _NO_MATCH_ID, _NO_MATCH_IOU)
+            matches.append(
+                (
+                    gt_labels[idx],
+                    None,
+                    None,
+                    None,
+                    gts["ids"][gt_idx],
+                    None,
+                    bool(gt_crowds[idx]),
+                )
+            )
+
+    return matches, gt_results, pred_results
+
+
+def _make_update(
+    eval_key, gt_path, gt_ids, gt_results, pred_path, pred_ids, pred_results
+):
+    # Objects are updated by ID via array filters, since the label lists may
+    # have been filtered
+    update = {}
+    array_filters = []
+    for prefix, path, ids, results in (
+        ("g", gt_path, gt_ids, gt_results),
+        ("p", pred_path, pred_ids, pred_results),
+    ):
+        for idx, (_id, result) in enumerate(zip(ids, results)):
+            if result is None:
+                continue
+
+            ident = "%s%d" % (prefix, idx)
+            elem = "%s.$[%s]." % (path, ident)
+            _eval, _eval_id, _eval_iou = result
+            update[elem + eval_key] = _eval
+            update[elem + eval_key + "_id"] = _eval_id
+            update[elem + eval_key + "_iou"] = _eval_iou
+            array_filters.append({ident + "._id": ObjectId(_id)})
+
+    return update, array_filters
+
+
+def _make_counts(eval_key, tp, fp, fn):
+    return {
+        "%s_tp" % eval_key: tp,
+        "%s_fp" % eval_key: fp,
+        "%s_fn" % eval_key: fn,
+    }
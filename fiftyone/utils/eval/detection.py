@@ -142,11 +142,6 @@ def evaluate_detections(
     eval_method.register_run(samples, eval_key)
     eval_method.register_samples(samples)
 
-    if not config.requires_additional_fields:
-        _samples = samples.select_fields([gt_field, pred_field])
-    else:
-        _samples = samples
-
     processing_frames = samples._is_frame_field(pred_field)
 
     if eval_key is not None:
@@ -165,37 +160,8 @@ def evaluate_detections(
             dataset._add_frame_field_if_necessary(fp_field, fof.IntField)
             dataset._add_frame_field_if_necessary(fn_field, fof.IntField)
 
-    matches = []
     logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        sample_tp = 0
-        sample_fp = 0
-        sample_fn = 0
-        for image in images:
-            image_matches = eval_method.evaluate_image(
-                image, eval_key=eval_key
-            )
-            matches.extend(image_matches)
-            tp, fp, fn = _tally_matches(image_matches)
-            sample_tp += tp
-            sample_fp += fp
-            sample_fn += fn
-
-            if processing_frames and eval_key is not None:
-                image[tp_field] = tp
-                image[fp_field] = fp
-                image[fn_field] = fn
-
-        if eval_key is not None:
-            sample[tp_field] = sample_tp
-            sample[fp_field] = sample_fp
-            sample[fn_field] = sample_fn
-            sample.save()
+    matches = eval_method.evaluate_samples(samples, eval_key=eval_key)
 
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
@@ -269,6 +235,74 @@ class DetectionEvaluation(foe.EvaluationMethod):
             self.config.pred_field
         )
 
+    def evaluate_samples(self, samples, eval_key=None):
+        """Evaluates the ground truth and predicted objects in the given
+        samples.
+
+        If an ``eval_key`` is provided, the per-object results of the
+        evaluation and the TP/FP/FN counts of each sample (and each frame, if
+        applicable) must be saved by this method.
+
+        By default, this method applies :meth:`evaluate_image` to each image
+        in the collection. Subclasses can override this method to provide a
+        more efficient implementation.
+
+        Args:
+            samples: a :class:`fiftyone.core.collections.SampleCollection`
+            eval_key (None): the evaluation key for this evaluation
+
+        Returns:
+            a list of matched
+            ``(gt_label, pred_label, iou, pred_confidence, gt_id, pred_id)``
+            tuples
+        """
+        gt_field = self.config.gt_field
+        pred_field = self.config.pred_field
+
+        if not self.config.requires_additional_fields:
+            _samples = samples.select_fields([gt_field, pred_field])
+        else:
+            _samples = samples
+
+        processing_frames = samples._is_frame_field(pred_field)
+
+        if eval_key is not None:
+            tp_field = "%s_tp" % eval_key
+            fp_field = "%s_fp" % eval_key
+            fn_field = "%s_fn" % eval_key
+
+        matches = []
+        for sample in _samples.iter_samples(
+            progress=True, autosave=eval_key is not None
+        ):
+            if processing_frames:
+                images = sample.frames.values()
+            else:
+                images = [sample]
+
+            sample_tp = 0
+            sample_fp = 0
+            sample_fn = 0
+            for image in images:
+                image_matches = self.evaluate_image(image, eval_key=eval_key)
+                matches.extend(image_matches)
+                tp, fp, fn = _tally_matches(image_matches)
+                sample_tp += tp
+                sample_fp += fp
+                sample_fn += fn
+
+                if processing_frames and eval_key is not None:
+                    image[tp_field] = tp
+                    image[fp_field] = fp
+                    image[fn_field] = fn
+
+            if eval_key is not None:
+                sample[tp_field] = sample_tp
+                sample[fp_field] = sample_fp
+                sample[fn_field] = sample_fn
+
+        return matches
+
     def evaluate_image(self, sample_or_frame, eval_key=None):
         """Evaluates the ground truth and predicted objects in an image.
 
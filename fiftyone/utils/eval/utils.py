@@ -98,48 +98,104 @@ def compute_ious(
     return _compute_bbox_ious(preds, gts, iscrowd=iscrowd)
 
 
+def compute_batch_bbox_ious(preds_list, gts_list, iscrowd=None):
+    """Computes the pairwise bounding box IoUs between the predicted and
+    ground truth objects for a batch of images in a single vectorized
+    operation.
+
+    This is equivalent to, but more efficient than, calling
+    :meth:`compute_ious` on each image's objects when there are many images
+    with modest numbers of objects.
+
+    Args:
+        preds_list: a list of lists of predicted
+            :class:`fiftyone.core.labels.Detection` or
+            :class:`fiftyone.core.labels.Polyline` instances
+        gts_list: a list of lists of ground truth
+            :class:`fiftyone.core.labels.Detection` or
+            :class:`fiftyone.core.labels.Polyline` instances
+        iscrowd (None): an optional boolean function that determines whether a
+            ground truth object is a crowd. If provided, the area of the
+            predicted object is used as the "union" area for IoU calculations
+            involving crowd objects
+
+    Returns:
+        a list of ``num_preds x num_gts`` arrays of IoUs
+    """
+    num_images = len(preds_list)
+    if num_images == 0:
+        return []
+
+    num_preds = [len(preds) for preds in preds_list]
+    num_gts = [len(gts) for gts in gts_list]
+    max_preds = max(num_preds)
+    max_gts = max(num_gts)
+
+    # Pad the boxes into dense arrays so that all IoUs can be computed at once
+    pred_boxes = np.zeros((num_images, max_preds, 4))
+    gt_boxes = np.zeros((num_images, max_gts, 4))
+    gt_crowds = np.zeros((num_images, max_gts), dtype=bool)
+    for idx, (preds, gts) in enumerate(zip(preds_list, gts_list)):
+        if preds:
+            pred_boxes[idx, : len(preds)] = _to_bbox_array(preds)
+
+        if gts:
+            gt_boxes[idx, : len(gts)] = _to_bbox_array(gts)
+            gt_crowds[idx, : len(gts)] = _to_crowd_array(gts, iscrowd)
+
+    ious = _compute_bbox_array_ious(pred_boxes, gt_boxes, gt_crowds)
+
+    return [
+        ious[idx, :num_pred, :num_gt]
+        for idx, (num_pred, num_gt) in enumerate(zip(num_preds, num_gts))
+    ]
+
+
 def _compute_bbox_ious(preds, gts, iscrowd=None):
-    num_pred = len(preds)
-    num_gt = len(gts)
+    pred_boxes = _to_bbox_array(preds)
+    gt_boxes = _to_bbox_array(gts)
+    gt_crowds = _to_crowd_array(gts, iscrowd)
+    return _compute_bbox_array_ious(pred_boxes, gt_boxes, gt_crowds)
 
-    if iscrowd is not None:
-        gt_crowds = [iscrowd(gt) for gt in gts]
-    else:
-        gt_crowds = [False] * num_gt
 
-    if isinstance(preds[0], fol.Polyline):
-        preds = _polylines_to_detections(preds)
-        gts = _polylines_to_detections(gts)
+def _to_bbox_array(labels):
+    if labels and isinstance(labels[0], fol.Polyline):
+        labels = _polylines_to_detections(labels)
+
+    boxes = [label.bounding_box for label in labels]
+    return np.array(boxes, dtype=float).reshape(-1, 4)
 
-    ious = np.zeros((len(preds), len(gts)))
-    for j, (gt, gt_crowd) in enumerate(zip(gts, gt_crowds)):
-        gx, gy, gw, gh = gt.bounding_box
-        gt_area = gh * gw
 
-        for i, pred in enumerate(preds):
-            px, py, pw, ph = pred.bounding_box
-            pred_area = ph * pw
+def _to_crowd_array(gts, iscrowd):
+    if iscrowd is None:
+        return np.zeros(len(gts), dtype=bool)
 
-            # Width of intersection
-            w = min(px + pw, gx + gw) - max(px, gx)
-            if w <= 0:
-                continue
+    return np.array([iscrowd(gt) for gt in gts], dtype=bool)
 
-            # Height of intersection
-            h = min(py + ph, gy + gh) - max(py, gy)
-            if h <= 0:
-                continue
 
-            inter = h * w
+def _compute_bbox_array_ious(pred_boxes, gt_boxes, gt_crowds):
+    # Boxes are ``(..., num, 4)`` arrays in ``[x, y, w, h]`` format
+    px, py, pw, ph = (b[..., :, None] for b in np.moveaxis(pred_boxes, -1, 0))
+    gx, gy, gw, gh = (b[..., None, :] for b in np.moveaxis(gt_boxes, -1, 0))
 
-            if gt_crowd:
-                union = pred_area
-            else:
-                union = pred_area + gt_area - inter
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+    inter = np.maximum(w, 0) * np.maximum(h, 0)
 
-            ious[i, j] = min(etan.safe_divide(inter, union), 1)
+    pred_area = pw * ph
+    gt_area = gw * gh
+    union = np.where(
+        gt_crowds[..., None, :], pred_area, pred_area + gt_area - inter
+    )
+
+    ious = np.divide(
+        inter,
+        union,
+        out=np.zeros_like(inter),
+        where=(inter > 0) & (union != 0),
+    )
 
-    return ious
+    return np.minimum(ious, 1)
 
 
 def _compute_polyline_ious(
@@ -101,8 +101,16 @@ def parse_patches(doc, patches_field, handle_missing="skip"):
     Returns:
         a :class:`fiftyone.core.labels.Detections` instance, or ``None``
     """
-    label = doc[patches_field]
+    dtype = "Frame" if isinstance(doc, fof.Frame) else "Sample"
+    return _parse_patches(
+        doc[patches_field],
+        patches_field,
+        handle_missing,
+        "%s '%s'" % (dtype, doc.id),
+    )
+
 
+def _parse_patches(label, patches_field, handle_missing, doc_str):
     if isinstance(label, fol.Detections):
         patches = label
     elif isinstance(label, fol.Detection):
@@ -127,8 +135,7 @@ def parse_patches(doc, patches_field, handle_missing="skip"):
                 detections=[fol.Detection(bounding_box=[0, 0, 1, 1])]
             )
         else:
-            dtype = "Frame" if isinstance(doc, fof.Frame) else "Sample"
-            raise ValueError("%s '%s' has no patches" % (dtype, doc.id))
+            raise ValueError("%s has no patches" % doc_str)
 
     return patches
 
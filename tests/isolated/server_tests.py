@@ -13,6 +13,7 @@ To run a single test, modify the main code to::
 """
 import asyncio
 from collections import defaultdict
+import io
 import json
 import os
 import posixpath
@@ -20,8 +21,10 @@ import time
 import unittest
 import urllib
 
+import bson
 from bson import ObjectId
 import numpy as np
+import PIL.Image
 from tornado.testing import AsyncHTTPTestCase
 from tornado.websocket import websocket_connect
 
@@ -29,12 +32,29 @@ import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone as fo
+from fiftyone import ViewField as F
+import fiftyone.core.odm as foo
 import fiftyone.core.state as fos
-from fiftyone.server.json_util import FiftyOneJSONEncoder
+import fiftyone.core.utils as fou
+from fiftyone.server.json_util import (
+    FiftyOneJSONEncoder,
+    replace_vector_fields,
+)
 import fiftyone.server.main as fosm
+import fiftyone.server.thumbnails as fost
+import fiftyone.server.utils as fosu
+
+
+def _get_db_ioloop():
+    # The server's async database client is bound to the event loop that was
+    # current when it was created, so coroutines that use it must run there
+    return foo.get_async_db_conn().client.get_io_loop()
 
 
 class TestCase(AsyncHTTPTestCase):
+    def get_new_ioloop(self):
+        return _get_db_ioloop()
+
     def get_app(self):
         return fosm.Application()
 
@@ -59,6 +79,90 @@ class RouteTests(TestCase):
 
         self.assertEqual(response, data)
 
+    def test_thumbnail(self):
+        with etau.TempDir() as tmp:
+            path = os.path.join(tmp, "image.jpg")
+            img = np.random.randint(255, size=(1000, 2000, 3), dtype=np.uint8)
+            PIL.Image.fromarray(img).save(path)
+
+            fost._cache = fost.ThumbnailCache(
+                os.path.join(tmp, "thumbnails"), 10 ** 6
+            )
+
+            url = "/thumbnail/%s?size=200" % urllib.parse.quote(path, safe="")
+            response = self.fetch(url)
+            self.assertEqual(response.code, 200)
+            self.assertEqual(response.headers["Content-Type"], "image/jpeg")
+
+            thumbnail = PIL.Image.open(io.BytesIO(response.body))
+            self.assertEqual(thumbnail.size, (256, 128))
+
+            etag = response.headers["Etag"]
+            response = self.fetch(url, headers={"If-None-Match": etag})
+            self.assertEqual(response.code, 304)
+
+            # EXIF orientation is applied
+            path = os.path.join(tmp, "rotated.jpg")
+            exif = PIL.Image.Exif()
+            exif[0x0112] = 6
+            PIL.Image.fromarray(img).save(path, exif=exif)
+
+            url = "/thumbnail/%s?size=200" % urllib.parse.quote(path, safe="")
+            response = self.fetch(url)
+            thumbnail = PIL.Image.open(io.BytesIO(response.body))
+            self.assertEqual(thumbnail.size, (128, 256))
+
+            # Images that cannot be decoded are served as-is
+            for filename, content in (
+                ("image.svg", b"<svg xmlns='http://www.w3.org/2000/svg'/>"),
+                ("corrupt.jpg", b"not an image"),
+            ):
+                path = os.path.join(tmp, filename)
+                with open(path, "wb") as f:
+                    f.write(content)
+
+                url = "/thumbnail/%s?size=200" % urllib.parse.quote(
+                    path, safe=""
+                )
+                response = self.fetch(url)
+                self.assertEqual(response.code, 200)
+                self.assertEqual(response.body, content)
+
+            fost._cache = None
+
+    def test_frames(self):
+        dataset = fo.Dataset()
+        sample = fo.Sample(filepath="video.mp4")
+        for frame_number in range(1, 11):
+            sample.frames[frame_number] = fo.Frame(
+                label=fo.Classification(label=str(frame_number)),
+                other=frame_number,
+            )
+
+        dataset.add_sample(sample)
+        fosm.StateHandler.set_state(fos.StateDescription(dataset=dataset))
+
+        url = "/frames?sampleId=%s&frameNumber=3&numFrames=4&frameCount=10" % (
+            sample.id
+        )
+
+        response = self.fetch_and_parse(url + "&fields=label")
+        self.assertListEqual(response["range"], [3, 7])
+        self.assertListEqual(
+            [f["frame_number"] for f in response["frames"]], [3, 4, 5, 6, 7]
+        )
+        self.assertTrue(all("other" not in f for f in response["frames"]))
+        self.assertEqual(response["frames"][0]["label"]["label"], "3")
+
+        response = self.fetch(url + "&format=ndjson")
+        chunks = [json.loads(l) for l in response.body.decode().splitlines()]
+        frames = [f for chunk in chunks for f in chunk["frames"]]
+        self.assertListEqual([f["other"] for f in frames], [3, 4, 5, 6, 7])
+        self.assertEqual(chunks[-1]["range"][1], 7)
+
+        fosm.StateHandler.set_state(fos.StateDescription())
+        dataset.delete()
+
     def test_reactivate(self):
         handle_id = "handle_id"
         response = self.fetch_and_parse("/reactivate?handleId=%s" % handle_id)
@@ -71,6 +175,395 @@ class RouteTests(TestCase):
         self.assertEqual(response, fosm.StagesHandler.get_response())
 
 
+class PaginationTests(unittest.TestCase):
+    def _get_pages(self, view, page_length):
+        coll = foo.get_db_conn()[view._dataset._sample_collection_name]
+
+        ids = []
+        cursors = []
+        page = 1
+        cursor = None
+        while True:
+            pipeline, keys = fosu.make_page_pipeline(
+                view, page, page_length, cursor=cursor
+            )
+            samples = list(coll.aggregate(pipeline))
+            more = len(samples) > page_length
+            samples = samples[:page_length]
+
+            cursor = fosu.make_page_cursor(keys, samples)
+            cursors.append(cursor)
+            ids.extend(str(s["_id"]) for s in samples)
+
+            if not more:
+                return ids, keys, cursors
+
+            page += 1
+
+    def test_keyset_pagination(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image%d.jpg" % i, value=i % 3)
+                for i in range(10)
+            ]
+            + [fo.Sample(filepath="image10.jpg")]
+        )
+
+        for view, keyed in (
+            (dataset, True),
+            (dataset.sort_by("value"), True),
+            (dataset.sort_by("value", reverse=True), True),
+            (dataset.match(F("value") > 0).sort_by("filepath"), True),
+            (dataset.sort_by("value").select_fields("value"), True),
+            (dataset.sort_by("value").exclude_fields("value"), True),
+            (dataset.sort_by(F("value") * -1), False),
+            (dataset.skip(2), False),
+        ):
+            ids, keys, cursors = self._get_pages(view, 3)
+            self.assertEqual(keys is not None, keyed)
+            if keyed:
+                self.assertTrue(all(c is not None for c in cursors))
+            self.assertEqual(len(ids), len(view))
+            self.assertEqual(len(set(ids)), len(ids))
+
+            self.assertSetEqual(set(ids), set(view.values("id")))
+
+        dataset.delete()
+
+
+class MetadataTests(unittest.TestCase):
+    def test_read_metadata(self):
+        with etau.TempDir() as tmp:
+            path = os.path.join(tmp, "image.png")
+            PIL.Image.new("RGB", (30, 20)).save(path)
+
+            metadata = fosu.read_metadata(path)
+            self.assertDictEqual(metadata, {"width": 30, "height": 20})
+
+            hits = fosu._probe_metadata.cache_info().hits
+            metadata = fosu.read_metadata(path)
+            self.assertDictEqual(metadata, {"width": 30, "height": 20})
+            self.assertEqual(fosu._probe_metadata.cache_info().hits, hits + 1)
+
+            metadata = fosu.read_metadata(path, {"width": 3, "height": 2})
+            self.assertDictEqual(metadata, {"width": 3, "height": 2})
+
+            # Modified media is probed again
+            PIL.Image.new("RGB", (40, 20)).save(path)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+            metadata = fosu.read_metadata(path)
+            self.assertDictEqual(metadata, {"width": 40, "height": 20})
+
+
+class StatisticsTests(unittest.TestCase):
+    def test_incremental_statistics(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    value=i,
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat")]
+                    ),
+                )
+                for i in range(4)
+            ]
+        )
+
+        stats = fos.DatasetStatistics(dataset)
+        aggregations = stats.aggregations
+
+        inds = stats.get_dependent_aggregations(["tags"])
+        self.assertListEqual(
+            [aggregations[idx].field_name for idx in inds], ["tags", "tags"]
+        )
+
+        inds = stats.get_dependent_aggregations(["ground_truth"])
+        for idx in inds:
+            self.assertTrue(
+                aggregations[idx].field_name.startswith("ground_truth.")
+            )
+
+        async def _aggregate(touched_paths=None):
+            return await fosm._aggregate_statistics(
+                dataset, stats, dataset, {}, False, touched_paths
+            )
+
+        loop = _get_db_ioloop().asyncio_loop
+        loop.run_until_complete(_aggregate())
+
+        dataset.take(2).tag_samples("test")
+        paths = fosm._get_tag_paths(dataset, False, None)
+        results = loop.run_until_complete(_aggregate(touched_paths=paths))
+        expected = dataset.aggregate(aggregations)
+
+        self.assertEqual(
+            FiftyOneJSONEncoder.dumps(results),
+            FiftyOneJSONEncoder.dumps(expected),
+        )
+
+        # Views whose contents depend on the touched paths are recomputed
+        view = dataset.match(F("tags").contains("test"))
+        self.assertTrue(
+            fosm._view_depends_on_paths(view._serialize(), {}, paths)
+        )
+        self.assertTrue(
+            fosm._view_depends_on_paths(
+                dataset.match_tags("test")._serialize(), {}, paths
+            )
+        )
+        self.assertFalse(
+            fosm._view_depends_on_paths(
+                dataset.limit(2)._serialize(), {}, paths
+            )
+        )
+
+        stats = fos.DatasetStatistics(view)
+        aggregations = stats.aggregations
+
+        async def _aggregate_view(touched_paths=None):
+            return await fosm._aggregate_statistics(
+                view, stats, view, {}, False, touched_paths
+            )
+
+        loop.run_until_complete(_aggregate_view())
+
+        dataset.tag_samples("test")
+        results = loop.run_until_complete(_aggregate_view(touched_paths=paths))
+        expected = view.aggregate(aggregations)
+
+        self.assertEqual(
+            FiftyOneJSONEncoder.dumps(results),
+            FiftyOneJSONEncoder.dumps(expected),
+        )
+
+        dataset.delete()
+
+    def test_numeric_bounds_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, value=i) for i in range(4)]
+        )
+        view = dataset.match(F("value") > 0)
+
+        loop = _get_db_ioloop().asyncio_loop
+        bounds = loop.run_until_complete(
+            fosm._get_numeric_bounds(view, ["value"])
+        )
+        self.assertListEqual(bounds, [(0, 3)])
+
+        keys = [k for k in fosm._bounds_cache if k[0] == dataset.name]
+        self.assertEqual(len(keys), 1)
+
+        # Other views of the dataset reuse the cached bounds
+        view = dataset.match(F("value") > 1).sort_by("value")
+        bounds = loop.run_until_complete(
+            fosm._get_numeric_bounds(view, ["value"])
+        )
+        self.assertListEqual(bounds, [(0, 3)])
+
+        keys = [k for k in fosm._bounds_cache if k[0] == dataset.name]
+        self.assertEqual(len(keys), 1)
+
+        dataset.set_values("value", [5, 6, 7, 8])
+        bounds = loop.run_until_complete(
+            fosm._get_numeric_bounds(view, ["value"])
+        )
+        self.assertListEqual(bounds, [(5, 8)])
+
+        # Views that may change the values of fields are not cached
+        view = dataset.set_field("value", F("value") * 2)
+        bounds = loop.run_until_complete(
+            fosm._get_numeric_bounds(view, ["value"])
+        )
+        self.assertListEqual(bounds, [(10, 16)])
+
+        dataset.delete()
+
+
+class StateCacheTests(unittest.TestCase):
+    def test_state_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(
+            fo.Sample(filepath="image.jpg", label=fo.Classification(label="a"))
+        )
+
+        handler = fosm.StateHandler
+        handler.set_state(fos.StateDescription(dataset=dataset))
+        revision = handler.revision
+
+        state1 = handler.get_state()
+        state1.selected = ["foo"]
+        state2 = handler.get_state()
+        self.assertListEqual(state2.selected, [])
+        self.assertEqual(handler.revision, revision)
+
+        filters = {
+            "label.label": {"values": ["a"], "exclude": False, "_CLS": "str"}
+        }
+        view1 = handler.get_extended_view(filters)
+        view2 = handler.get_extended_view(filters)
+        self.assertIs(view1, view2)
+
+        handler.update_state(selected=[dataset.first().id])
+        self.assertEqual(handler.revision, revision + 1)
+        self.assertEqual(len(handler.get_state().selected), 1)
+        self.assertIsNot(handler.get_extended_view(filters), view1)
+
+        handler.set_state(fos.StateDescription())
+        dataset.delete()
+
+
+class VectorFieldsTests(unittest.TestCase):
+    def test_replace_vector_fields(self):
+        dataset = fo.Dataset()
+        sample = fo.Sample(filepath="video.mp4", embedding=np.zeros(4))
+        sample.frames[1] = fo.Frame(embedding=np.zeros((2, 3)))
+        dataset.add_sample(sample)
+
+        fields, frame_fields = fosm._get_vector_fields(dataset)
+        self.assertListEqual(fields, ["embedding"])
+        self.assertListEqual(frame_fields, ["embedding"])
+
+        raw_mask = fou.serialize_numpy_array(np.eye(4, dtype=np.uint8))
+        samples = [
+            {
+                "embedding": fou.serialize_numpy_array(np.zeros(4)),
+                "label": {"mask": raw_mask},
+                "frames": [
+                    {"embedding": fou.serialize_numpy_array(np.zeros((2, 3)))},
+                    {"embedding": None},
+                ],
+            }
+        ]
+        replace_vector_fields(samples, fields, frame_fields=frame_fields)
+
+        self.assertEqual(samples[0]["embedding"], "(4,)")
+        self.assertEqual(samples[0]["label"]["mask"], raw_mask)
+        self.assertEqual(samples[0]["frames"][0]["embedding"], "(2, 3)")
+        self.assertIsNone(samples[0]["frames"][1]["embedding"])
+
+        dataset.delete()
+
+
+class MessageTests(TestCase):
+    def get_ws(self, binary=False):
+        path = "ws://localhost:%d/state" % self.get_http_port()
+        if binary:
+            path += "?binary=true"
+
+        websocket_connect(path, callback=self.stop)
+        client = self.wait().result()
+
+        # Discard the initial state update
+        client.read_message(self.stop)
+        self.wait()
+
+        return client
+
+    def read(self, client):
+        client.read_message(self.stop)
+        return self.wait().result()
+
+    def test_raw_message(self):
+        binary_client = self.get_ws(binary=True)
+        json_client = self.get_ws()
+
+        mask = np.eye(4, dtype=np.uint8)
+        raw_mask = fou.serialize_numpy_array(mask)
+        raw_embedding = fou.serialize_numpy_array(np.zeros((2, 8)))
+        _id = ObjectId()
+        message = {
+            "type": "samples_update",
+            "samples": [
+                {
+                    "_id": _id,
+                    "label": {"mask": raw_mask},
+                    "embedding": raw_embedding,
+                }
+            ],
+        }
+        replace_vector_fields(message["samples"], ["embedding"])
+
+        fosm._write_message(message, raw=True)
+
+        binary_message = self.read(binary_client)
+        self.assertIsInstance(binary_message, bytes)
+        sample = bson.decode(binary_message)["samples"][0]
+        self.assertEqual(sample["_id"], _id)
+        self.assertEqual(sample["label"]["mask"], raw_mask)
+        self.assertEqual(sample["embedding"], "(2, 8)")
+
+        json_message = FiftyOneJSONEncoder.loads(self.read(json_client))
+        sample = json_message["samples"][0]
+        self.assertEqual(sample["_id"], str(_id))
+        self.assertIsInstance(sample["label"]["mask"], str)
+        np.testing.assert_array_equal(
+            fou.deserialize_numpy_array(sample["label"]["mask"], ascii=True),
+            mask,
+        )
+        self.assertEqual(sample["embedding"], "(2, 8)")
+
+        binary_client.close()
+        json_client.close()
+
+    def test_serialize_once(self):
+        clients = [self.get_ws() for _ in range(3)]
+
+        dumps = fosm.StateHandler.dumps
+        num_calls = []
+
+        def _dumps(data):
+            num_calls.append(1)
+            return dumps(data)
+
+        fosm.StateHandler.dumps = staticmethod(_dumps)
+        try:
+            fosm._write_message({"type": "test", "value": 1})
+        finally:
+            fosm.StateHandler.dumps = staticmethod(dumps)
+
+        self.assertEqual(len(num_calls), 1)
+
+        for client in clients:
+            message = FiftyOneJSONEncoder.loads(self.read(client))
+            self.assertEqual(message, {"type": "test", "value": 1})
+            client.close()
+
+    def test_debounce_statistics(self):
+        computed = []
+
+        async def _send(only=None, touched_paths=None):
+            computed.append(touched_paths)
+
+        get_awaitables = fosm.StateHandler.__dict__[
+            "get_statistics_awaitables"
+        ]
+        fosm.StateHandler.get_statistics_awaitables = classmethod(
+            lambda cls, only=None, touched_paths=None: [
+                _send(only=only, touched_paths=touched_paths)
+            ]
+        )
+
+        async def _schedule():
+            fosm.StateHandler.schedule_statistics(touched_paths={"tags"})
+            task = fosm.StateHandler.schedule_statistics(
+                touched_paths={"ground_truth.detections.tags"}
+            )
+            await task
+
+        try:
+            self.io_loop.run_sync(_schedule)
+        finally:
+            fosm.StateHandler.get_statistics_awaitables = get_awaitables
+
+        self.assertEqual(computed, [{"tags", "ground_truth.detections.tags"}])
+
+
 class StateTests(TestCase):
 
     image_url = "https://user-images.githubusercontent.com/3719547/74191434-8fe4f500-4c21-11ea-8d73-555edfce0854.png"
@@ -6,6 +6,7 @@ FiftyOne aggregation-related unit tests.
 |
 """
 from bson import ObjectId
+from pymongo.errors import OperationFailure
 import unittest
 
 import fiftyone as fo
@@ -577,6 +578,161 @@ class DatasetTests(unittest.TestCase):
         results = dataset.values(fields)
         self.assertEqual(len(fields), len(results))
 
+    @drop_datasets
+    def test_streaming(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    number=i % 3,
+                    det=fo.Detections(detections=[fo.Detection(label=str(i))]),
+                )
+                for i in range(10)
+            ]
+        )
+
+        values = dataset.values("number", stream=True)
+        self.assertNotIsInstance(values, list)
+        self.assertListEqual(list(values), dataset.values("number"))
+
+        labels = dataset.values("det.detections.label", stream=True)
+        self.assertListEqual(
+            list(labels), dataset.values("det.detections.label")
+        )
+
+        distinct = dataset.distinct("number", stream=True)
+        self.assertNotIsInstance(distinct, list)
+        self.assertListEqual(list(distinct), [0, 1, 2])
+
+        results = dataset.aggregate(
+            [
+                fo.Count(),
+                fo.Values("number", stream=True),
+                fo.Distinct("number", stream=True),
+                fo.Values("id"),
+            ]
+        )
+        self.assertEqual(results[0], 10)
+        self.assertListEqual(list(results[1]), dataset.values("number"))
+        self.assertListEqual(list(results[2]), [0, 1, 2])
+        self.assertEqual(len(results[3]), 10)
+
+        self.assertListEqual(
+            list(dataset.limit(0).values("number", stream=True)), []
+        )
+
+    @drop_datasets
+    def test_merged_facets(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="video1.mp4", number=1),
+                fo.Sample(filepath="video2.mp4", number=2),
+            ]
+        )
+        dataset.add_frame_field("value", fo.IntField)
+        for sample in dataset:
+            for frame_number in range(1, 4):
+                sample.frames[frame_number] = fo.Frame(value=frame_number)
+
+            sample.save()
+
+        aggregations = [
+            fo.Count(),
+            fo.Bounds("number"),
+            fo.Count("frames"),
+            fo.Sum("frames.value"),
+            fo.Distinct("number"),
+        ]
+
+        facets = dataset._build_facets(dict(enumerate(aggregations)))
+        self.assertEqual(len(facets), 2)
+
+        results = dataset.aggregate(aggregations)
+        self.assertListEqual(
+            results, [dataset.aggregate(a) for a in aggregations]
+        )
+        self.assertListEqual(results, [2, (1, 2), 6, 12, [1, 2]])
+
+        self.assertListEqual(
+            dataset.limit(0).aggregate(aggregations),
+            [0, (None, None), 0, 0, []],
+        )
+
+        error = OperationFailure("too large", code=10334)
+        _facets = dataset._split_facets(facets, error)
+        self.assertEqual(len(_facets), 4)
+
+        _facets = dataset._split_facets(_facets, error)
+        self.assertEqual(len(_facets), 5)
+
+        with self.assertRaises(OperationFailure):
+            dataset._split_facets(_facets, error)
+
+        with self.assertRaises(OperationFailure):
+            dataset._split_facets(
+                facets, OperationFailure("other error", code=2)
+            )
+
+    @drop_datasets
+    def test_frames_aggregations(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="video1.mp4", number=1),
+                fo.Sample(filepath="video2.mp4", number=2),
+            ]
+        )
+        dataset.add_frame_field("value", fo.IntField)
+        for sample in dataset:
+            for frame_number in range(1, 4):
+                sample.frames[frame_number] = fo.Frame(
+                    value=sample.number * frame_number,
+                    gt=fo.Detections(detections=[fo.Detection(label="cat")]),
+                )
+
+            sample.save()
+
+        sum_agg = fo.Sum("frames.value")
+        self.assertIsNotNone(sum_agg._to_frames_mongo(dataset))
+        self.assertIsNone(fo.Sum("number")._to_frames_mongo(dataset))
+        self.assertIsNone(fo.Values("frames.value")._to_frames_mongo(dataset))
+
+        coll_name, _ = dataset._build_big_pipeline(
+            fo.Distinct("frames.value", stream=True)
+        )
+        self.assertEqual(coll_name, dataset._frame_collection_name)
+
+        self.assertEqual(dataset.sum("frames.value"), 18)
+        self.assertEqual(dataset.count("frames"), 6)
+        self.assertEqual(dataset.bounds("frames.value"), (1, 6))
+        self.assertDictEqual(
+            dataset.count_values("frames.gt.detections.label"), {"cat": 6}
+        )
+        self.assertListEqual(
+            list(dataset.distinct("frames.value", stream=True)),
+            [1, 2, 3, 4, 6],
+        )
+
+        # Views whose stages don't require frames
+        view = dataset.match(F("number") == 2)
+        self.assertFalse(view._needs_frames())
+        self.assertEqual(view.sum("frames.value"), 12)
+        self.assertEqual(view.count("frames"), 3)
+        self.assertListEqual(view.distinct("frames.value"), [2, 4, 6])
+
+        # Views whose stages require frames
+        view = dataset.match_frames(F("value") > 2)
+        self.assertTrue(view._needs_frames())
+        self.assertEqual(view.sum("frames.value"), 13)
+        self.assertEqual(view.count("frames"), 3)
+
+        # Frame order is preserved when it matters
+        self.assertListEqual(
+            dataset.values("frames.value"), [[1, 2, 3], [2, 4, 6]]
+        )
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
@@ -16,6 +16,7 @@ import eta.core.utils as etau
 import fiftyone as fo
 from fiftyone import ViewField as F
 import fiftyone.core.odm as foo
+import fiftyone.core.state as fost
 
 from decorators import drop_datasets
 
@@ -185,6 +186,56 @@ class DatasetTests(unittest.TestCase):
         for sample in dataset.iter_samples(progress=True):
             pass
 
+    @drop_datasets
+    def test_iter_samples_autosave(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(50)]
+        )
+
+        for idx, sample in enumerate(
+            dataset.iter_samples(autosave=True, batch_size=7)
+        ):
+            sample["int"] = idx
+
+        self.assertListEqual(dataset.values("int"), list(range(50)))
+
+        view = dataset.limit(10)
+        for sample in view.iter_samples(autosave=True, batch_latency=0):
+            sample["int"] = -sample["int"]
+
+        self.assertListEqual(
+            dataset.values("int"),
+            [-i for i in range(10)] + list(range(10, 50)),
+        )
+
+    @drop_datasets
+    def test_save_context(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(10)]
+        )
+
+        with dataset.save_context(batch_size=100) as context:
+            for sample in dataset:
+                sample["tags"] = ["saved"]
+                context.save(sample)
+
+                # Saving the same sample twice flushes the pending batch
+                sample["tags"].append("twice")
+                context.save(sample)
+
+        self.assertEqual(
+            dataset.count_sample_tags(), {"saved": 10, "twice": 10}
+        )
+
+        other = fo.Dataset()
+        other.add_sample(fo.Sample(filepath="other.jpg"))
+
+        with dataset.save_context() as context:
+            with self.assertRaises(ValueError):
+                context.save(other.first())
+
     @drop_datasets
     def test_merge_samples1(self):
         # Windows compatibility
@@ -1032,6 +1083,85 @@ class DatasetTests(unittest.TestCase):
             )
 
 
+class DatasetSummaryStatsTests(unittest.TestCase):
+    def _make_sample(self, label, confidence, tags=None):
+        return fo.Sample(
+            filepath="image.png",
+            tags=tags or [],
+            ground_truth=fo.Detections(
+                detections=[fo.Detection(label=label, confidence=confidence),]
+            ),
+        )
+
+    def _assert_summary_stats(self, dataset):
+        aggregations = fost.DatasetStatistics(dataset).aggregations
+        expected = dataset.aggregate(aggregations)
+        actual = dataset._summary_stats.get_results(aggregations)
+        self.assertListEqual(actual, expected)
+
+    def _num_dirty(self, dataset):
+        coll = dataset._summary_stats._collection
+        return coll.count_documents({"dirty": True})
+
+    @drop_datasets
+    def test_summary_stats(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                self._make_sample("cat", 0.9, tags=["train"]),
+                self._make_sample("dog", 0.4),
+            ]
+        )
+
+        self.assertFalse(dataset.has_summary_stats)
+
+        dataset.create_summary_stats()
+
+        self.assertTrue(dataset.has_summary_stats)
+        self.assertEqual(self._num_dirty(dataset), 0)
+        self._assert_summary_stats(dataset)
+
+        # Additions are merged, except for the truncated value counts of
+        # fields other than labels and tags
+        dataset.add_sample(self._make_sample("cat", 0.2, tags=["test"]))
+        coll = dataset._summary_stats._collection
+        self.assertListEqual(
+            sorted(d["_id"] for d in coll.find({"dirty": True})),
+            ["CountValues:filepath", "CountValues:id"],
+        )
+        self._assert_summary_stats(dataset)
+        self.assertEqual(self._num_dirty(dataset), 0)
+
+        # Deletions are merged, except for bounds
+        dataset.delete_samples(dataset.match_tags("train"))
+        self.assertGreater(self._num_dirty(dataset), 0)
+        self._assert_summary_stats(dataset)
+        self.assertEqual(self._num_dirty(dataset), 0)
+
+        # Edits only invalidate the results of the modified field
+        dataset.untag_samples("test")
+        num_dirty = self._num_dirty(dataset)
+        self.assertGreater(num_dirty, 0)
+        self.assertLess(num_dirty, coll.count_documents({}))
+        self._assert_summary_stats(dataset)
+
+        dataset.set_values(
+            "ground_truth.detections.label", [["bird"], ["fish"]]
+        )
+        self._assert_summary_stats(dataset)
+
+        sample = dataset.first()
+        sample.ground_truth.detections[0].confidence = 0.5
+        sample.save()
+        dirty = [d["_id"] for d in coll.find({"dirty": True})]
+        self.assertGreater(len(dirty), 0)
+        self.assertTrue(all("ground_truth" in key for key in dirty))
+        self._assert_summary_stats(dataset)
+
+        dataset.delete_summary_stats()
+        self.assertFalse(dataset.has_summary_stats)
+
+
 class DatasetDeletionTests(unittest.TestCase):
     @drop_datasets
     def setUp(self):
@@ -11,6 +11,8 @@ import warnings
 import numpy as np
 
 import fiftyone as fo
+from fiftyone import ViewField as F
+import fiftyone.utils.eval.utils as foeu
 
 from decorators import drop_datasets
 
@@ -579,6 +581,33 @@ class VideoClassificationTests(unittest.TestCase):
 
 
 class DetectionsTests(unittest.TestCase):
+    def test_compute_ious(self):
+        preds = [
+            fo.Detection(bounding_box=[0.1, 0.1, 0.4, 0.4]),
+            fo.Detection(bounding_box=[0.6, 0.6, 0.2, 0.2]),
+        ]
+        gts = [
+            fo.Detection(bounding_box=[0.1, 0.1, 0.4, 0.4]),
+            fo.Detection(bounding_box=[0.3, 0.3, 0.4, 0.4]),
+            fo.Detection(bounding_box=[0.0, 0.0, 1.0, 1.0], iscrowd=1),
+        ]
+
+        iscrowd = foeu.make_iscrowd_fcn("iscrowd")
+
+        ious = foeu.compute_ious(preds, gts, iscrowd=iscrowd)
+
+        expected = np.array([[1.0, 0.04 / 0.28, 1.0], [0.0, 0.01 / 0.19, 1.0]])
+        np.testing.assert_allclose(ious, expected)
+
+        batch_ious = foeu.compute_batch_bbox_ious(
+            [preds, preds[:1], []], [gts, [], gts[:1]], iscrowd=iscrowd
+        )
+
+        self.assertEqual(len(batch_ious), 3)
+        np.testing.assert_allclose(batch_ious[0], expected)
+        self.assertEqual(batch_ious[1].shape, (1, 0))
+        self.assertEqual(batch_ious[2].shape, (0, 1))
+
     def _make_detections_dataset(self):
         dataset = fo.Dataset()
 
@@ -1090,6 +1119,59 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_coco(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_coco_filtered(self):
+        dataset = self._make_detections_dataset()
+
+        sample = dataset.match(F("filepath").ends_with("image4.jpg")).first()
+        sample.predictions.detections.append(
+            fo.Detection(
+                label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4], confidence=0.1,
+            )
+        )
+        sample.save()
+
+        _, pred_eval_field = dataset._get_label_field_path(
+            "predictions", "eval"
+        )
+
+        view = dataset.filter_labels(
+            "predictions", F("confidence") > 0.5, only_matches=False
+        )
+        view.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval"
+        )
+
+        # Only the objects in the view are updated
+        self.assertListEqual(
+            dataset.values(pred_eval_field),
+            [None, None, ["fp"], ["tp", None], ["fp"]],
+        )
+        self.assertListEqual(dataset.values("eval_tp"), [0, 0, 0, 1, 0])
+        self.assertListEqual(dataset.values("eval_fp"), [0, 0, 1, 0, 1])
+        self.assertListEqual(dataset.values("eval_fn"), [0, 1, 0, 0, 1])
+
+    @drop_datasets
+    def test_evaluate_detections_coco_patches(self):
+        dataset = self._make_detections_dataset()
+
+        dataset.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval"
+        )
+        patches = dataset.to_evaluation_patches("eval")
+        patches.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval2"
+        )
+
+        # Results are synced to the source dataset
+        _, pred_eval_field = dataset._get_label_field_path(
+            "predictions", "eval2"
+        )
+        self.assertListEqual(
+            dataset.values(pred_eval_field),
+            [None, None, ["fp"], ["tp"], ["fp"]],
+        )
+
     @drop_datasets
     def test_evaluate_instances_coco(self):
         dataset = self._make_instances_dataset()
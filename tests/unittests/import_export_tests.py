@@ -255,6 +255,27 @@ class UnlabeledImageDatasetTests(ImageDatasetTests):
 
         self.assertEqual(len(dataset), len(dataset2))
 
+    @drop_datasets
+    def test_compute_metadata(self):
+        dataset = self._make_dataset()
+        dataset.add_sample(fo.Sample(filepath="/non/existent.jpg"))
+
+        dataset.compute_metadata(num_workers=2)
+
+        self.assertEqual(len(dataset.exists("metadata")), 5)
+        self.assertListEqual(
+            dataset.exists("metadata").distinct("metadata.width"), [640]
+        )
+        self.assertListEqual(
+            dataset.exists("metadata").distinct("metadata.height"), [480]
+        )
+        self.assertListEqual(
+            dataset.exists("metadata").distinct("metadata.num_channels"), [3]
+        )
+
+        with self.assertRaises(ValueError):
+            dataset.compute_metadata(skip_failures=False)
+
 
 class ImageClassificationDatasetTests(ImageDatasetTests):
     def _make_dataset(self):
@@ -0,0 +1,377 @@
+"""
+FiftyOne model inference unit tests.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import unittest
+
+import numpy as np
+
+import eta.core.image as etai
+import eta.core.utils as etau
+import eta.core.video as etav
+
+import fiftyone as fo
+import fiftyone.core.models as fom
+
+from decorators import drop_datasets
+
+
+class _BrightnessModel(fom.Model, fom.EmbeddingsMixin):
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+
+    @property
+    def media_type(self):
+        return "image"
+
+    @property
+    def ragged_batches(self):
+        return False
+
+    @property
+    def transforms(self):
+        return None
+
+    @property
+    def preprocess(self):
+        return True
+
+    @preprocess.setter
+    def preprocess(self, value):
+        pass
+
+    def predict(self, img):
+        brightness = int(img.mean())
+        if brightness == self.fail_on:
+            raise ValueError("Failed to predict")
+
+        return fo.Classification(label=str(brightness))
+
+    def predict_all(self, imgs):
+        return [self.predict(img) for img in imgs]
+
+    @property
+    def has_embeddings(self):
+        return True
+
+    def embed(self, img):
+        return np.array([[img.mean()]])
+
+    def embed_all(self, imgs):
+        return np.concatenate([self.embed(img) for img in imgs])
+
+
+class ApplyModelTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = etau.TempDir()
+        tmp_dir = temp_dir.__enter__()
+
+        filepaths = []
+        for value in range(0, 100, 10):
+            filepath = os.path.join(tmp_dir, "%d.png" % value)
+            img = np.full((8, 8, 3), value, dtype=np.uint8)
+            etai.write(img, filepath)
+            filepaths.append(filepath)
+
+        self._temp_dir = temp_dir
+        self.filepaths = filepaths
+
+    def tearDown(self):
+        self._temp_dir.__exit__()
+
+    def _make_dataset(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath=filepath) for filepath in self.filepaths]
+            + [fo.Sample(filepath="missing.png")]
+        )
+        return dataset
+
+    @drop_datasets
+    def test_apply_model(self):
+        dataset = self._make_dataset()
+        expected = [str(v) for v in range(0, 100, 10)] + [None]
+
+        model = _BrightnessModel()
+
+        dataset.apply_model(model, "single", num_workers=2)
+        self.assertListEqual(dataset.values("single.label"), expected)
+
+        dataset.apply_model(model, "batch", batch_size=3, num_workers=2)
+        self.assertListEqual(dataset.values("batch.label"), expected)
+
+        model = _BrightnessModel(fail_on=40)
+
+        dataset.apply_model(model, "partial")
+        expected[4] = None
+        self.assertListEqual(dataset.values("partial.label"), expected)
+
+        with self.assertRaises(ValueError):
+            dataset.apply_model(model, "fail", skip_failures=False)
+
+    @drop_datasets
+    def test_apply_model_projection(self):
+        dataset = self._make_dataset()
+        dataset.set_values("other", list(range(len(dataset))))
+        view = dataset.exclude_fields("other")
+
+        view.apply_model(_BrightnessModel(), "predictions", batch_size=4)
+
+        self.assertListEqual(
+            dataset.values("other"), list(range(len(dataset)))
+        )
+        self.assertEqual(dataset.count("predictions"), len(dataset) - 1)
+
+    @drop_datasets
+    def test_compute_embeddings(self):
+        dataset = self._make_dataset()
+        values = [float(v) for v in range(0, 100, 10)]
+
+        model = _BrightnessModel()
+
+        embeddings = dataset.compute_embeddings(model, batch_size=3)
+        self.assertListEqual(
+            [e[0] if e is not None else None for e in embeddings],
+            values + [None],
+        )
+
+        dataset.compute_embeddings(model, embeddings_field="embeddings")
+        self.assertListEqual(
+            [
+                e[0] if e is not None else None
+                for e in dataset.values("embeddings")
+            ],
+            values + [None],
+        )
+
+    @drop_datasets
+    def test_compute_embeddings_store(self):
+        dataset = self._make_dataset()
+        values = [float(v) for v in range(0, 100, 10)]
+
+        model = _BrightnessModel()
+
+        view = dataset.limit(len(values))
+        view.compute_embeddings(
+            model, batch_size=3, embeddings_store="brightness"
+        )
+        self.assertListEqual(dataset.list_embeddings_stores(), ["brightness"])
+
+        embeddings = view.load_embeddings("brightness")
+        self.assertIsInstance(embeddings, np.memmap)
+        self.assertListEqual(list(embeddings[:, 0]), values)
+
+        embeddings = view.sort_by("filepath", reverse=True).load_embeddings(
+            "brightness"
+        )
+        self.assertListEqual(list(embeddings[:, 0]), values[::-1])
+
+        # The missing image has no embedding
+        with self.assertRaises(ValueError):
+            dataset.load_embeddings("brightness")
+
+        store = dataset.get_embeddings_store("brightness")
+        store_dir = store.store_dir
+        self.assertTrue(os.path.isdir(store_dir))
+
+        dataset.delete_embeddings_store("brightness")
+        self.assertListEqual(dataset.list_embeddings_stores(), [])
+        self.assertFalse(os.path.isdir(store_dir))
+
+    @drop_datasets
+    def test_compute_patch_embeddings(self):
+        dataset = self._make_dataset()
+
+        num_patches = []
+        for idx, sample in enumerate(dataset):
+            num_patches.append(idx % 3)
+            sample["patches"] = fo.Detections(
+                detections=[
+                    fo.Detection(bounding_box=[0, 0, 0.5, 0.5])
+                    for _ in range(idx % 3)
+                ]
+            )
+            sample.save()
+
+        values = [float(v) for v in range(0, 100, 10)] + [None]
+
+        model = _BrightnessModel()
+
+        embeddings = dataset.compute_patch_embeddings(
+            model, "patches", batch_size=2
+        )
+        embeddings = [embeddings[_id] for _id in dataset.values("id")]
+
+        dataset.compute_patch_embeddings(
+            model, "patches", embeddings_field="patch_embeddings"
+        )
+
+        for e in (embeddings, dataset.values("patch_embeddings")):
+            for embedding, value, count in zip(e, values, num_patches):
+                if value is None or count == 0:
+                    self.assertIsNone(embedding)
+                else:
+                    self.assertEqual(embedding.shape, (count, 1))
+                    self.assertTrue((embedding == value).all())
+
+
+class ApplyModelToFramesTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = etau.TempDir()
+        tmp_dir = temp_dir.__enter__()
+
+        filepaths = []
+        for idx, num_frames in enumerate((5, 3)):
+            filepath = os.path.join(tmp_dir, "video%d.mp4" % idx)
+            with etav.FFmpegVideoWriter(filepath, 30, (16, 16)) as writer:
+                for _ in range(num_frames):
+                    writer.write(np.zeros((16, 16, 3), dtype=np.uint8))
+
+            filepaths.append(filepath)
+
+        self._temp_dir = temp_dir
+        self.filepaths = filepaths
+
+    def tearDown(self):
+        self._temp_dir.__exit__()
+
+    def _make_dataset(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath=filepath,
+                    metadata=fo.VideoMetadata(
+                        frame_rate=30, total_frame_count=num_frames
+                    ),
+                )
+                for filepath, num_frames in zip(self.filepaths, (5, 3))
+            ]
+        )
+        return dataset
+
+    def test_parse_frame_stride(self):
+        self.assertIsNone(fom._parse_frame_stride(None, None))
+        self.assertIsNone(fom._parse_frame_stride(1, None))
+
+        get_stride = fom._parse_frame_stride(5, None)
+        self.assertEqual(get_stride(30), 5)
+        self.assertEqual(get_stride(None), 5)
+
+        get_stride = fom._parse_frame_stride(None, 10)
+        self.assertEqual(get_stride(30), 3)
+        self.assertEqual(get_stride(25), 3)
+        self.assertEqual(get_stride(5), 1)
+        self.assertEqual(get_stride(None), 1)
+
+        get_stride = fom._parse_frame_stride(4, 10)
+        self.assertEqual(get_stride(30), 4)
+        self.assertEqual(get_stride(60), 6)
+
+    @drop_datasets
+    def test_get_frame_sampling(self):
+        dataset = self._make_dataset()
+        sample_id1, sample_id2 = dataset.values("id")
+
+        videos, total_frame_count = fom._get_frame_sampling(dataset, None)
+        self.assertTupleEqual(videos[sample_id1][1:], (None, 1))
+        self.assertTupleEqual(videos[sample_id2][1:], (None, 1))
+        self.assertEqual(total_frame_count, 8)
+
+        get_stride = fom._parse_frame_stride(2, None)
+        videos, total_frame_count = fom._get_frame_sampling(
+            dataset, get_stride
+        )
+        self.assertTupleEqual(videos[sample_id1][1:], ([1, 3, 5], 1))
+        self.assertTupleEqual(videos[sample_id2][1:], ([1, 3], 1))
+        self.assertEqual(total_frame_count, 5)
+
+        # Videos whose frame counts are unknown are strided while reading
+        sample = dataset[self.filepaths[1]]
+        sample.metadata = fo.VideoMetadata(frame_rate=30)
+        sample.save()
+
+        videos, _ = fom._get_frame_sampling(dataset, get_stride)
+        self.assertTupleEqual(videos[sample_id2][1:], (None, 2))
+
+    @drop_datasets
+    def test_iter_frame_batches(self):
+        dataset = self._make_dataset()
+        sample_id1, sample_id2 = dataset.values("id")
+
+        videos, _ = fom._get_frame_sampling(dataset, None)
+        batches = list(fom._iter_frame_batches(videos, 3, 1))
+
+        # Frames of different videos are packed into full batches, followed
+        # by a final partial batch
+        self.assertListEqual([len(imgs) for _, imgs, _ in batches], [3, 3, 2])
+        self.assertListEqual(
+            [refs for refs, _, _ in batches],
+            [
+                [(sample_id1, 1), (sample_id1, 2), (sample_id1, 3)],
+                [(sample_id1, 4), (sample_id1, 5), (sample_id2, 1)],
+                [(sample_id2, 2), (sample_id2, 3)],
+            ],
+        )
+        self.assertTrue(all(not errors for _, _, errors in batches))
+
+        videos[sample_id2] = (self.filepaths[1], None, 2)
+        batches = list(fom._iter_frame_batches(videos, 4, 2))
+        refs = sorted(ref for refs, _, _ in batches for ref in refs)
+        expected = sorted(
+            [(sample_id1, fn) for fn in range(1, 6)]
+            + [(sample_id2, 1), (sample_id2, 3)]
+        )
+        self.assertListEqual(refs, expected)
+
+    @drop_datasets
+    def test_frame_labels_writer(self):
+        dataset = self._make_dataset()
+        sample = dataset.first()
+        sample.frames[1] = fo.Frame(other=1)
+        sample.save()
+
+        with fom._FrameLabelsWriter(dataset, "predictions", 0.5, True) as w:
+            w.write(
+                "video0.mp4",
+                [(sample.id, 1), (sample.id, 2)],
+                [
+                    fo.Classification(label="a", confidence=0.9),
+                    fo.Classification(label="b", confidence=0.1),
+                ],
+            )
+            w.write(
+                "video0.mp4",
+                [(sample.id, 3)],
+                [fo.Classification(label="c", confidence=0.9)],
+            )
+
+        self.assertListEqual(w.errors, [])
+
+        sample.reload()
+        self.assertListEqual(list(sample.frames.keys()), [1, 3])
+        self.assertEqual(sample.frames[1]["other"], 1)
+        self.assertEqual(sample.frames[1]["predictions"].label, "a")
+        self.assertEqual(sample.frames[3]["predictions"].label, "c")
+
+    @drop_datasets
+    def test_apply_model_frame_stride(self):
+        dataset = self._make_dataset()
+
+        dataset.apply_model(
+            _BrightnessModel(), "predictions", batch_size=2, frame_stride=2
+        )
+
+        self.assertListEqual(
+            dataset.values("frames.frame_number"), [[1, 3, 5], [1, 3]]
+        )
+        self.assertEqual(dataset.count("frames.predictions"), 5)
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
@@ -72,6 +72,79 @@ class DatasetViewTests(unittest.TestCase):
         for sample in view.match({"labels.label": "label1"}):
             self.assertEqual(sample.labels.label, "label1")
 
+    @drop_datasets
+    def test_compiled_pipeline(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    labels=fo.Classification(label=str(i % 2)),
+                )
+                for i in range(4)
+            ]
+        )
+
+        view = dataset.filter_labels(
+            "labels", F("label") == "0"
+        ).select_fields("labels")
+
+        pipeline = view._compile_pipeline()
+        self.assertIs(view._compile_pipeline(), pipeline)
+        self.assertEqual(view._pipeline(), view._pipeline())
+        self.assertEqual(len(view), 2)
+
+        # Adding a field invalidates the compiled pipeline
+        dataset.add_sample_field("other", fo.StringField)
+        self.assertIsNot(view._compile_pipeline(), pipeline)
+        self.assertEqual(len(view), 2)
+
+        # Views derived from a compiled view compile their own pipelines
+        limit_view = view.limit(1)
+        self.assertEqual(
+            len(limit_view._compile_pipeline()), len(pipeline) + 1
+        )
+        self.assertEqual(len(limit_view), 1)
+
+    @drop_datasets
+    def test_cached_len(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, value=i) for i in range(4)]
+        )
+
+        view = dataset.match(F("value") >= 2)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(len(dataset), 4)
+
+        # Cached lengths are invalidated when samples are edited
+        sample = dataset.first()
+        sample["value"] = 5
+        sample.save()
+        self.assertEqual(len(view), 3)
+
+        view.set_values("value", [0, 0, 0])
+        self.assertEqual(len(view), 0)
+
+        # ...added
+        dataset.add_sample(fo.Sample(filepath="image4.jpg", value=4))
+        self.assertEqual(len(view), 1)
+        self.assertEqual(len(dataset), 5)
+
+        # ...or deleted
+        dataset.delete_samples(view)
+        self.assertEqual(len(view), 0)
+        self.assertEqual(len(dataset), 4)
+
+        for sample in dataset.iter_samples(autosave=True):
+            sample["value"] = 2
+
+        self.assertEqual(len(view), 4)
+
+        dataset.clear()
+        self.assertEqual(len(view), 0)
+        self.assertEqual(len(dataset), 0)
+
     @drop_datasets
     def test_sample_view_with_filtered_fields(self):
         dataset = fo.Dataset()
@@ -853,6 +926,71 @@ class SetValuesTests(unittest.TestCase):
             _dataset_labels, [[], ["0"], ["0", "ONE"], ["0", "ONE", "2"]],
         )
 
+    def test_set_values_numpy(self):
+        self.dataset.set_values(
+            "float_field", np.arange(4, dtype=np.float32) / 2
+        )
+        self.assertListEqual(
+            self.dataset.values("float_field"), [0.0, 0.5, 1.0, 1.5]
+        )
+        self.assertIsInstance(
+            self.dataset.get_field_schema()["float_field"], fo.FloatField
+        )
+
+        self.dataset.set_values("int_field", np.array([4, 3, 2, 1]))
+        self.assertListEqual(self.dataset.values("int_field"), [4, 3, 2, 1])
+
+        embeddings = np.random.rand(4, 4)
+        self.dataset.set_values("emb", embeddings)
+        self.assertIsInstance(
+            self.dataset.get_field_schema()["emb"], fo.VectorField
+        )
+        self.assertTrue(
+            np.array_equal(np.stack(self.dataset.values("emb")), embeddings)
+        )
+
+    def test_set_values_dict(self):
+        sample_ids = self.dataset.values("id")
+
+        values = {sample_ids[1]: np.float64(1.5), sample_ids[3]: 3.5}
+        self.dataset.set_values("float_field", values)
+        self.assertListEqual(
+            self.dataset.values("float_field"), [None, 1.5, None, 3.5]
+        )
+
+        # IDs that are not in the view are ignored
+        view = self.dataset.match(F("int_field") > 2)
+        values = {_id: i for i, _id in enumerate(sample_ids)}
+        view.set_values("int_field", values)
+        self.assertListEqual(self.dataset.values("int_field"), [1, 2, 2, 3])
+
+        # Arrays are stored in vector fields, as they are when given as a list
+        values = {_id: np.full(2, i) for i, _id in enumerate(sample_ids)}
+        self.dataset.set_values("vector_field", values)
+        self.dataset.set_values("vector_field2", list(values.values()))
+
+        schema = self.dataset.get_field_schema()
+        self.assertIsInstance(schema["vector_field"], fo.VectorField)
+        self.assertIsInstance(schema["vector_field2"], fo.VectorField)
+        self.assertListEqual(
+            [v.tolist() for v in self.dataset.values("vector_field")],
+            [[0, 0], [1, 1], [2, 2], [3, 3]],
+        )
+
+    def test_set_values_merge(self):
+        sample_ids = self.dataset.values("_id")
+
+        self.dataset.add_sample_field("str_field", fo.StringField)
+        self.dataset._merge_values("str_field", sample_ids[:2], ["a", "b"])
+        self.dataset._merge_values("int_field", sample_ids[2:], [None, 10])
+
+        self.assertListEqual(
+            self.dataset.values("str_field"), ["a", "b", None, None]
+        )
+        self.assertListEqual(
+            self.dataset.values("int_field"), [1, 2, None, 10]
+        )
+
 
 class ViewStageTests(unittest.TestCase):
     @drop_datasets